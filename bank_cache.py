@@ -0,0 +1,112 @@
+import hashlib
+import marshal
+import os
+
+CACHE_FORMAT_VERSION = 3  # Bump whenever the shape of the cached records changes
+CACHE_FILE_EXTENSION = ".qbc"
+DEFAULT_CACHE_DIR = "bank_cache"
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def file_digest(file_path):
+    """Returns the SHA-1 hex digest of a file's contents, read in 1 MB chunks."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BankCache:
+    """
+    Compiled snapshots of parsed question banks, one marshal file per bank. A snapshot is what
+    question_bank.parse_bank returns: the question records plus the block digests of the bank.
+
+    A snapshot is reused while the bank's size and mtime are unchanged. If only the mtime moved
+    (the file was touched or re-saved as is), the content hash decides. Snapshots that haven't
+    been used for the longest time are evicted once the cache grows past max_bytes.
+
+    kind keeps other data about a bank, such as the offset index of a memory-mapped bank, in an
+    entry of its own under the same checks.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, file_path, kind=''):
+        name = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        if kind:
+            name += '.' + kind
+        return os.path.join(self.cache_dir, name + CACHE_FILE_EXTENSION)
+
+    def load(self, file_path, kind=''):
+        """Returns the cached snapshot for file_path, or None if there is no valid one."""
+        entry_path = self._entry_path(file_path, kind)
+        try:
+            source_stat = os.stat(file_path)
+            with open(entry_path, 'rb') as f:
+                version, size, mtime_ns, digest, records = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if version != CACHE_FORMAT_VERSION or size != source_stat.st_size:
+            return None
+
+        try:
+            if mtime_ns != source_stat.st_mtime_ns:
+                if file_digest(file_path) != digest:
+                    return None
+                # Same content under a new mtime: refresh the stamp so the next load skips hashing
+                self._write_entry(entry_path, (version, size, source_stat.st_mtime_ns, digest, records))
+            else:
+                os.utime(entry_path)  # Marks the snapshot as recently used for LRU eviction
+        except OSError as e:
+            print(f"Warning: Could not update bank cache entry: {e}")
+        return records
+
+    def store(self, file_path, records, source_stat=None, kind=''):
+        """
+        Saves records, a parse_bank result, as the snapshot for file_path.
+
+        Pass the os.stat() taken before parsing as source_stat, so a bank edited while it was
+        being parsed is not cached under its new stamp.
+        """
+        try:
+            current_stat = os.stat(file_path)
+            if source_stat is None:
+                source_stat = current_stat
+            elif (current_stat.st_size, current_stat.st_mtime_ns) != (source_stat.st_size, source_stat.st_mtime_ns):
+                return  # The bank changed while it was being parsed
+            entry = (CACHE_FORMAT_VERSION, source_stat.st_size, source_stat.st_mtime_ns,
+                     file_digest(file_path), records)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._write_entry(self._entry_path(file_path, kind), entry)
+            self.evict()
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not write bank cache: {e}")
+
+    def _write_entry(self, entry_path, entry):
+        temp_path = entry_path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(marshal.dumps(entry))
+        os.replace(temp_path, entry_path)
+
+    def evict(self):
+        """Deletes least recently used snapshots until the cache fits in max_bytes."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(CACHE_FILE_EXTENSION):
+                    entry_stat = dir_entry.stat()
+                    entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, dir_entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total_bytes -= size
+            except OSError:
+                pass
@@ -0,0 +1,62 @@
+"""
+Benchmark for loading many bank files: serial parsing against the process pool used by
+BankLoader._read_banks.
+
+Writes num_files synthetic banks to a temporary folder, then parses them one after another and
+with one worker per CPU. Expect the speed-up to approach the number of physical cores.
+
+Run from the repository root: python benchmarks/bench_multi_bank_loading.py [num_files] [questions_per_file]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import parse_bank  # noqa: E402
+
+NUM_FILES = 30
+QUESTIONS_PER_FILE = 3000
+
+
+def write_synthetic_bank(file_path, num_questions, seed):
+    rng = random.Random(seed)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for n in range(1, num_questions + 1):
+            f.write(f"{n}. Synthetic question {n} from bank {seed}?\n")
+            for i in range(rng.randint(6, 10)):
+                mark = 'y' if rng.random() < 0.4 else 'x'
+                f.write(f"{'abcdefghij'[i]}. [{mark}] Synthetic option {i} for question {n}\n")
+            f.write("\n")
+
+
+def main():
+    num_files = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_FILES
+    questions_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else QUESTIONS_PER_FILE
+
+    with tempfile.TemporaryDirectory() as folder:
+        file_paths = [os.path.join(folder, f"bank_{i:02d}.txt") for i in range(num_files)]
+        for i, file_path in enumerate(file_paths):
+            write_synthetic_bank(file_path, questions_per_file, i)
+
+        start = time.perf_counter()
+        serial_count = sum(len(parse_bank(file_path)[0]) for file_path in file_paths)
+        serial_seconds = time.perf_counter() - start
+
+        workers = min(num_files, os.cpu_count() or 1)
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pool_count = sum(len(snapshot[0]) for snapshot in pool.map(parse_bank, file_paths))
+        pool_seconds = time.perf_counter() - start
+
+    assert serial_count == pool_count
+    print(f"{num_files} files x {questions_per_file} questions ({serial_count} total)")
+    print(f"  serial        {serial_seconds:7.2f} s")
+    print(f"  pool ({workers:2d} cpu) {pool_seconds:7.2f} s  ({serial_seconds / pool_seconds:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
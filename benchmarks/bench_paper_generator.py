@@ -0,0 +1,71 @@
+"""
+Benchmark for paper_generator: K variants of N questions generated in one vectorized batch,
+against building the same papers one at a time with the random module.
+
+Run from the repository root: python benchmarks/bench_paper_generator.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import Question  # noqa: E402
+from paper_generator import PaperGenerator  # noqa: E402
+
+BANK_SIZE = 20000
+VARIANTS = 10000
+QUESTIONS = 60
+LOOP_VARIANTS = 1000  # The per-paper loop is timed on fewer variants and scaled up
+
+
+def synthetic_bank(size, seed=0):
+    rng = random.Random(seed)
+    bank = []
+    for n in range(1, size + 1):
+        num_options = rng.randint(5, 10)
+        correct = rng.sample(range(num_options), rng.randint(1, 4))
+        options = tuple(f"{chr(ord('a') + i)}. Option {i}" for i in range(num_options))
+        bank.append(Question(f"{n}. Question {n}", options, sum(1 << i for i in correct)))
+    return bank
+
+
+def loop_paper(questions, num, rng):
+    """One paper built item by item, with the same CS/CM rules as PaperGenerator."""
+    paper = []
+    for q in rng.sample(questions, num):
+        correct, incorrect = list(q.correct_options), list(q.incorrect_options)
+        cs_ok = correct and len(incorrect) >= 4
+        cm_low, cm_high = max(2, 5 - len(incorrect)), min(4, len(correct))
+        is_cm = cm_low <= cm_high and (not cs_ok or rng.random() < 0.5)
+        n_correct = rng.randint(cm_low, cm_high) if is_cm else 1
+        chosen = rng.sample(correct, n_correct) + rng.sample(incorrect, 5 - n_correct)
+        rng.shuffle(chosen)
+        paper.append((q, is_cm, chosen))
+    return paper
+
+
+def main():
+    bank = synthetic_bank(BANK_SIZE)
+    print(f"bank of {BANK_SIZE}, {VARIANTS} variants of {QUESTIONS} questions")
+
+    start = time.perf_counter()
+    generator = PaperGenerator(bank)
+    setup_s = time.perf_counter() - start
+    start = time.perf_counter()
+    generator.generate(VARIANTS, QUESTIONS, seed=1)
+    batch_s = time.perf_counter() - start
+    print(f"  vectorized batch: {batch_s:6.2f} s (+ {setup_s:.2f} s one-off bank arrays)")
+
+    ready = [bank[i] for i in generator.quiz_ready]
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(LOOP_VARIANTS):
+        loop_paper(ready, QUESTIONS, rng)
+    loop_s = (time.perf_counter() - start) * VARIANTS / LOOP_VARIANTS
+    print(f"  per-paper loop:   {loop_s:6.2f} s (scaled from {LOOP_VARIANTS} variants)")
+
+
+if __name__ == '__main__':
+    main()
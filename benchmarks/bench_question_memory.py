@@ -0,0 +1,92 @@
+"""
+Memory benchmark: the compact Question (slots, option tuple, correctness bitmask, index array)
+against the old dict-based Question with (text, is_correct) option tuples.
+
+Builds a synthetic bank of 100k questions with 6-10 options each, gives every question a 5-option
+quiz selection, and reports the memory traced by tracemalloc for each representation.
+
+Run from the repository root: python benchmarks/bench_question_memory.py [num_questions]
+"""
+import os
+import random
+import sys
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import Question, OPTION_INDEX_TYPECODE  # noqa: E402
+
+NUM_QUESTIONS = 100_000
+OPTIONS_PER_QUIZ_ITEM = 5
+
+
+class LegacyQuestion:
+    def __init__(self, text, options):
+        self.text = text
+        self.options = options  # List of (full_option_text, is_correct_boolean)
+        self.shuffled_options = []  # List of (full_option_text, is_correct_boolean) - subset shown in quiz
+        self.type = None
+
+
+def synthetic_bank(num_questions, seed=0):
+    """Yields (question_text, option_texts, correct_flags) with the strings already built."""
+    rng = random.Random(seed)
+    for n in range(1, num_questions + 1):
+        num_options = rng.randint(6, 10)
+        option_texts = [f"{'abcdefghij'[i]}. Synthetic option {i} of question {n}" for i in range(num_options)]
+        yield f"{n}. Synthetic question number {n}?", option_texts, [rng.random() < 0.4 for _ in range(num_options)]
+
+
+def build_legacy(raw_bank, rng):
+    bank = []
+    for text, option_texts, correct_flags in raw_bank:
+        q = LegacyQuestion(text, list(zip(option_texts, correct_flags)))
+        q.shuffled_options = rng.sample(q.options, OPTIONS_PER_QUIZ_ITEM)
+        bank.append(q)
+    return bank
+
+
+def build_compact(raw_bank, rng):
+    bank = []
+    for text, option_texts, correct_flags in raw_bank:
+        correct_mask = 0
+        for i, is_correct in enumerate(correct_flags):
+            if is_correct:
+                correct_mask |= 1 << i
+        q = Question(text, tuple(option_texts), correct_mask)
+        q.shuffled_options = array(OPTION_INDEX_TYPECODE, rng.sample(range(len(option_texts)), OPTIONS_PER_QUIZ_ITEM))
+        bank.append(q)
+    return bank
+
+
+def measure(builder, raw_bank):
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    bank = builder(raw_bank, random.Random(1))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return bank, current - baseline, peak - baseline
+
+
+def main():
+    num_questions = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_QUESTIONS
+    # Strings are shared by both representations, so they are allocated before measuring
+    raw_bank = list(synthetic_bank(num_questions))
+
+    results = []
+    for name, builder in (("legacy", build_legacy), ("compact", build_compact)):
+        bank, current, peak = measure(builder, raw_bank)
+        results.append((name, current, peak))
+        del bank
+
+    print(f"{num_questions} questions, {OPTIONS_PER_QUIZ_ITEM} shuffled options each (strings excluded)")
+    for name, current, peak in results:
+        print(f"  {name:8s} {current / 2 ** 20:8.1f} MiB retained  {peak / 2 ** 20:8.1f} MiB peak  "
+              f"{current / num_questions:7.0f} B/question")
+    legacy_bytes, compact_bytes = results[0][1], results[1][1]
+    print(f"  compact uses {compact_bytes / legacy_bytes:.0%} of legacy memory")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark for the Pythonista quiz sampler: the old sample-then-skip loop from start_quiz against
+sample_quiz, which only draws from questions that can make a valid item.
+
+Builds synthetic banks where a growing share of questions is sparse (too few correct or
+incorrect options for one of the item types) and reports how many of the requested questions
+each approach delivers and how long building a quiz takes.
+
+Run inside Pythonista next to main_ios.py: python benchmarks/bench_quiz_sampler.py
+"""
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main_ios import Question, index_questions, sample_quiz  # noqa: E402
+
+BANK_SIZE = 5000
+QUIZ_SIZE = 50
+QUIZZES = 200
+SPARSE_SHARES = (0.0, 0.25, 0.5, 0.75)
+
+
+def synthetic_bank(size, sparse_share, rng):
+    bank = []
+    for n in range(1, size + 1):
+        num_options = rng.randint(5, 10)
+        if rng.random() < sparse_share:
+            # Only one item type (or none) is possible: a single correct option or almost all correct
+            num_correct = rng.choice([1, num_options - 1, num_options])
+        else:
+            num_correct = rng.randint(2, min(4, num_options - 3))
+        correct = rng.sample(range(num_options), num_correct)
+        correct_mask = sum(1 << i for i in correct)
+        bank.append(Question(n, f"Question {n}", tuple(f"Option {i}" for i in range(num_options)), correct_mask))
+    return bank
+
+
+def legacy_quiz(questions, num, rng):
+    """The start_quiz loop before sample_quiz: infeasible draws are skipped, not replaced."""
+    available = [q for q in questions if len(q.options) >= 5 and q.correct_mask]
+    quiz = []
+    for q in rng.sample(available, min(num, len(available))):
+        correct_options = q.correct_options
+        incorrect_options = q.incorrect_options
+        q.type = rng.choice(['CS', 'CM'])
+        if q.type == 'CS':
+            if correct_options and len(incorrect_options) >= 4:
+                shuffled = rng.sample(correct_options, 1) + rng.sample(incorrect_options, 4)
+            else:
+                continue
+        else:
+            max_correct_cm = min(4, len(correct_options))
+            if max_correct_cm < 2:
+                continue
+            n_correct = rng.randint(2, max_correct_cm)
+            if len(incorrect_options) < 5 - n_correct:
+                continue
+            shuffled = rng.sample(correct_options, n_correct) + rng.sample(incorrect_options, 5 - n_correct)
+        rng.shuffle(shuffled)
+        q.shuffled_options = array('H', shuffled)
+        quiz.append(q)
+    return quiz
+
+
+def main():
+    print(f"bank of {BANK_SIZE}, {QUIZZES} quizzes of {QUIZ_SIZE} questions each")
+    for sparse_share in SPARSE_SHARES:
+        rng = random.Random(0)
+        bank = synthetic_bank(BANK_SIZE, sparse_share, rng)
+
+        start = time.perf_counter()
+        legacy_sizes = [len(legacy_quiz(bank, QUIZ_SIZE, rng)) for _ in range(QUIZZES)]
+        legacy_ms = (time.perf_counter() - start) * 1000 / QUIZZES
+
+        start = time.perf_counter()
+        quiz_ready = index_questions(bank)
+        index_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        sampled_sizes = [len(sample_quiz(bank, quiz_ready, QUIZ_SIZE, rng)) for _ in range(QUIZZES)]
+        sampled_ms = (time.perf_counter() - start) * 1000 / QUIZZES
+
+        print(f"  {sparse_share:4.0%} sparse: legacy delivers {sum(legacy_sizes) / QUIZZES:5.1f} "
+              f"(min {min(legacy_sizes)}) in {legacy_ms:6.2f} ms | "
+              f"sample_quiz delivers {sum(sampled_sizes) / QUIZZES:5.1f} (min {min(sampled_sizes)}) "
+              f"in {sampled_ms:6.2f} ms + {index_ms:.1f} ms one-off index")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark for QuizApp.toggle_theme on a question with 10 long options.
+
+Opens the desktop app, starts a one-question quiz and times repeated theme toggles on the question
+screen (5 of the options shown) and on the review screen (all 10 listed), including the redraw.
+Toggling only recolors styles and the themed tk widgets, so no widgets should be created and the
+checkbox states must survive every toggle.
+
+Needs a display. Run from the repository root: python benchmarks/bench_theme_toggle.py [toggles]
+"""
+import os
+import statistics
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import QuizApp  # noqa: E402
+from question_bank import Question  # noqa: E402
+
+TOGGLES = 200
+NUM_OPTIONS = 10
+OPTION_WORDS = 40
+
+
+def long_question():
+    filler = " ".join(f"word{i}" for i in range(OPTION_WORDS))
+    options = tuple(f"{'abcdefghij'[i]}. Option {i}: {filler}" for i in range(NUM_OPTIONS))
+    return Question("1. Which of these long options are correct?", options, 0b0000011111)
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def time_toggles(app, toggles):
+    widgets_before = count_widgets(app.root)
+    timings = []
+    for _ in range(toggles):
+        start = time.perf_counter()
+        app.toggle_theme()
+        app.root.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, count_widgets(app.root) - widgets_before
+
+
+def report(name, timings, widgets_created):
+    timings = sorted(timings)
+    print(f"  {name:8s} mean {statistics.mean(timings):6.2f} ms  p95 {timings[int(len(timings) * 0.95)]:6.2f} ms  "
+          f"max {timings[-1]:6.2f} ms  widgets created {widgets_created}")
+
+
+def main():
+    toggles = int(sys.argv[1]) if len(sys.argv) > 1 else TOGGLES
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Error: This benchmark needs a display: {e}")
+        return 1
+
+    app = QuizApp(root)
+    app.questions = [long_question()]
+    app.num_questions_var.set(1)
+    app.start_quiz()
+    for i in (0, 2):
+        app.checkbuttons[i].invoke()
+    root.update()
+    selected = [var.get() for var in app.vars]
+
+    print(f"{toggles} theme toggles, {NUM_OPTIONS} options of {OPTION_WORDS} words")
+    report("question", *time_toggles(app, toggles))
+    assert [var.get() for var in app.vars] == selected, "Checkbox states were lost"
+
+    app.next_question()
+    app.review_question(0)
+    root.update()
+    report("review", *time_toggles(app, toggles))
+
+    app.stop_elapsed_timer()
+    app.writer.close()
+    root.destroy()  # Not on_closing, which would save the benchmark's window size
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+Item analysis over the quiz results history, for reviewing a question bank.
+
+For every question (bank file + original number) it computes:
+
+    p_value                 mean item score / 5, i.e. difficulty (1.0 = everyone got full marks)
+    full_correct            share of responses that scored 5
+    item_rest_r             Pearson correlation of the 0-5 item score with the rest of the attempt's score,
+                            i.e. item-rest discrimination (not point-biserial, as item scores are not 0/1)
+    distractor_efficiency   share of the question's shown distractors picked by at least
+                            FUNCTIONAL_DISTRACTOR_RATE of the responses that saw them
+
+Responses are loaded once into flat column arrays and every statistic is a grouped NumPy reduction,
+so 50k responses take well under a second.
+
+    python item_analysis.py --db results.db --bank cardio.txt --sort item_rest_r
+    python item_analysis.py --log results.cfg --out item_report.csv
+"""
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+
+import numpy as np
+
+MAX_ITEM_SCORE = 5
+FUNCTIONAL_DISTRACTOR_RATE = 0.05  # A distractor nobody picks does not help discriminate
+REPORT_COLUMNS = ("bank", "q_number", "responses", "p_value", "full_correct", "item_rest_r",
+                  "distractors", "functional_distractors", "distractor_efficiency")
+
+
+class ResponseTable:
+    """
+    One row per answered question, plus one row per shown option of those responses.
+
+    item[r]                  index into items, the (bank, q_number) of response r
+    score[r]                 points for the response
+    rest_score[r]            the attempt's percentage score without this item
+    option_item[o]           item of option row o
+    option_key[o]            identifies the option within its item
+    option_selected[o]       option o was selected
+    option_correct[o]        option o is a correct answer
+    """
+
+    def __init__(self):
+        self.items = []
+        self._item_codes = {}
+        self._option_codes = {}
+        self.item = []
+        self.score = []
+        self.rest_score = []
+        self.option_item = []
+        self.option_key = []
+        self.option_selected = []
+        self.option_correct = []
+
+    def item_code(self, bank, q_number):
+        key = (bank, q_number)
+        code = self._item_codes.get(key)
+        if code is None:
+            code = self._item_codes[key] = len(self.items)
+            self.items.append(key)
+        return code
+
+    def option_code(self, item, option):
+        key = (item, option)
+        code = self._option_codes.get(key)
+        if code is None:
+            code = self._option_codes[key] = len(self._option_codes)
+        return code
+
+    def add_response(self, item, score, attempt_score, attempt_total):
+        rest_total = attempt_total - MAX_ITEM_SCORE
+        self.item.append(item)
+        self.score.append(score)
+        self.rest_score.append((attempt_score - score) / rest_total if rest_total > 0 else np.nan)
+
+    def add_option(self, item, option, selected, correct):
+        self.option_item.append(item)
+        self.option_key.append(self.option_code(item, option))
+        self.option_selected.append(bool(selected))
+        self.option_correct.append(bool(correct))
+
+    def freeze(self):
+        """Turns the collected columns into arrays. Call once after loading."""
+        self.item = np.array(self.item, dtype=np.int32)
+        self.score = np.array(self.score, dtype=np.float64)
+        self.rest_score = np.array(self.rest_score, dtype=np.float64)
+        self.option_item = np.array(self.option_item, dtype=np.int32)
+        self.option_key = np.array(self.option_key, dtype=np.int64)
+        self.option_selected = np.array(self.option_selected, dtype=bool)
+        self.option_correct = np.array(self.option_correct, dtype=bool)
+        return self
+
+
+def load_from_db(db_path, bank=None):
+    """Reads responses from the katy app's results.db. Options are keyed by original position."""
+    query = ("SELECT r.bank, r.q_number, r.score, r.answer_mask, r.correct_mask, r.shown_options, a.score, "
+             "a.total_possible FROM responses r JOIN attempts a ON a.id = r.attempt_id")
+    params = ()
+    if bank:
+        query += " WHERE r.bank = ?"
+        params = (bank,)
+
+    table = ResponseTable()
+    connection = sqlite3.connect(db_path)
+    try:
+        for row_bank, q_number, score, answer, correct, shown, attempt_score, attempt_total in \
+                connection.execute(query, params):
+            item = table.item_code(row_bank, q_number)
+            table.add_response(item, score, attempt_score, attempt_total)
+            if shown:
+                for j, opt_index in enumerate(shown.split(',')):
+                    table.add_option(item, int(opt_index), (answer >> j) & 1, (correct >> j) & 1)
+    finally:
+        connection.close()
+    return table.freeze()
+
+
+def load_from_log(log_path, bank=None):
+    """
+    Reads responses from a results.cfg JSON array or a results.jsonl log, using the entries'
+    questions_breakdown. Options are keyed by their text. Entries in the seed-only format have no
+    breakdown; their responses are only in results.db. They are skipped with a warning, and a log with
+    nothing but seed-only entries is an error.
+    """
+    with open(log_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if text.lstrip().startswith('['):
+        entries = json.loads(text)
+    else:
+        entries = []
+        for line in text.splitlines():
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+
+    table = ResponseTable()
+    seed_only = 0
+    for entry in entries:
+        if not isinstance(entry, dict) or (bank and entry.get('quiz_file') != bank):
+            continue
+        if 'questions_breakdown' not in entry:
+            seed_only += 'seed' in entry
+            continue
+        for info in entry['questions_breakdown']:
+            item = table.item_code(entry.get('quiz_file'), info['original_q_number'])
+            table.add_response(item, info['score_for_this_question'], entry['score'], entry['total_possible'])
+            for (opt_text, is_correct), selected in zip(info['shuffled_options'], info['user_selection']):
+                table.add_option(item, opt_text, selected, is_correct)
+    if seed_only and not table.item:
+        raise ValueError(f"{log_path} only has seed-only entries, without questions_breakdown. Use --db instead.")
+    if seed_only:
+        print(f"Warning: Skipped {seed_only} seed-only entries of {log_path}; their responses are only in --db.",
+              file=sys.stderr)
+    return table.freeze()
+
+
+def _grouped_correlation(group, x, y, num_groups):
+    """Pearson correlation of x and y within each group, NaN where it is undefined."""
+    valid = ~(np.isnan(x) | np.isnan(y))
+    group, x, y = group[valid], x[valid], y[valid]
+
+    def sums(weights):
+        return np.bincount(group, weights=weights, minlength=num_groups)
+
+    n = sums(None)
+    sum_x, sum_y = sums(x), sums(y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sums(x * y) - sum_x * sum_y / n
+        var_x = sums(x * x) - sum_x * sum_x / n
+        var_y = sums(y * y) - sum_y * sum_y / n
+        return cov / np.sqrt(var_x * var_y)
+
+
+def analyze(table):
+    """Returns the report as a dict of column arrays, one entry per item."""
+    num_items = len(table.items)
+    responses = np.bincount(table.item, minlength=num_items)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_value = np.bincount(table.item, weights=table.score, minlength=num_items) / (responses * MAX_ITEM_SCORE)
+        full_correct = np.bincount(table.item, weights=table.score == MAX_ITEM_SCORE, minlength=num_items) / responses
+    item_rest_r = _grouped_correlation(table.item, table.score, table.rest_score, num_items)
+
+    # Distractors: incorrect options, counted once per option with how often they were shown and picked
+    is_distractor = ~table.option_correct
+    keys, first, inverse = np.unique(table.option_key[is_distractor], return_index=True, return_inverse=True)
+    shown = np.bincount(inverse, minlength=len(keys))
+    picked = np.bincount(inverse, weights=table.option_selected[is_distractor], minlength=len(keys))
+    distractor_item = table.option_item[is_distractor][first]
+    functional = picked / np.maximum(shown, 1) >= FUNCTIONAL_DISTRACTOR_RATE
+    distractors = np.bincount(distractor_item, minlength=num_items)
+    functional_distractors = np.bincount(distractor_item, weights=functional, minlength=num_items).astype(np.int64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distractor_efficiency = functional_distractors / distractors
+
+    return {
+        "bank": np.array([bank for bank, _ in table.items], dtype=object),
+        "q_number": np.array([q_number for _, q_number in table.items], dtype=np.int64),
+        "responses": responses,
+        "p_value": p_value,
+        "full_correct": full_correct,
+        "item_rest_r": item_rest_r,
+        "distractors": distractors,
+        "functional_distractors": functional_distractors,
+        "distractor_efficiency": distractor_efficiency,
+    }
+
+
+def sort_report(report, column, descending=False, min_responses=1):
+    """Row order for the report by one column, NaNs last, leaving out items with too few responses."""
+    rows = np.flatnonzero(report["responses"] >= min_responses)
+    values = report[column][rows]
+    if values.dtype == object:
+        order = sorted(range(len(rows)), key=lambda i: values[i], reverse=descending)
+        return rows[order]
+    values = values.astype(np.float64)
+    keys = np.where(np.isnan(values), np.inf, -values if descending else values)
+    return rows[np.argsort(keys, kind='stable')]
+
+
+def format_value(value):
+    if isinstance(value, float) or isinstance(value, np.floating):
+        return "" if np.isnan(value) else f"{value:.3f}"
+    return str(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Item difficulty, discrimination and distractor analysis.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--db", default="results.db", help="results.db written by the quiz app (default)")
+    source.add_argument("--log", help="results.cfg or results.jsonl with questions_breakdown entries")
+    parser.add_argument("--bank", help="Only analyze questions of this bank file name")
+    parser.add_argument("--sort", default="p_value", choices=REPORT_COLUMNS, help="Column to sort by")
+    parser.add_argument("--descending", action="store_true", help="Sort from highest to lowest")
+    parser.add_argument("--min-responses", type=int, default=1, help="Leave out items answered fewer times")
+    parser.add_argument("--out", help="Write the full report to this CSV file instead of printing it")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.log or args.db):
+        parser.error(f"{args.log or args.db} does not exist")  # sqlite3.connect would create an empty database
+    try:
+        table = load_from_log(args.log, args.bank) if args.log else load_from_db(args.db, args.bank)
+    except (OSError, ValueError, KeyError, sqlite3.Error) as e:
+        parser.error(f"Could not load results: {e}")
+
+    report = analyze(table)
+    rows = sort_report(report, args.sort, args.descending, args.min_responses)
+    if args.out:
+        with open(args.out, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(REPORT_COLUMNS)
+            for i in rows:
+                writer.writerow([format_value(report[column][i]) for column in REPORT_COLUMNS])
+        print(f"Analyzed {len(table.score)} responses to {len(rows)} items. Report written to {args.out}")
+    else:
+        print('\t'.join(REPORT_COLUMNS))
+        for i in rows:
+            print('\t'.join(format_value(report[column][i]) for column in REPORT_COLUMNS))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
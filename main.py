@@ -1,9 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import random
 import re
 import os
 import sys
+import multiprocessing
+import threading
+from array import array
+from bisect import bisect_right
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from bank_cache import BankCache
+from persistence import PersistenceWriter
+from question_bank import (OPTION_INDEX_TYPECODE, BankChangedError, BankWatcher, MappedQuestionBank, iter_bank_blocks,
+                           parse_bank, question_from_record, question_to_record)
 
 # === CONFIGURABLE UI CONSTANTS ===
 FONT_FAMILY = "Helvetica"
@@ -17,10 +28,19 @@ FONT_OPTION = (FONT_FAMILY, FONT_SIZE_OPTION)
 FONT_BUTTON = (FONT_FAMILY, FONT_SIZE_BUTTON)
 FONT_SMALL = (FONT_FAMILY, FONT_SIZE_SMALL)
 FONT_OPTION_BOLD = (FONT_FAMILY, FONT_SIZE_OPTION, "bold")
+FONT_BUTTON_BOLD = (FONT_FAMILY, FONT_SIZE_BUTTON, "bold")
+REVIEW_LIST_LINE_HEIGHT = 30  # Pixels per line of the review-all list; every line has the same height
+REVIEW_LIST_MARGIN = 10  # Pixels kept free right of review-all lines that are cut short with an ellipsis
 
 DEFAULT_MENU_SIZE = "500x300"
 DEFAULT_QUIZ_SIZE = "1500x600"
 WINDOW_SIZE_FILE = "window_size.cfg"
+BANK_CACHE_DIR = "bank_cache"
+BANK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+MAPPED_BANK_MIN_BYTES = 8 * 1024 * 1024  # Banks at least this big are memory-mapped instead of loaded
+MAPPED_INDEX_CACHE_KIND = 'index'  # BankCache entries holding the offsets of memory-mapped banks
+BANK_WATCH_INTERVAL_MS = 2000  # How often loaded bank files are checked for edits
+QUIZ_SEED_BITS = 32  # A quiz is rebuilt exactly from (bank, seed, number of questions)
 
 def resource_path(relative_path):
     try:
@@ -31,45 +51,323 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-class Question:
-    def __init__(self, text, options):
-        self.text = text
-        self.options = options  # List of (full_option_text, is_correct_boolean)
-        self.shuffled_options = []  # List of (full_option_text, is_correct_boolean) - subset shown in quiz
-        self.type = None
+OPTION_LETTER_RE = re.compile(r"^[a-j]\.\s*(.*)")  # The letter prefix left out of quiz checkbuttons
+LOAD_POLL_INTERVAL_MS = 100  # How often the window checks on a bank being loaded in the background
+NEXT_QUIZ_POLL_INTERVAL_MS = 50  # How often the window checks on the next quiz being built in the background
+CANCEL_CHECK_INTERVAL_S = 0.1  # How long the loader waits on worker processes between checks for a cancel
 
 
-def parse_questions_from_file(file_path):
-    questions = []
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+class BankLoader:
+    """
+    Reads bank files on a worker thread so the window keeps responding while a big bank parses.
+
+    The Tk thread polls count, progress() and done, and takes questions and errors once done. The
+    worker never touches Tk. cancel() stops a single-file parse or the indexing of a memory-mapped
+    bank at the next question block. A multi-file load drops its queued files and stops waiting for
+    the worker processes still parsing.
 
-        blocks = re.findall(r'(?s)(?m)^(\d+)\.\s*(.*?)(?=\n\d+\.\s*|\Z)', content.strip())
+    bank_files lists (file_path, stat, block digests, invalid block digests) for every file read into
+    a question list, from the same pass that read its questions, for BankWatcher.
+    """
+
+    def __init__(self, file_paths, bank_cache):
+        self.file_paths = file_paths
+        self.bank_cache = bank_cache
+        self.questions = []
+        self.errors = []
+        self.bank_files = []
+        self._total_bytes = 0
+        self._bytes_done = 0
+        self._questions_done = 0
+        self._file_progress = [0, 0]  # [characters read, questions found] of the file being read
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="BankLoader", daemon=True)
+        self._thread.start()
+
+    @property
+    def done(self):
+        return not self._thread.is_alive()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def count(self):
+        """Questions read so far."""
+        return self._questions_done + self._file_progress[1]
+
+    def progress(self):
+        """Fraction of the bank bytes read, between 0 and 1."""
+        if not self._total_bytes:
+            return 0.0
+        return min(1.0, (self._bytes_done + self._file_progress[0]) / self._total_bytes)
+
+    def _run(self):
+        try:
+            self._total_bytes = sum(os.path.getsize(file_path) for file_path in self.file_paths)
+        except OSError:
+            pass  # Reported per file below
+        if len(self.file_paths) == 1:
+            self.questions = self._read_bank(self.file_paths[0])
+        else:
+            self.questions = self._read_banks(self.file_paths)
+        if self.cancelled and isinstance(self.questions, MappedQuestionBank):
+            self.questions.close()
 
-        for num_str, block_content in blocks:
-            lines = block_content.strip().split('\n')
-            if not lines:
-                print(f"Warning: Block starting with {num_str}. has no content.")
+    def _read_bank(self, file_path):
+        try:
+            source_stat = os.stat(file_path)
+        except OSError as e:
+            self.errors.append(f"{os.path.basename(file_path)}: {e}")
+            return []
+        if source_stat.st_size >= MAPPED_BANK_MIN_BYTES:
+            return self._map_bank(file_path, source_stat)
+        snapshot = self.bank_cache.load(file_path)
+        if snapshot is not None:
+            self._file_done(file_path, snapshot[0])
+            return self._take_snapshots([file_path], {file_path: snapshot}, {file_path: source_stat})
+
+        loaded_questions = []
+        digests = []
+        invalid_digests = []
+        try:
+            for digest, question in iter_bank_blocks(file_path, self._file_progress):
+                if self.cancelled:
+                    return []
+                if question is None:
+                    invalid_digests.append(digest)
+                    continue
+                loaded_questions.append(question)
+                digests.append(digest)
+                self._file_progress[1] = len(loaded_questions)
+        except Exception as e:
+            self.errors.append(f"{os.path.basename(file_path)}: {e}")
+            return []
+
+        if loaded_questions:
+            records = [question_to_record(q) for q in loaded_questions]
+            self.bank_cache.store(file_path, (records, digests, invalid_digests), source_stat)
+        self.bank_files.append((file_path, source_stat, digests, invalid_digests))
+        return loaded_questions
+
+    def _map_bank(self, file_path, source_stat):
+        """Opens a large bank as a MappedQuestionBank, reusing its cached offset index if the file is unchanged."""
+        index = self.bank_cache.load(file_path, MAPPED_INDEX_CACHE_KIND)
+        try:
+            bank = MappedQuestionBank(file_path, self._file_progress, index, source_stat, self._cancel.is_set)
+        except Exception as e:
+            self.errors.append(f"{os.path.basename(file_path)}: {e}")
+            return []
+        if index is None and len(bank) and not self.cancelled:
+            self.bank_cache.store(file_path, bank.offsets(), source_stat, MAPPED_INDEX_CACHE_KIND)
+        return bank
+
+    def _read_banks(self, file_paths):
+        """
+        Loads several bank files into one list of questions, in the order of file_paths.
+
+        Banks missing from the cache are parsed in parallel, one file per worker process.
+        """
+        snapshots = {}
+        source_stats = {}
+        to_parse = []
+        for file_path in file_paths:
+            try:
+                source_stats[file_path] = os.stat(file_path)
+            except OSError as e:
+                self.errors.append(f"{os.path.basename(file_path)}: {e}")
                 continue
+            snapshot = self.bank_cache.load(file_path)
+            if snapshot is not None:
+                snapshots[file_path] = snapshot
+                self._file_done(file_path, snapshot[0])
+            else:
+                to_parse.append(file_path)
 
-            question_text = lines[0].strip()
-            options = []
-            for line in lines[1:]:
-                match = re.match(r'^([a-j])\.\s+\[(y|x)]\s+(.*)', line.strip())
-                if match:
-                    letter, correctness, text = match.groups()
-                    options.append((f"{letter}. {text.strip()}", correctness == 'y'))
-            if options:
-                full_question_text = f"{num_str}. {question_text}"
-                questions.append(Question(full_question_text, options))
-            elif question_text:
-                print(f"Warning: Question '{num_str}. {question_text}' has no valid options and will be skipped.")
-
-    except Exception as e:
-        messagebox.showerror("Error loading file", f"Could not read or parse file: {e}")
-        return []
-    return questions
+        if len(to_parse) == 1:
+            try:
+                snapshots[to_parse[0]] = parse_bank(to_parse[0])
+                self._file_done(to_parse[0], snapshots[to_parse[0]][0])
+            except Exception as e:
+                self.errors.append(f"{os.path.basename(to_parse[0])}: {e}")
+        elif to_parse:
+            # Spawned, not forked: this runs on a worker thread of a process that is already running Tk
+            pool = ProcessPoolExecutor(max_workers=min(len(to_parse), os.cpu_count() or 1),
+                                       mp_context=multiprocessing.get_context('spawn'))
+            try:
+                futures = {pool.submit(parse_bank, file_path): file_path for file_path in to_parse}
+                pending = set(futures)
+                while pending and not self.cancelled:
+                    done, pending = wait(pending, timeout=CANCEL_CHECK_INTERVAL_S, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        file_path = futures[future]
+                        try:
+                            snapshots[file_path] = future.result()
+                            self._file_done(file_path, snapshots[file_path][0])
+                        except Exception as e:
+                            self.errors.append(f"{os.path.basename(file_path)}: {e}")
+            finally:
+                # On cancel, drop the queued files and don't wait for the ones still parsing
+                pool.shutdown(wait=not self.cancelled, cancel_futures=True)
+        if self.cancelled:
+            return []
+
+        for file_path in to_parse:
+            if file_path in snapshots and snapshots[file_path][0]:
+                self.bank_cache.store(file_path, snapshots[file_path], source_stats[file_path])
+        return self._take_snapshots(file_paths, snapshots, source_stats)
+
+    def _take_snapshots(self, file_paths, snapshots, source_stats):
+        """Builds the question list from the files' parse_bank snapshots and fills in bank_files."""
+        questions = []
+        for file_path in file_paths:
+            if file_path not in snapshots:
+                continue
+            records, digests, invalid_digests = snapshots[file_path]
+            questions.extend(question_from_record(record, file_path) for record in records)
+            self.bank_files.append((file_path, source_stats[file_path], digests, invalid_digests))
+        return questions
+
+    def _file_done(self, file_path, records):
+        self._questions_done += len(records)
+        try:
+            self._bytes_done += os.path.getsize(file_path)
+        except OSError:
+            pass
+
+
+def build_quiz_item(q, rng=random):
+    """
+    Picks the item type and the presented options of one quiz question. Returns (type, shuffled options)
+    without touching q, so items can be built ahead of time for questions that are still on screen.
+    """
+    if not q.options:
+        return 'CS', array(OPTION_INDEX_TYPECODE)  # Or handle as error/skip
+
+    correct_opts = q.correct_options
+    incorrect_opts = q.incorrect_options
+
+    q_type = 'CS' if correct_opts and rng.choice([True, False]) else 'CM'
+    if not correct_opts: q_type = 'CM'  # Default to CM if no correct options (edge case)
+
+    if q_type == 'CS':
+        # Ensure at least one correct option is chosen if available
+        if correct_opts:
+            chosen_correct = rng.sample(correct_opts, 1)  # Take one correct
+            num_incorrect_needed = 4  # Aim for 1 correct + 4 incorrect = 5 total
+            num_incorrect_to_sample = min(num_incorrect_needed, len(incorrect_opts))
+            sampled_incorrect = rng.sample(incorrect_opts, num_incorrect_to_sample)
+            shuffled_options = chosen_correct + sampled_incorrect
+        else:  # No correct options, take some incorrect ones
+            shuffled_options = rng.sample(incorrect_opts, min(5, len(incorrect_opts)))
+        rng.shuffle(shuffled_options)
+    else:  # CM Type
+        num_total_options_target = 5
+        # Ensure at least 2 correct if available, up to 4 for CM
+        min_correct_for_cm = min(len(correct_opts), 2) if len(correct_opts) >= 2 else len(correct_opts)
+        max_correct_for_cm = min(len(correct_opts), 4)
+
+        num_correct_selected = 0
+        if max_correct_for_cm > 0:  # Ensure min_correct_for_cm <= max_correct_for_cm
+            num_correct_selected = rng.randint(min_correct_for_cm, max_correct_for_cm)
+
+        chosen_correct = rng.sample(correct_opts, num_correct_selected)
+        num_incorrect_needed = num_total_options_target - num_correct_selected
+        num_incorrect_to_sample = min(num_incorrect_needed, len(incorrect_opts))
+        sampled_incorrect = rng.sample(incorrect_opts, num_incorrect_to_sample)
+        shuffled_options = chosen_correct + sampled_incorrect
+
+        # Fill up to 5 if possible with more incorrect options
+        if len(shuffled_options) < num_total_options_target and len(incorrect_opts) > num_incorrect_to_sample:
+            remaining_slots = num_total_options_target - len(shuffled_options)
+            additional_incorrect_options = [opt for opt in incorrect_opts if opt not in sampled_incorrect]
+            additional_incorrect = rng.sample(
+                additional_incorrect_options,
+                min(remaining_slots, len(additional_incorrect_options))
+            )
+            shuffled_options.extend(additional_incorrect)
+        rng.shuffle(shuffled_options)
+
+        # Fallback if still no options (e.g. very few original options)
+        if not shuffled_options and q.options:
+            shuffled_options = rng.sample(range(len(q.options)), min(num_total_options_target, len(q.options)))
+            rng.shuffle(shuffled_options)
+
+    return q_type, array(OPTION_INDEX_TYPECODE, shuffled_options)
+
+
+def plan_quiz(questions, num, rng=random):
+    """
+    Samples num questions and builds their items: a list of (question, type, shuffled options).
+    With rng=random.Random(seed) it gives the same quiz for the same bank and seed.
+    """
+    picked = rng.sample(questions, min(num, len(questions)))
+    return [(q,) + build_quiz_item(q, rng) for q in picked]
+
+
+def elide_text(text, font, width):
+    """text cut short with an ellipsis so that it fits in width pixels in font, a tkinter.font.Font."""
+    if font.measure(text) <= width:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if font.measure(text[:middle] + "…") <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low].rstrip() + "…"
+
+
+def review_mark(is_correct, selected):
+    """Mark and color of an option on the review screens."""
+    if is_correct and selected:
+        return "✅", "green"
+    if selected:
+        return "❌", "red"
+    if is_correct:
+        return "🟠", "orange"
+    return "", "fg"
+
+
+def score_answer(q, user_flags):
+    """Points for one quiz question given the 0/1 checkbox values in shuffled order."""
+    if not q.shuffled_options:
+        return 0
+
+    shuffled_correct_flags = [q.is_correct(opt_index) for opt_index in q.shuffled_options]
+    num_presented_options = len(shuffled_correct_flags)
+    user_flags = (list(user_flags) + [0] * num_presented_options)[:num_presented_options]
+    selected_indices = [i for i, is_selected in enumerate(user_flags) if is_selected]
+
+    if q.type == 'CS':
+        if len(selected_indices) == 1 and shuffled_correct_flags[selected_indices[0]]:
+            return 5
+        return 0
+
+    # CM
+    if not (2 <= len(selected_indices) <= 4):
+        return 0
+    wrong = sum(1 for is_selected, is_correct in zip(user_flags, shuffled_correct_flags)
+                if bool(is_selected) != is_correct)
+    return max(0, min(5 - wrong, 5))
+
+
+def show_first(widgets, count, **pack_options):
+    """
+    Packs the first count widgets and hides the rest. The shown ones always form a prefix of the list,
+    so widgets packed again after being hidden still end up in list order.
+    """
+    for i, widget in enumerate(widgets):
+        if i < count:
+            if not widget.winfo_manager():
+                widget.pack(**pack_options)
+        elif widget.winfo_manager():
+            widget.pack_forget()
 
 
 class QuizApp:
@@ -90,12 +388,18 @@ class QuizApp:
         self.score = 0
         self.max_score = 0
         self.scores_breakdown = []
-        self.source_file_name = ""
+        self.source_files = []
         self.mode = 'menu'
         self.review_index = 0
+        self.review_from_list = False
 
         self.vars = []
-        self.saved_vars = []
+        self.question_displays = []  # Texts of each quiz question once prepared, see question_display
+        self.prefetch_id = None
+        self.quiz_seed = None  # Every random choice of the current quiz comes from this seed
+        self.next_quiz = None  # (questions, num, seed, plan) built ahead for Start Another Quiz, see prepare_next_quiz
+        self.next_quiz_job = None  # (thread, result list) of the quiz being built ahead on a worker thread
+        self.next_quiz_id = None
 
         self.timer_id = None
         self.elapsed_seconds = 0
@@ -104,6 +408,25 @@ class QuizApp:
 
         self.dark_mode_button = None
 
+        # Screens are built on first use and then only updated, see show_screen
+        self.screens = {}
+        self.current_screen = None
+        self.menu_frame = None
+        self.bank_label = None  # Bank file name and question count on the menu
+        self.option_vars = []
+        self.option_checkbuttons = []
+        self.review_option_labels = []
+        self.themed_widgets = {}  # tk widget -> {option: theme color key}, see theme_widget
+        self.theme_colors = {}
+
+        self.bank_cache = BankCache(BANK_CACHE_DIR, BANK_CACHE_MAX_BYTES)
+        self.writer = PersistenceWriter()
+        self.bank_watcher = None
+        self.bank_watch_id = None
+        self.bank_loader = None
+        self.bank_loader_id = None
+        self.num_questions_before_load = None
+
         self.setup_styles()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.center_window()
@@ -123,14 +446,17 @@ class QuizApp:
     def save_window_size(self):
         try:
             size = f"{self.root.winfo_width()}x{self.root.winfo_height()}"
-            with open(WINDOW_SIZE_FILE, "w") as f:
-                f.write(size)
+            self.writer.write_file(WINDOW_SIZE_FILE, size)
         except Exception as e:
             print(f"Error saving window size: {e}")
 
     def on_closing(self):
+        if self.bank_loader:
+            self.bank_loader.cancel()
         self.save_window_size()
         self.stop_elapsed_timer()
+        self.stop_bank_watcher()
+        self.writer.close()  # Waits for queued writes to reach the disk
         self.root.destroy()
 
     def center_window(self):
@@ -163,10 +489,12 @@ class QuizApp:
         btn_fg = "#000000"
         self.default_fg_color = fg
         self.root.configure(bg=bg)
+        self.theme_colors = {'bg': bg, 'fg': fg, 'disabled': self.disabled_fg_color}
 
         self.style.configure("TFrame", background=bg, foreground=fg)
         self.style.configure("TLabel", background=bg, foreground=fg)
         self.style.configure("TCheckbutton", background=bg, foreground=fg)  # General TCheckbutton
+        self.style.configure("TRadiobutton", background=bg, foreground=fg)
 
         # Configure Quiz.TCheckbutton (for options in quiz)
         self.style.configure("Quiz.TCheckbutton", font=FONT_OPTION, background=bg, foreground=fg)
@@ -201,57 +529,96 @@ class QuizApp:
                                  arrowcolor="#000000")
             self.style.map("Vertical.TScrollbar", background=[('active', '#c0c0c0')])
 
+        self.apply_theme()
+
+    def theme_widget(self, widget, **color_keys):
+        """
+        Colors a tk widget from the current theme and keeps it colored on later theme changes. ttk widgets
+        follow their style and don't need this. Keys that are not theme colors ('green') are used as is.
+        Theming a widget again replaces its previous keys.
+        """
+        self.themed_widgets[widget] = color_keys
+        widget.config(**{option: self.theme_colors.get(key, key) for option, key in color_keys.items()})
+
+    def apply_theme(self):
+        for widget, color_keys in list(self.themed_widgets.items()):
+            if not widget.winfo_exists():
+                del self.themed_widgets[widget]
+                continue
+            widget.config(**{option: self.theme_colors.get(key, key) for option, key in color_keys.items()})
+
     def toggle_theme(self):
         if self.mode == 'menu':
             return
 
-        if self.mode == 'quiz':
-            self.save_current_checkbox_states()
-
+        # Styles and themed widgets are recolored in place, so the screen and its checkbox states stay as they are
         self.dark_mode = not self.dark_mode
         self.configure_colors()
-        if self.mode == 'quiz':
-            self.show_question(preserve_vars=True)
-        elif self.mode == 'review':
-            self.review_question(self.review_index)
-        elif self.mode == 'score':
-            self.show_score()
-
-    def save_current_checkbox_states(self):
-        if self.vars:
-            self.saved_vars = [var.get() for var in self.vars]
-        else:
-            self.saved_vars = []
+        self.add_dark_mode_button()
+        if self.mode == 'review_list':
+            self.draw_review_list()  # Canvas text takes its colors when drawn
 
     def add_dark_mode_button(self):
-        if self.dark_mode_button and self.dark_mode_button.winfo_exists():
-            self.dark_mode_button.destroy()
-            self.dark_mode_button = None
+        if self.mode == 'menu':
+            if self.dark_mode_button:
+                self.dark_mode_button.place_forget()
+            return
 
-        if self.mode != 'menu':
-            btn_text = " 🌙 " if not self.dark_mode else " ☀ "
-            self.dark_mode_button = ttk.Button(self.root, text=btn_text, command=self.toggle_theme, style="TButton",
-                                               takefocus=0, state='normal')
-            self.dark_mode_button.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=10)
+        btn_text = " 🌙 " if not self.dark_mode else " ☀ "
+        if not self.dark_mode_button:
+            self.dark_mode_button = ttk.Button(self.root, command=self.toggle_theme, style="TButton", takefocus=0,
+                                               state='normal')
+        self.dark_mode_button.config(text=btn_text)
+        self.dark_mode_button.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=10)
+        # --- FIX: Lift the dark mode button to the top of the stacking order ---
+        self.dark_mode_button.lift()
+
+    def show_screen(self, screen):
+        """Packs screen into the window in place of the one shown before. Neither is destroyed."""
+        if self.current_screen is screen:
+            return
+        if self.current_screen is not None and self.current_screen.winfo_exists():
+            self.current_screen.pack_forget()
+        screen.pack(fill='both', expand=True)
+        self.current_screen = screen
 
     def main_menu(self):
         self.mode = 'menu'
         self.stop_elapsed_timer()
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.add_dark_mode_button()
+        # The menu is cheap and rarely shown, so it is the one screen still rebuilt each time
+        if self.menu_frame:
+            self.menu_frame.destroy()
+        self.menu_frame = ttk.Frame(self.root)
 
-        if self.source_file_name:
-            label_text = f"📁 File: {os.path.basename(self.source_file_name)}"
-            if self.questions:
-                label_text += f" ({len(self.questions)} questions)"
-            label = ttk.Label(self.root, text=label_text, anchor="e", font=FONT_SMALL)
-            label.pack(pady=5, padx=10, fill='x')
+        self.bank_label = None
+        if self.source_files:
+            self.bank_label = ttk.Label(self.menu_frame, text=self.bank_label_text(), anchor="e", font=FONT_SMALL)
+            self.bank_label.pack(pady=5, padx=10, fill='x')
 
-        main_frame = ttk.Frame(self.root)
+        main_frame = ttk.Frame(self.menu_frame)
         main_frame.pack(expand=True, fill='both', padx=20, pady=10)
 
-        ttk.Button(main_frame, text="📂 Load Quiz File", command=self.load_file, style="TButton", takefocus=0).pack(
-            pady=8, fill='x')
+        load_frame = ttk.Frame(main_frame)
+        load_frame.pack(pady=8, fill='x')
+        load_frame.columnconfigure(0, weight=1)
+        load_frame.columnconfigure(1, weight=1)
+        load_state = 'disabled' if self.bank_loader else 'normal'
+        ttk.Button(load_frame, text="📂 Load Quiz Files", command=self.load_file, style="TButton", takefocus=0,
+                   state=load_state).grid(row=0, column=0, sticky='ew', padx=(0, 4))
+        ttk.Button(load_frame, text="🗂 Load Folder", command=self.load_folder, style="TButton", takefocus=0,
+                   state=load_state).grid(row=0, column=1, sticky='ew', padx=(4, 0))
+
+        if self.bank_loader:
+            progress_frame = ttk.Frame(main_frame)
+            progress_frame.pack(pady=(0, 8), fill='x')
+            progress_frame.columnconfigure(0, weight=1)
+            self.load_progress_bar = ttk.Progressbar(progress_frame, mode='determinate', maximum=1.0)
+            self.load_progress_bar.grid(row=0, column=0, sticky='ew')
+            ttk.Button(progress_frame, text="Cancel", command=self.cancel_loading, style="TButton",
+                       takefocus=0).grid(row=0, column=1, padx=(8, 0))
+            self.load_progress_label = ttk.Label(progress_frame, text="", font=FONT_SMALL)
+            self.load_progress_label.grid(row=1, column=0, sticky='w')
 
         num_q_frame = ttk.Frame(main_frame)
         num_q_frame.pack(pady=8, fill='x')
@@ -276,36 +643,146 @@ class QuizApp:
         else:
             default_q_val = 5 if len(self.questions) == 0 else min(5, len(self.questions))
 
-        self.num_questions_var.set(default_q_val)
+        if not self.bank_loader:
+            self.num_questions_var.set(default_q_val)
         self.num_questions_entry = ttk.Entry(num_q_frame, textvariable=self.num_questions_var, width=5,
-                                             font=FONT_BUTTON, justify='center')
+                                             font=FONT_BUTTON, justify='center', state=load_state)
         self.num_questions_entry.grid(row=1, column=1, pady=4)
 
-        state = 'normal' if self.questions else 'disabled'
+        state = 'normal' if self.questions and not self.bank_loader else 'disabled'
         self.start_btn = ttk.Button(main_frame, text="Start Quiz", command=self.start_quiz, state=state,
                                     style="TButton", takefocus=0)
         self.start_btn.pack(pady=8, fill='x')
+        self.show_screen(self.menu_frame)
+        if self.bank_loader:
+            self.update_load_progress()
+
+    def bank_label_text(self):
+        if len(self.source_files) == 1:
+            label_text = f"📁 File: {os.path.basename(self.source_files[0])}"
+        else:
+            label_text = f"📁 Files: {len(self.source_files)} banks"
+        if self.questions:
+            label_text += f" ({len(self.questions)} questions)"
+        return label_text
 
     def load_file(self):
-        file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
-        if file_path:
-            loaded_questions = parse_questions_from_file(file_path)
-            if loaded_questions:
-                self.questions = loaded_questions
-                self.source_file_name = file_path
-                messagebox.showinfo("Success", f"{len(self.questions)} questions loaded.")
-                if hasattr(self, 'num_questions_var'):
-                    self.num_questions_var.set(min(5, len(self.questions)))
-                self.main_menu()
-            else:
-                self.questions = []
-                self.source_file_name = ""
-                if hasattr(self, 'num_questions_var'):
-                    self.num_questions_var.set(5)
-                messagebox.showerror("Loading Error", "No valid questions found in the selected file or file is empty.")
-                self.main_menu()
+        file_paths = filedialog.askopenfilenames(filetypes=[("Text files", "*.txt")])
+        if file_paths:
+            self.load_banks(list(file_paths))
+
+    def load_folder(self):
+        folder = filedialog.askdirectory()
+        if folder:
+            file_paths = sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                                if name.lower().endswith('.txt'))
+            if not file_paths:
+                messagebox.showerror("Loading Error", "No .txt question files found in the selected folder.")
+                return
+            self.load_banks(file_paths)
+
+    def load_banks(self, file_paths):
+        """Starts reading file_paths in the background. poll_bank_loader takes over the questions when done."""
+        if self.bank_loader:
+            return
+        try:
+            self.num_questions_before_load = self.num_questions_var.get()
+        except tk.TclError:
+            self.num_questions_before_load = None
+        self.bank_loader = BankLoader(file_paths, self.bank_cache)
+        self.main_menu()
+        self.bank_loader_id = self.root.after(LOAD_POLL_INTERVAL_MS, self.poll_bank_loader)
+
+    def update_load_progress(self):
+        loader = self.bank_loader
+        self.load_progress_bar.config(value=loader.progress())
+        self.load_progress_label.config(text=f"Loading... {loader.count} questions")
+        # The question count follows the bank as it grows, as it would once loading is done
+        self.num_questions_var.set(min(5, loader.count) if loader.count else 5)
+
+    def poll_bank_loader(self):
+        self.bank_loader_id = None
+        loader = self.bank_loader
+        if not loader.done:
+            if self.mode == 'menu':
+                self.update_load_progress()
+            self.bank_loader_id = self.root.after(LOAD_POLL_INTERVAL_MS, self.poll_bank_loader)
+            return
 
-    def start_quiz(self):
+        self.bank_loader = None
+        if loader.cancelled:
+            if self.num_questions_before_load is not None:
+                self.num_questions_var.set(self.num_questions_before_load)
+            if self.mode == 'menu':
+                self.main_menu()
+            return
+        self.finish_loading(loader.file_paths, loader.questions, loader.errors, loader.bank_files)
+
+    def cancel_loading(self):
+        if self.bank_loader:
+            self.bank_loader.cancel()
+            self.load_progress_label.config(text="Cancelling...")
+
+    def finish_loading(self, file_paths, loaded_questions, errors, bank_files=()):
+        self.drop_next_quiz()
+        if errors:
+            messagebox.showerror("Error loading file", "Could not read or parse:\n" + "\n".join(errors))
+        self.stop_bank_watcher()
+        if isinstance(self.questions, MappedQuestionBank):
+            self.questions.close()
+        if loaded_questions:
+            self.questions = loaded_questions
+            self.source_files = file_paths
+            self.start_bank_watcher(bank_files)
+            messagebox.showinfo("Success", f"{len(self.questions)} questions loaded.")
+            if hasattr(self, 'num_questions_var'):
+                self.num_questions_var.set(min(5, len(self.questions)))
+            self.main_menu()
+        else:
+            self.questions = []
+            self.source_files = []
+            if hasattr(self, 'num_questions_var'):
+                self.num_questions_var.set(5)
+            messagebox.showerror("Loading Error", "No valid questions found in the selected file or file is empty.")
+            self.main_menu()
+
+    def start_bank_watcher(self, bank_files):
+        # Memory-mapped banks can't be patched in place; poll_bank_files loads them again instead
+        if isinstance(self.questions, list):
+            if not bank_files:
+                return
+            self.bank_watcher = BankWatcher(self.questions, bank_files)
+        self.bank_watch_id = self.root.after(BANK_WATCH_INTERVAL_MS, self.poll_bank_files)
+
+    def stop_bank_watcher(self):
+        if self.bank_watch_id:
+            self.root.after_cancel(self.bank_watch_id)
+            self.bank_watch_id = None
+        self.bank_watcher = None
+
+    def poll_bank_files(self):
+        self.bank_watch_id = None
+        try:
+            if self.bank_watcher is None:
+                # A mapped bank is indexed again once its file changes. Away from the menu that waits,
+                # unless start_quiz finds the change first
+                if self.questions.changed() and self.mode == 'menu' and not self.bank_loader:
+                    self.load_banks(self.source_files)
+                return
+            reloaded = self.bank_watcher.poll()
+            if reloaded:
+                for file_path in reloaded:
+                    snapshot, source_stat = self.bank_watcher.file_snapshot(file_path)
+                    if snapshot and snapshot[0]:
+                        self.bank_cache.store(file_path, snapshot, source_stat)
+                self.drop_next_quiz()  # Built from the bank as it was before the edit
+                # Only the question count changes; rebuilding the menu would drop what is being typed
+                if self.mode == 'menu' and self.bank_label:
+                    self.bank_label.config(text=self.bank_label_text())
+        finally:
+            self.bank_watch_id = self.root.after(BANK_WATCH_INTERVAL_MS, self.poll_bank_files)
+
+    def start_quiz(self, seed=None):
         try:
             num = self.num_questions_var.get()
             if not isinstance(num, int) or num <= 0:
@@ -322,156 +799,125 @@ class QuizApp:
             messagebox.showerror("Error", f"Please choose a number of questions between 1 and {len(self.questions)}.")
             return
 
+        try:
+            if isinstance(self.questions, MappedQuestionBank) and self.questions.changed():
+                raise BankChangedError(f"{os.path.basename(self.questions.file_path)} changed on disk")
+            prepared = self.take_next_quiz(num)
+            if prepared and seed is None:
+                self.quiz_seed, plan = prepared
+            else:
+                self.quiz_seed = random.getrandbits(QUIZ_SEED_BITS) if seed is None else seed
+                plan = plan_quiz(self.questions, num, random.Random(self.quiz_seed))
+        except BankChangedError as e:
+            # The memory-mapped bank's offsets no longer match the file, so it is read again
+            self.drop_next_quiz()
+            messagebox.showinfo("Bank changed", f"{e}. Loading it again.")
+            self.load_banks(self.source_files)
+            return
         self.root.geometry(self.load_window_size())
         self.center_window()
-        num_to_sample = min(num, len(self.questions))
-        self.quiz_questions = random.sample(self.questions, num_to_sample)
-
-        for q in self.quiz_questions:
-            if not q.options:
-                q.shuffled_options = []
-                q.type = 'CS'  # Or handle as error/skip
-                continue
-
-            correct_opts = [opt for opt in q.options if opt[1]]
-            incorrect_opts = [opt for opt in q.options if not opt[1]]
-
-            q.type = 'CS' if correct_opts and random.choice([True, False]) else 'CM'
-            if not correct_opts: q.type = 'CM'  # Default to CM if no correct options (edge case)
-
-            if q.type == 'CS':
-                # Ensure at least one correct option is chosen if available
-                if correct_opts:
-                    chosen_correct = random.sample(correct_opts, 1)  # Take one correct
-                    num_incorrect_needed = 4  # Aim for 1 correct + 4 incorrect = 5 total
-                    num_incorrect_to_sample = min(num_incorrect_needed, len(incorrect_opts))
-                    sampled_incorrect = random.sample(incorrect_opts, num_incorrect_to_sample)
-                    q.shuffled_options = chosen_correct + sampled_incorrect
-                else:  # No correct options, take some incorrect ones
-                    q.shuffled_options = random.sample(incorrect_opts, min(5, len(incorrect_opts)))
-                random.shuffle(q.shuffled_options)
-            else:  # CM Type
-                num_total_options_target = 5
-                # Ensure at least 2 correct if available, up to 4 for CM
-                min_correct_for_cm = min(len(correct_opts), 2) if len(correct_opts) >= 2 else len(correct_opts)
-                max_correct_for_cm = min(len(correct_opts), 4)
-
-                num_correct_selected = 0
-                if max_correct_for_cm > 0:  # Ensure min_correct_for_cm <= max_correct_for_cm
-                    num_correct_selected = random.randint(min_correct_for_cm, max_correct_for_cm)
-
-                chosen_correct = random.sample(correct_opts, num_correct_selected)
-                num_incorrect_needed = num_total_options_target - num_correct_selected
-                num_incorrect_to_sample = min(num_incorrect_needed, len(incorrect_opts))
-                sampled_incorrect = random.sample(incorrect_opts, num_incorrect_to_sample)
-                q.shuffled_options = chosen_correct + sampled_incorrect
-
-                # Fill up to 5 if possible with more incorrect options
-                if len(q.shuffled_options) < num_total_options_target and len(incorrect_opts) > num_incorrect_to_sample:
-                    remaining_slots = num_total_options_target - len(q.shuffled_options)
-                    additional_incorrect_options = [opt for opt in incorrect_opts if opt not in sampled_incorrect]
-                    additional_incorrect = random.sample(
-                        additional_incorrect_options,
-                        min(remaining_slots, len(additional_incorrect_options))
-                    )
-                    q.shuffled_options.extend(additional_incorrect)
-                random.shuffle(q.shuffled_options)
-
-                # Fallback if still no options (e.g. very few original options)
-                if not q.shuffled_options and q.options:
-                    q.shuffled_options = random.sample(q.options, min(num_total_options_target, len(q.options)))
-                    random.shuffle(q.shuffled_options)
+        self.quiz_questions = []
+        for q, q_type, shuffled_options in plan:
+            q.type = q_type
+            q.shuffled_options = shuffled_options
+            self.quiz_questions.append(q)
 
         self.current_question_index = 0
         self.user_answers = [[] for _ in self.quiz_questions]
         self.score = 0
         self.max_score = len(self.quiz_questions) * 5 if self.quiz_questions else 0
         self.scores_breakdown = [0] * len(self.quiz_questions)
-        self.saved_vars = []
+        self.question_displays = [None] * len(self.quiz_questions)
         self.elapsed_seconds = 0
         self.show_question()
 
-    def show_question(self, preserve_vars=False):
-        self.mode = 'quiz'
-        self.stop_elapsed_timer()
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def prepare_next_quiz(self):
+        """
+        Starts building another quiz like the one just finished on a worker thread, so Start Another Quiz
+        starts at once. poll_next_quiz takes the result back on the Tk thread.
+        """
+        if self.next_quiz_job or self.mode not in ('score', 'review', 'review_list'):
+            return
+        try:
+            num = self.num_questions_var.get()
+        except tk.TclError:
+            return
+        if not self.questions or not 0 < num <= len(self.questions):
+            return
+        if self.next_quiz and self.next_quiz[0] is self.questions and self.next_quiz[1] == num:
+            return
 
-        self.add_dark_mode_button()
+        questions = self.questions
+        # The watcher patches list banks in place on this thread, so the worker samples a copy
+        bank = list(questions) if isinstance(questions, list) else questions
+        seed = random.getrandbits(QUIZ_SEED_BITS)
+        result = []
 
-        if not (0 <= self.current_question_index < len(self.quiz_questions)):
-            self.stop_elapsed_timer()
-            self.calculate_score()
-            self.show_score()
+        def build():
+            try:
+                result.append(plan_quiz(bank, num, random.Random(seed)))
+            except (BankChangedError, ValueError):
+                pass  # The mapped bank changed on disk or was closed by a reload; start_quiz handles both
+
+        thread = threading.Thread(target=build, name="NextQuiz", daemon=True)
+        job = self.next_quiz_job = (thread, result)
+        thread.start()
+        self.next_quiz_id = self.root.after(NEXT_QUIZ_POLL_INTERVAL_MS,
+                                            lambda: self.poll_next_quiz(job, questions, num, seed))
+
+    def poll_next_quiz(self, job, questions, num, seed):
+        self.next_quiz_id = None
+        if job is not self.next_quiz_job:
+            return  # Dropped because the bank changed while it was being built
+        thread, result = job
+        if thread.is_alive():
+            self.next_quiz_id = self.root.after(NEXT_QUIZ_POLL_INTERVAL_MS,
+                                                lambda: self.poll_next_quiz(job, questions, num, seed))
             return
+        self.next_quiz_job = None
+        if result:
+            self.next_quiz = (questions, num, seed, result[0])
+
+    def drop_next_quiz(self):
+        """Forgets the quiz built ahead, and any still being built, once it no longer matches the bank."""
+        self.next_quiz = None
+        self.next_quiz_job = None
+        if self.next_quiz_id:
+            self.root.after_cancel(self.next_quiz_id)
+            self.next_quiz_id = None
+
+    def take_next_quiz(self, num):
+        """(seed, plan) of the prepared quiz if it was built from the current bank for num questions, otherwise None."""
+        next_quiz = self.next_quiz
+        self.drop_next_quiz()  # A quiz still being built would only be ready after this one has started
+        if next_quiz and next_quiz[0] is self.questions and next_quiz[1] == num:
+            return next_quiz[2:]
+        return None
+
+    def build_quiz_screen(self):
+        screen = ttk.Frame(self.root)
 
         # This frame will hold the centered labels
-        top_info_frame = ttk.Frame(self.root)
+        top_info_frame = ttk.Frame(screen)
         top_info_frame.pack(fill='x', pady=(10, 0), padx=20)
 
         # Timer Label (packed first to appear on top)
         self.timer_label = ttk.Label(top_info_frame, text="", font=FONT_BUTTON)
         self.timer_label.pack(pady=(0, 2))  # .pack() centers it horizontally by default
-        self.start_elapsed_timer()
 
         # Question Number Label (packed second to appear below timer)
-        question_number_text = f"Question {self.current_question_index + 1} of {len(self.quiz_questions)}"
-        question_number_label = ttk.Label(top_info_frame, text=question_number_text, font=FONT_BUTTON)
-        question_number_label.pack(pady=(0, 5))
+        self.question_number_label = ttk.Label(top_info_frame, text="", font=FONT_BUTTON)
+        self.question_number_label.pack(pady=(0, 5))
 
-        q = self.quiz_questions[self.current_question_index]
-        question_label_wraplength = max(300, self.root.winfo_width() - 40)
-        ttk.Label(self.root, text=f"[{q.type}] {q.text}",
-                  wraplength=question_label_wraplength, justify="left",
-                  font=FONT_QUESTION).pack(pady=20, anchor='w', padx=20)
+        self.question_label = ttk.Label(screen, text="", justify="left", font=FONT_QUESTION)
+        self.question_label.pack(pady=20, anchor='w', padx=20)
 
-        options_frame = ttk.Frame(self.root)
-        options_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        self.vars = []
-        self.checkbuttons = []
-
-        def update_font(index):
-            var = self.vars[index]
-            cb = self.checkbuttons[index]
-            cb.config(font=FONT_OPTION_BOLD if var.get() else FONT_OPTION)
+        self.options_frame = ttk.Frame(screen)
+        self.options_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        self.no_options_label = ttk.Label(self.options_frame, text="No options available for this question.",
+                                          font=FONT_OPTION)
 
-        if not q.shuffled_options:
-            ttk.Label(options_frame, text="No options available for this question.", font=FONT_OPTION).pack(anchor='w',
-                                                                                                            padx=40,
-                                                                                                            pady=4)
-        else:
-            for i, (opt_text, _) in enumerate(q.shuffled_options):
-                var = tk.IntVar(value=0)
-
-                match = re.match(r"^[a-j]\.\s*(.*)", opt_text)
-                cb_text = match.group(1) if match else opt_text
-
-                cb = tk.Checkbutton(options_frame, text=cb_text, variable=var,
-                                    font=FONT_OPTION, anchor='w', justify='left',
-                                    bg=self.root["bg"], fg=self.default_fg_color,
-                                    selectcolor=self.root["bg"],
-                                    activebackground=self.root["bg"],
-                                    activeforeground=self.default_fg_color,
-                                    command=lambda idx=i: update_font(idx))
-                cb.pack(anchor='w', padx=40, pady=4)
-                self.vars.append(var)
-                self.checkbuttons.append(cb)
-
-        if preserve_vars:
-            if self.current_question_index < len(self.user_answers) and self.user_answers[self.current_question_index]:
-                current_answers = self.user_answers[self.current_question_index]
-                for i, var_value in enumerate(current_answers):
-                    if i < len(self.vars):
-                        self.vars[i].set(var_value)
-                        self.checkbuttons[i].config(font=FONT_OPTION_BOLD if var_value else FONT_OPTION)
-            elif self.saved_vars:
-                for i, var_value in enumerate(self.saved_vars):
-                    if i < len(self.vars):
-                        self.vars[i].set(var_value)
-                        self.checkbuttons[i].config(font=FONT_OPTION_BOLD if var_value else FONT_OPTION)
-            self.saved_vars = []
-
-        nav_frame = ttk.Frame(self.root)
+        nav_frame = ttk.Frame(screen)
         nav_frame.pack(side='bottom', fill='x', padx=20, pady=20)
         nav_frame.columnconfigure(0, weight=1)
         nav_frame.columnconfigure(1, weight=0)
@@ -481,96 +927,159 @@ class QuizApp:
 
         next_btn = ttk.Button(nav_frame, text="Next", command=self.next_question, style="TButton", takefocus=0)
         next_btn.grid(row=0, column=3, padx=10)
-        if self.current_question_index > 0:
-            prev_btn = ttk.Button(nav_frame, text="Previous", command=self.prev_question, style="TButton",
-                                  takefocus=0)
-            prev_btn.grid(row=0, column=1, padx=10)
+        self.quiz_prev_btn = ttk.Button(nav_frame, text="Previous", command=self.prev_question, style="TButton",
+                                        takefocus=0)
+        self.screens['quiz'] = screen
+        return screen
+
+    def option_checkbutton(self, index):
+        """The pooled option checkbutton for row index, created the first time a question needs that many rows."""
+        while len(self.option_checkbuttons) <= index:
+            var = tk.IntVar(value=0)
+            cb = tk.Checkbutton(self.options_frame, variable=var, font=FONT_OPTION, anchor='w', justify='left',
+                                command=lambda idx=len(self.option_checkbuttons): self.option_toggled(idx))
+            self.theme_widget(cb, bg='bg', fg='fg', selectcolor='bg', activebackground='bg', activeforeground='fg')
+            self.option_vars.append(var)
+            self.option_checkbuttons.append(cb)
+        return self.option_checkbuttons[index]
+
+    def option_toggled(self, index):
+        self.checkbuttons[index].config(font=FONT_OPTION_BOLD if self.vars[index].get() else FONT_OPTION)
+        self.record_answer(self.current_question_index, [v.get() for v in self.vars])
 
-        # --- FIX: Lift the dark mode button to the top of the stacking order ---
-        if self.dark_mode_button:
-            self.dark_mode_button.lift()
+    def show_question(self, preserve_vars=False):
+        self.mode = 'quiz'
+        self.stop_elapsed_timer()
+
+        if not (0 <= self.current_question_index < len(self.quiz_questions)):
+            self.show_score()
+            return
+
+        self.show_screen(self.screens.get('quiz') or self.build_quiz_screen())
+        self.add_dark_mode_button()
+        self.start_elapsed_timer()
+
+        question_number_text, question_text, option_texts = self.question_display(self.current_question_index)
+        self.question_number_label.config(text=question_number_text)
+        # Measured here rather than when prefetching, the window may have been resized in between
+        question_label_wraplength = max(300, self.root.winfo_width() - 40)
+        self.question_label.config(text=question_text, wraplength=question_label_wraplength)
+
+        num_options = len(option_texts)
+        answers = []
+        if preserve_vars and self.current_question_index < len(self.user_answers):
+            answers = self.user_answers[self.current_question_index]
+        for i, cb_text in enumerate(option_texts):
+            var_value = answers[i] if i < len(answers) else 0
+            self.option_checkbutton(i).config(text=cb_text, font=FONT_OPTION_BOLD if var_value else FONT_OPTION)
+            self.option_vars[i].set(var_value)
+        self.vars = self.option_vars[:num_options]
+        self.checkbuttons = self.option_checkbuttons[:num_options]
+        show_first(self.option_checkbuttons, num_options, anchor='w', padx=40, pady=4)
+        if num_options:
+            self.no_options_label.pack_forget()
+        else:
+            self.no_options_label.pack(anchor='w', padx=40, pady=4)
+
+        if self.current_question_index > 0:
+            self.quiz_prev_btn.grid(row=0, column=1, padx=10)
+        else:
+            self.quiz_prev_btn.grid_remove()
+
+        # While the user reads this question, get the next one ready so Next only swaps content in
+        if self.prefetch_id:
+            self.root.after_cancel(self.prefetch_id)
+        self.prefetch_id = self.root.after_idle(self.prefetch_question, self.current_question_index + 1)
+
+    def question_display(self, index):
+        """(question number text, question text, option texts) of quiz question index, built once per quiz."""
+        display = self.question_displays[index]
+        if display is None:
+            q = self.quiz_questions[index]
+            question_number_text = f"Question {index + 1} of {len(self.quiz_questions)}"
+            if len(self.source_files) > 1 and q.source_file:
+                question_number_text += f"  ·  {os.path.basename(q.source_file)}"
+            option_texts = []
+            for opt_index in q.shuffled_options:
+                opt_text = q.options[opt_index]
+                match = OPTION_LETTER_RE.match(opt_text)
+                option_texts.append(match.group(1) if match else opt_text)
+            display = self.question_displays[index] = (question_number_text, f"[{q.type}] {q.text}", option_texts)
+        return display
+
+    def prefetch_question(self, index):
+        """Idle-time work for the question after the one shown: its texts and any option rows it needs."""
+        self.prefetch_id = None
+        if self.mode != 'quiz' or not 0 <= index < len(self.quiz_questions):
+            return
+        option_texts = self.question_display(index)[2]
+        if option_texts:
+            self.option_checkbutton(len(option_texts) - 1)
 
     def next_question(self):
-        while len(self.user_answers) <= self.current_question_index:
-            self.user_answers.append([])
-        self.user_answers[self.current_question_index] = [var.get() for var in self.vars]
-        self.saved_vars = []
+        self.record_answer(self.current_question_index, [var.get() for var in self.vars])
         self.current_question_index += 1
         if self.current_question_index >= len(self.quiz_questions):
             self.stop_elapsed_timer()
-            self.calculate_score()
             self.show_score()
         else:
             self.show_question(preserve_vars=True)
 
     def prev_question(self):
-        while len(self.user_answers) <= self.current_question_index:
-            self.user_answers.append([])
-        self.user_answers[self.current_question_index] = [var.get() for var in self.vars]
-        self.saved_vars = []
+        self.record_answer(self.current_question_index, [var.get() for var in self.vars])
         if self.current_question_index > 0:
             self.current_question_index -= 1
             self.show_question(preserve_vars=True)
 
-    def calculate_score(self):
-        self.score = 0
-        for q_index, q in enumerate(self.quiz_questions):
-            if not q.shuffled_options:
-                self.scores_breakdown[q_index] = 0
-                continue
-
-            shuffled_correct_flags = [opt_tuple[1] for opt_tuple in q.shuffled_options]
-            num_presented_options = len(shuffled_correct_flags)
-
-            user_flags_for_q = []
-            if q_index < len(self.user_answers) and self.user_answers[q_index]:
-                user_flags_for_q = self.user_answers[q_index][:]
-                while len(user_flags_for_q) < num_presented_options: user_flags_for_q.append(0)
-                user_flags_for_q = user_flags_for_q[:num_presented_options]
-            else:
-                user_flags_for_q = [0] * num_presented_options
-
-            q_score = 0
-            user_selected_shuffled_indices = [i for i, is_selected in enumerate(user_flags_for_q) if is_selected]
-
-            true_correct_texts_in_shuffled = [
-                opt_text for opt_text, is_correct_in_original in q.shuffled_options if is_correct_in_original
-            ]
-
-            if q.type == 'CS':
-                if len(user_selected_shuffled_indices) == 1:
-                    selected_option_text = q.shuffled_options[user_selected_shuffled_indices[0]][0]
-                    if selected_option_text in true_correct_texts_in_shuffled:
-                        q_score = 5
-            else:  # CM
-                if not (2 <= len(user_selected_shuffled_indices) <= 4):
-                    q_score = 0
-                else:
-                    q_score = 5
-                    for i in range(num_presented_options):
-                        is_option_originally_correct = q.shuffled_options[i][1]
-                        if (user_flags_for_q[i] and not is_option_originally_correct) or \
-                                (not user_flags_for_q[i] and is_option_originally_correct):
-                            q_score -= 1
-                    q_score = max(0, q_score)
-                    q_score = min(q_score, 5)
-
-            self.scores_breakdown[q_index] = q_score
-            self.score += q_score
+    def record_answer(self, q_index, user_flags):
+        """
+        Stores the answer to quiz question q_index and moves the running score by the change in its points.
+
+        Called on every checkbox toggle as well as on Previous/Next, so the score is always current and
+        the score screen never has to walk the whole quiz again.
+        """
+        q_score = score_answer(self.quiz_questions[q_index], user_flags)
+        self.user_answers[q_index] = user_flags
+        self.score += q_score - self.scores_breakdown[q_index]
+        self.scores_breakdown[q_index] = q_score
+
+    def build_score_screen(self):
+        screen = ttk.Frame(self.root)
+        ttk.Label(screen, text="Quiz Complete!", font=FONT_QUESTION).pack(pady=20)
+        self.total_score_label = ttk.Label(screen, text="", font=(FONT_FAMILY, 20, "bold"))
+        self.total_score_label.pack(pady=5)
+        self.final_grade_label = ttk.Label(screen, text="", font=(FONT_FAMILY, 20, "bold"))
+        self.final_grade_label.pack(pady=5)
+        self.total_time_label = ttk.Label(screen, text="", font=FONT_BUTTON)
+        self.total_time_label.pack(pady=5)
+
+        self.score_buttons_frame = ttk.Frame(screen)
+        self.score_buttons_frame.pack(pady=20, fill='x')
+        self.review_btn = ttk.Button(self.score_buttons_frame, text="🔍 Review Answers",
+                                     command=lambda: self.review_question(0), style="TButton", takefocus=0)
+        self.review_btn.pack(pady=10, fill='x')
+        self.review_list_btn = ttk.Button(self.score_buttons_frame, text="📜 Review All", command=self.show_review_list,
+                                          style="TButton", takefocus=0)
+        self.review_list_btn.pack(pady=10, fill='x')
+        self.start_another_btn = ttk.Button(self.score_buttons_frame, text="🔄 Start Another Quiz",
+                                            command=self.start_another_quiz, style="TButton", takefocus=0)
+        self.start_another_btn.pack(pady=10, fill='x')
+        ttk.Button(self.score_buttons_frame, text="🏠 Back to Menu", command=self.back_to_menu, style="TButton",
+                   takefocus=0).pack(pady=10, fill='x')
+        self.screens['score'] = screen
+        return screen
 
     def show_score(self):
         self.mode = 'score'
         self.stop_elapsed_timer()
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.show_screen(self.screens.get('score') or self.build_score_screen())
         self.add_dark_mode_button()
+        self.prepare_next_quiz()
 
-        ttk.Label(self.root, text="Quiz Complete!", font=FONT_QUESTION).pack(pady=20)
         actual_max_score = len(self.quiz_questions) * 5 if self.quiz_questions else 0
-        ttk.Label(self.root, text=f"Total Score: {self.score} / {actual_max_score} points",
-                  font=(FONT_FAMILY, 20, "bold")).pack(pady=5)
+        self.total_score_label.config(text=f"Total Score: {self.score} / {actual_max_score} points")
         final_grade = (self.score / actual_max_score) * 9 + 1 if actual_max_score > 0 else 1.0
-        ttk.Label(self.root, text=f"Final grade: {final_grade:.2f} / {10}", font=(FONT_FAMILY, 20, "bold")).pack(pady=5)
+        self.final_grade_label.config(text=f"Final grade: {final_grade:.2f} / {10}")
 
         hours, remainder = divmod(self.elapsed_seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
@@ -579,133 +1088,321 @@ class QuizApp:
         if minutes > 0 or hours > 0: time_parts.append(f"{minutes}m")
         time_parts.append(f"{seconds}s")
         time_str = " ".join(time_parts) if time_parts else "0s"
-        ttk.Label(self.root, text=f"Total Time: {time_str}", font=FONT_BUTTON).pack(pady=5)
-
-        buttons_frame = ttk.Frame(self.root)
-        buttons_frame.pack(pady=20, fill='x', padx=max(50, int(self.root.winfo_width() * 0.1)))
-        review_state = 'normal' if self.quiz_questions else 'disabled'
-        ttk.Button(buttons_frame, text="🔍 Review Answers", command=lambda: self.review_question(0), style="TButton",
-                   takefocus=0, state=review_state).pack(pady=10, fill='x')
-        start_another_state = 'normal' if self.questions else 'disabled'
-        ttk.Button(buttons_frame, text="🔄 Start Another Quiz", command=self.start_another_quiz, style="TButton",
-                   takefocus=0, state=start_another_state).pack(pady=10, fill='x')
-        ttk.Button(buttons_frame, text="🏠 Back to Menu", command=self.back_to_menu, style="TButton", takefocus=0).pack(
-            pady=10, fill='x')
+        self.total_time_label.config(text=f"Total Time: {time_str}")
 
-        # --- FIX: Lift the dark mode button to the top of the stacking order ---
-        if self.dark_mode_button:
-            self.dark_mode_button.lift()
+        self.score_buttons_frame.pack_configure(padx=max(50, int(self.root.winfo_width() * 0.1)))
+        self.review_btn.config(state='normal' if self.quiz_questions else 'disabled')
+        self.review_list_btn.config(state='normal' if self.quiz_questions else 'disabled')
+        self.start_another_btn.config(state='normal' if self.questions else 'disabled')
+
+    def build_review_screen(self):
+        screen = ttk.Frame(self.root)
+        self.review_question_label = ttk.Label(screen, text="", justify="left", font=FONT_QUESTION)
+        self.review_question_label.pack(pady=20, anchor='w', padx=20)
+
+        content_frame = ttk.Frame(screen)
+        content_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        self.review_options_frame = ttk.Frame(content_frame)
+        self.review_options_frame.pack(fill='x')
+
+        legend_frame = ttk.Frame(screen)
+        legend_frame.pack(pady=(0, 10), padx=20, anchor='w', fill='x')
+        for text_symbol, color_key in (("✅ Correct", "green"), ("❌ Wrong", "red"), ("🟠 Missed", "orange"),
+                                       ("Not presented", "disabled")):
+            lbl = tk.Label(legend_frame, text=text_symbol, font=FONT_SMALL)
+            self.theme_widget(lbl, fg=color_key, bg='bg')
+            lbl.pack(side='left', padx=6)
+
+        self.review_score_label = ttk.Label(content_frame, text="", font=(FONT_FAMILY, 14, "bold"))
+        self.review_score_label.pack(pady=12)
+
+        nav_frame = ttk.Frame(screen)
+        nav_frame.pack(side='bottom', fill='x', padx=20, pady=20)
+        nav_frame.columnconfigure(0, weight=1)
+        nav_frame.columnconfigure(1, weight=0)
+        nav_frame.columnconfigure(2, weight=1)
+        nav_frame.columnconfigure(3, weight=0)
+        nav_frame.columnconfigure(4, weight=1)
 
-    def review_question(self, index):
+        self.review_prev_btn = ttk.Button(nav_frame, text="Previous",
+                                          command=lambda: self.review_question(self.review_index - 1,
+                                                                               self.review_from_list),
+                                          style="TButton", takefocus=0)
+        score_btn = ttk.Button(nav_frame, text="Back to Score", command=self.show_score, style="TButton", takefocus=0)
+        score_btn.grid(row=0, column=2, padx=10, sticky='nsew')
+        self.review_next_btn = ttk.Button(nav_frame, text="Next",
+                                          command=lambda: self.review_question(self.review_index + 1,
+                                                                               self.review_from_list),
+                                          style="TButton", takefocus=0)
+        self.review_list_back_btn = ttk.Button(nav_frame, text="Back to List",
+                                               command=lambda: self.show_review_list(keep_position=True),
+                                               style="TButton", takefocus=0)
+        self.screens['review'] = screen
+        return screen
+
+    def review_option_label(self, index):
+        while len(self.review_option_labels) <= index:
+            self.review_option_labels.append(tk.Label(self.review_options_frame, font=FONT_OPTION, anchor='w',
+                                                      justify='left'))
+        return self.review_option_labels[index]
+
+    def review_question(self, index, from_list=False):
+        """Shows quiz question index on its own. from_list adds a way back to the review-all list it was opened from."""
         self.mode = 'review'
         self.stop_elapsed_timer()
         self.review_index = index
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        self.add_dark_mode_button()
+        self.review_from_list = from_list
 
         if not (0 <= index < len(self.quiz_questions)):
             self.show_score()
             return
 
+        self.show_screen(self.screens.get('review') or self.build_review_screen())
+        self.add_dark_mode_button()
+
         q = self.quiz_questions[index]
         question_label_wraplength = max(300, self.root.winfo_width() - 40)
-        ttk.Label(self.root, text=f"[{q.type}] {q.text}", wraplength=question_label_wraplength, justify="left",
-                  font=FONT_QUESTION).pack(pady=20, anchor='w', padx=20)
-
-        label_bg_color = self.root.cget('bg')
-        default_review_fg_color = self.default_fg_color
-        content_frame = ttk.Frame(self.root)
-        content_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        content_bg_color = self.root.cget('bg')
+        self.review_question_label.config(text=f"[{q.type}] {q.text}", wraplength=question_label_wraplength)
 
-        presented_option_texts = {opt_tuple[0] for opt_tuple in q.shuffled_options} if q.shuffled_options else set()
+        presented_option_indices = set(q.shuffled_options)
 
         user_selections_for_presented_options = {}
         if q.shuffled_options and index < len(self.user_answers) and self.user_answers[index]:
             current_q_user_selections = self.user_answers[index]
-            for i, (opt_text, _) in enumerate(q.shuffled_options):
+            for i, opt_index in enumerate(q.shuffled_options):
                 if i < len(current_q_user_selections):
-                    user_selections_for_presented_options[opt_text] = current_q_user_selections[i]
+                    user_selections_for_presented_options[opt_index] = current_q_user_selections[i]
                 else:
-                    user_selections_for_presented_options[opt_text] = 0
+                    user_selections_for_presented_options[opt_index] = 0
 
         if not q.options:
-            tk.Label(content_frame, text="No original options were defined for this question.", font=FONT_OPTION,
-                     bg=content_bg_color, fg=default_review_fg_color).pack(anchor='w', padx=40, pady=2)
+            lbl = self.review_option_label(0)
+            lbl.config(text="No original options were defined for this question.")
+            self.theme_widget(lbl, fg='fg', bg='bg')
+            show_first(self.review_option_labels, 1, anchor='w', padx=40, pady=2)
         else:
-            for original_opt_text, is_original_correct in q.options:
-                mark = ""
-                text_color_for_option = default_review_fg_color
-                display_text_suffix = ""
-
-                if original_opt_text in presented_option_texts:
-                    selected_by_user = user_selections_for_presented_options.get(original_opt_text, 0)
-
-                    if is_original_correct and selected_by_user:
-                        mark = "✅"
-                        text_color_for_option = "green"
-                    elif not is_original_correct and selected_by_user:
-                        mark = "❌"
-                        text_color_for_option = "red"
-                    elif is_original_correct and not selected_by_user:
-                        mark = "🟠"
-                        text_color_for_option = "orange"
-                    elif not is_original_correct and not selected_by_user:
-                        mark = ""
+            for opt_index, original_opt_text in enumerate(q.options):
+                if opt_index in presented_option_indices:
+                    selected_by_user = user_selections_for_presented_options.get(opt_index, 0)
+                    mark, text_color_for_option = review_mark(q.is_correct(opt_index), selected_by_user)
                 else:
-                    mark = ""
-                    text_color_for_option = self.disabled_fg_color
-                    display_text_suffix = ""
+                    mark, text_color_for_option = "", 'disabled'
 
-                full_display_text = f"{mark} {original_opt_text}{display_text_suffix}"
-                lbl = tk.Label(content_frame, text=full_display_text, font=FONT_OPTION, fg=text_color_for_option,
-                               bg=content_bg_color, anchor='w', justify='left')
-                lbl.pack(anchor='w', padx=40, pady=2)
-
-        def create_legend_label(parent, text_symbol, specific_fg_color):
-            lbl = tk.Label(parent, text=text_symbol, font=FONT_SMALL, fg=specific_fg_color, bg=label_bg_color)
-            lbl.pack(side='left', padx=6)
-
-        legend_frame = ttk.Frame(self.root)
-        legend_frame.pack(pady=(0, 10), padx=20, anchor='w', fill='x')
-        create_legend_label(legend_frame, "✅ Correct", "green")
-        create_legend_label(legend_frame, "❌ Wrong", "red")
-        create_legend_label(legend_frame, "🟠 Missed", "orange")
-        create_legend_label(legend_frame, f"Not presented", self.disabled_fg_color)
+                lbl = self.review_option_label(opt_index)
+                lbl.config(text=f"{mark} {original_opt_text}")
+                self.theme_widget(lbl, fg=text_color_for_option, bg='bg')
+            show_first(self.review_option_labels, len(q.options), anchor='w', padx=40, pady=2)
 
         q_score_breakdown = self.scores_breakdown[index] if index < len(self.scores_breakdown) else 0
         max_q_score = 5
-        ttk.Label(content_frame, text=f"Score for this question: {q_score_breakdown} / {max_q_score}",
-                  font=(FONT_FAMILY, 14, "bold")).pack(pady=12)
-
-        nav_frame = ttk.Frame(self.root)
-        nav_frame.pack(side='bottom', fill='x', padx=20, pady=20)
-        nav_frame.columnconfigure(0, weight=1)
-        nav_frame.columnconfigure(1, weight=0)
-        nav_frame.columnconfigure(2, weight=1)
-        nav_frame.columnconfigure(3, weight=0)
-        nav_frame.columnconfigure(4, weight=1)
+        self.review_score_label.config(text=f"Score for this question: {q_score_breakdown} / {max_q_score}")
 
         if index > 0:
-            prev_btn = ttk.Button(nav_frame, text="Previous", command=lambda: self.review_question(index - 1),
-                                  style="TButton", takefocus=0)
-            prev_btn.grid(row=0, column=1, padx=10, sticky='e')
-        score_btn = ttk.Button(nav_frame, text="Back to Score", command=self.show_score, style="TButton", takefocus=0)
-        score_btn.grid(row=0, column=2, padx=10, sticky='nsew')
+            self.review_prev_btn.grid(row=0, column=1, padx=10, sticky='e')
+        else:
+            self.review_prev_btn.grid_remove()
         if index < len(self.quiz_questions) - 1:
-            next_btn = ttk.Button(nav_frame, text="Next", command=lambda: self.review_question(index + 1),
-                                  style="TButton", takefocus=0)
-            next_btn.grid(row=0, column=3, padx=10, sticky='w')
+            self.review_next_btn.grid(row=0, column=3, padx=10, sticky='w')
+        else:
+            self.review_next_btn.grid_remove()
+        if from_list:
+            self.review_list_back_btn.grid(row=1, column=2, padx=10, pady=(10, 0), sticky='nsew')
+        else:
+            self.review_list_back_btn.grid_remove()
 
-        # --- FIX: Lift the dark mode button to the top of the stacking order ---
-        if self.dark_mode_button:
-            self.dark_mode_button.lift()
+    def build_review_list_screen(self):
+        screen = ttk.Frame(self.root)
+
+        filter_frame = ttk.Frame(screen)
+        filter_frame.pack(fill='x', padx=20, pady=(15, 5))
+        self.review_filter_var = tk.StringVar(value='all')
+        for text, value in (("All", 'all'), ("Only wrong", 'wrong'), ("Only missed", 'missed')):
+            ttk.Radiobutton(filter_frame, text=text, value=value, variable=self.review_filter_var,
+                            command=self.filter_review_list, takefocus=0).pack(side='left', padx=(0, 12))
+        self.review_list_count_label = ttk.Label(filter_frame, text="", font=FONT_SMALL)
+        self.review_list_count_label.pack(side='left', padx=12)
+
+        nav_frame = ttk.Frame(screen)
+        nav_frame.pack(side='bottom', fill='x', padx=20, pady=20)
+        ttk.Button(nav_frame, text="Back to Score", command=self.show_score, style="TButton", takefocus=0).pack()
+
+        list_frame = ttk.Frame(screen)
+        list_frame.pack(fill='both', expand=True, padx=20)
+        canvas = tk.Canvas(list_frame, highlightthickness=0, yscrollincrement=REVIEW_LIST_LINE_HEIGHT)
+        self.theme_widget(canvas, bg='bg')
+        scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.scroll_review_list)
+        canvas.config(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side='right', fill='y')
+        canvas.pack(side='left', fill='both', expand=True)
+
+        canvas.bind('<Configure>', lambda event: self.draw_review_list())
+        canvas.bind('<MouseWheel>', lambda event: self.scroll_review_list('scroll', -3 if event.delta > 0 else 3,
+                                                                          'units'))
+        canvas.bind('<Button-4>', lambda event: self.scroll_review_list('scroll', -3, 'units'))  # X11 wheel
+        canvas.bind('<Button-5>', lambda event: self.scroll_review_list('scroll', 3, 'units'))
+        canvas.bind('<Button-1>', self.open_review_list_line)
+        canvas.bind('<Motion>', self.show_review_list_tip)
+        canvas.bind('<Leave>', lambda event: self.hide_review_list_tip())
+        self.review_canvas = canvas
+        self.review_list_fonts = {font: tkfont.Font(root=self.root, font=font)
+                                  for font in (FONT_BUTTON, FONT_BUTTON_BOLD)}
+        self.review_list_items = []  # Canvas text items reused for whatever lines are in view
+        self.review_list_elided = {}  # Full text of the items in view that had to be cut short
+        # Shows the whole of a cut-short line under the mouse; created when first needed so it stays on top
+        self.review_tip_box = None
+        self.review_tip_text = None
+        self.review_list_indices = array('L')
+        self.review_list_line_starts = array('L')
+        self.review_list_lines = 0
+        self.screens['review_list'] = screen
+        return screen
+
+    def show_review_list(self, keep_position=False):
+        """Shows the review-all list. keep_position returns to it as it was left, with the same filter and scroll."""
+        self.mode = 'review_list'
+        self.stop_elapsed_timer()
+        self.show_screen(self.screens.get('review_list') or self.build_review_list_screen())
+        self.add_dark_mode_button()
+        if keep_position:
+            self.draw_review_list()
+        else:
+            self.filter_review_list()
+
+    def review_selections(self, index):
+        """(option index, selected, correct) for each option presented in quiz question index."""
+        q = self.quiz_questions[index]
+        answers = self.user_answers[index] if index < len(self.user_answers) else []
+        return [(opt_index, i < len(answers) and bool(answers[i]), q.is_correct(opt_index))
+                for i, opt_index in enumerate(q.shuffled_options)]
+
+    def filter_review_list(self):
+        """
+        Lays out the questions that pass the filter as a run of equal-height lines: a header, one line per
+        presented option and a blank gap. Only where each question starts is stored; the lines
+        themselves are made up while drawing.
+        """
+        wanted = self.review_filter_var.get()
+        self.review_list_indices = array('L')
+        self.review_list_line_starts = array('L')
+        num_lines = 0
+        for index, q in enumerate(self.quiz_questions):
+            if wanted != 'all':
+                selections = self.review_selections(index)
+                if wanted == 'wrong' and not any(selected and not correct for _, selected, correct in selections):
+                    continue
+                if wanted == 'missed' and not any(correct and not selected for _, selected, correct in selections):
+                    continue
+            self.review_list_indices.append(index)
+            self.review_list_line_starts.append(num_lines)
+            num_lines += len(q.shuffled_options) + 2
+        self.review_list_lines = num_lines
+
+        self.review_list_count_label.config(
+            text=f"Showing {len(self.review_list_indices)} of {len(self.quiz_questions)} questions")
+        self.review_canvas.config(scrollregion=(0, 0, 0, num_lines * REVIEW_LIST_LINE_HEIGHT))
+        self.review_canvas.yview_moveto(0)
+        self.draw_review_list()
+
+    def review_list_row(self, line):
+        """Position in review_list_indices of the question that line belongs to."""
+        return bisect_right(self.review_list_line_starts, line) - 1
+
+    def draw_review_list(self):
+        """
+        Draws the lines in view, so the canvas holds about one screenful of items however long the quiz.
+        Lines too long for the canvas end in an ellipsis; show_review_list_tip shows them whole.
+        """
+        canvas = self.review_canvas
+        self.hide_review_list_tip()
+        self.review_list_elided = {}
+        width = canvas.winfo_width() - REVIEW_LIST_MARGIN
+        top = int(canvas.canvasy(0))
+        first_line = top // REVIEW_LIST_LINE_HEIGHT
+        last_line = min(self.review_list_lines, (top + canvas.winfo_height()) // REVIEW_LIST_LINE_HEIGHT + 1)
+
+        used = 0
+        row = None
+        for line in range(first_line, last_line):
+            if row is None or line >= row_end:
+                row = self.review_list_row(line)
+                index = self.review_list_indices[row]
+                q = self.quiz_questions[index]
+                selections = self.review_selections(index)
+                row_start = self.review_list_line_starts[row]
+                row_end = row_start + len(q.shuffled_options) + 2
+
+            offset = line - row_start
+            if offset == 0:
+                q_score = self.scores_breakdown[index] if index < len(self.scores_breakdown) else 0
+                text = f"{index + 1}. [{q.type}] {q.text}   ({q_score} / 5)"
+                color_key, font, x = 'fg', FONT_BUTTON_BOLD, 0
+            elif offset <= len(selections):
+                opt_index, selected, correct = selections[offset - 1]
+                mark, color_key = review_mark(correct, selected)
+                text, font, x = f"{mark} {q.options[opt_index]}", FONT_BUTTON, 30
+            else:
+                continue  # Gap between questions
+
+            if used == len(self.review_list_items):
+                self.review_list_items.append(canvas.create_text(0, 0, anchor='nw'))
+            item = self.review_list_items[used]
+            shown_text = elide_text(text, self.review_list_fonts[font], width - x)
+            if shown_text != text:
+                self.review_list_elided[item] = text
+            canvas.itemconfig(item, text=shown_text, font=font, fill=self.theme_colors.get(color_key, color_key),
+                              state='normal')
+            canvas.coords(item, x, line * REVIEW_LIST_LINE_HEIGHT + 4)
+            used += 1
+
+        for item in self.review_list_items[used:]:
+            canvas.itemconfig(item, state='hidden')
+
+    def scroll_review_list(self, *args):
+        self.review_canvas.yview(*args)
+        self.draw_review_list()
+
+    def open_review_list_line(self, event):
+        line = int(self.review_canvas.canvasy(event.y)) // REVIEW_LIST_LINE_HEIGHT
+        if 0 <= line < self.review_list_lines:
+            self.review_question(self.review_list_indices[self.review_list_row(line)], from_list=True)
+
+    def show_review_list_tip(self, event):
+        canvas = self.review_canvas
+        x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
+        full_text = None
+        for item in canvas.find_overlapping(x, y, x, y):
+            full_text = self.review_list_elided.get(item, full_text)
+        if full_text is None:
+            self.hide_review_list_tip()
+            return
+
+        if self.review_tip_text is None:
+            self.review_tip_box = canvas.create_rectangle(0, 0, 0, 0)
+            self.review_tip_text = canvas.create_text(0, 0, anchor='nw', font=FONT_BUTTON)
+        fg, bg = self.theme_colors.get('fg', 'black'), self.theme_colors.get('bg', 'white')
+        canvas.itemconfig(self.review_tip_text, text=full_text, fill=fg, state='normal',
+                          width=max(100, canvas.winfo_width() - 4 * REVIEW_LIST_MARGIN))
+        # Below the line under the mouse, or above it if that would run off the bottom of the canvas
+        tip_y = (y // REVIEW_LIST_LINE_HEIGHT + 1) * REVIEW_LIST_LINE_HEIGHT
+        canvas.coords(self.review_tip_text, 2 * REVIEW_LIST_MARGIN, tip_y)
+        _, top, _, bottom = canvas.bbox(self.review_tip_text)
+        if bottom > canvas.canvasy(canvas.winfo_height()):
+            tip_y -= REVIEW_LIST_LINE_HEIGHT + bottom - top
+            canvas.coords(self.review_tip_text, 2 * REVIEW_LIST_MARGIN, tip_y)
+        left, top, right, bottom = canvas.bbox(self.review_tip_text)
+        canvas.coords(self.review_tip_box, left - 6, top - 4, right + 6, bottom + 4)
+        canvas.itemconfig(self.review_tip_box, fill=bg, outline=fg, state='normal')
+        canvas.tag_raise(self.review_tip_box)
+        canvas.tag_raise(self.review_tip_text)
+
+    def hide_review_list_tip(self):
+        if self.review_tip_text is not None:
+            self.review_canvas.itemconfig(self.review_tip_box, state='hidden')
+            self.review_canvas.itemconfig(self.review_tip_text, state='hidden')
 
     def start_another_quiz(self):
-        self.root.geometry(DEFAULT_MENU_SIZE)  # Reset to menu size
-        self.center_window()
-        self.main_menu()  # Go back to main menu to select number of questions
+        # Same bank and number of questions, usually with the quiz prepared while the score was shown
+        self.start_quiz()
 
     def back_to_menu(self):
         self.root.geometry(DEFAULT_MENU_SIZE)  # Reset to menu size
@@ -739,6 +1436,7 @@ class QuizApp:
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # Needed by the bank loading process pool in frozen Windows builds
     root = tk.Tk()
     app = QuizApp(root)
     root.mainloop()
\ No newline at end of file
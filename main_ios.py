@@ -43,20 +43,200 @@
 
 import ui
 import dialogs
+import functools
 import random
 import re
 import time
 import json
+import os
+import queue
+import threading
+from array import array
+
+
+POSITION_TYPECODE = 'L'  # array typecode for positions of questions in the loaded bank
+TEXT_HEIGHT_CACHE_SIZE = 2048  # Wrapped-text heights kept by measure_text_height
+QUIZ_SEED_BITS = 32  # A quiz is rebuilt exactly from (bank, seed, number of questions)
 
 
 class Question:
-    def __init__(self, q_number, text, options):
+    __slots__ = ('q_number', 'text', 'options', 'correct_mask', 'option_partition', 'num_correct',
+                 'shuffled_options', 'type')
+
+    def __init__(self, q_number, text, options, correct_mask):
         self.q_number = q_number
         self.text = text
-        self.options = options
-        self.shuffled_options = []
+        self.options = options  # Tuple of option texts
+        self.correct_mask = correct_mask  # Bit i is set when options[i] is correct
+        # Indices of the correct options followed by the incorrect ones, split once at load time
+        correct = [i for i in range(len(options)) if (correct_mask >> i) & 1]
+        incorrect = [i for i in range(len(options)) if not (correct_mask >> i) & 1]
+        self.option_partition = array('H', correct + incorrect)
+        self.num_correct = len(correct)
+        self.shuffled_options = ()  # array('H') of indices into options, in the order shown
         self.type = None
 
+    def is_correct(self, option_index):
+        return (self.correct_mask >> option_index) & 1 == 1
+
+    @property
+    def correct_options(self):
+        return self.option_partition[:self.num_correct]
+
+    @property
+    def incorrect_options(self):
+        return self.option_partition[self.num_correct:]
+
+    def can_make_cs(self):
+        """True if the question has enough options for 1 correct + 4 incorrect."""
+        return self.num_correct >= 1 and len(self.options) - self.num_correct >= 4
+
+    def can_make_cm(self):
+        """True if the question has enough options for 2-4 correct with the rest incorrect."""
+        max_correct = min(4, self.num_correct)
+        return max_correct >= 2 and len(self.options) - self.num_correct >= 5 - max_correct
+
+
+QUESTION_HEADER_RE = re.compile(r'(?:\\s*)?(\d+)\.\s*')
+OPTION_LINE_RE = re.compile(r'^[a-j]\.\s+(?:\\s*)?\[(y|x)\]\s+(.*)')
+
+
+def _iter_question_blocks(lines):
+    """
+    Groups the lines of a question bank into (number, block_content) pairs, one block at a time.
+
+    A line starting with a question number opens a new block. A header with nothing after the
+    number takes the next non-blank line as its question text.
+    """
+    q_number_str = None
+    block_lines = []
+    at_file_start = True
+    waiting_for_text = False
+
+    for line in lines:
+        line = line.rstrip('\n')
+        if at_file_start:
+            if not line.strip():
+                continue
+            line = line.lstrip()
+            at_file_start = False
+
+        if waiting_for_text:
+            if line.strip():
+                block_lines.append(line.lstrip())
+                waiting_for_text = False
+            continue
+
+        match = QUESTION_HEADER_RE.match(line)
+        if match:
+            if q_number_str is not None:
+                yield q_number_str, '\n'.join(block_lines)
+            q_number_str = match.group(1)
+            block_lines = [line[match.end():]]
+            waiting_for_text = not block_lines[0]
+        elif q_number_str is not None:
+            block_lines.append(line)
+
+    if q_number_str is not None:
+        yield q_number_str, '\n'.join(block_lines)
+
+
+def _build_question(q_number_str, block_content):
+    lines = block_content.strip().split('\n')
+    question_text = lines[0].strip()
+    options = []
+    correct_mask = 0
+
+    for line in lines[1:]:
+        line = line.strip()
+        if not line:
+            continue
+
+        match = OPTION_LINE_RE.match(line)
+
+        if match:
+            correctness, text = match.groups()
+            if correctness == 'y':
+                correct_mask |= 1 << len(options)
+            options.append(text.strip())
+
+    if question_text and options:
+        return Question(int(q_number_str), question_text, tuple(options), correct_mask)
+    return None
+
+
+def iter_questions_from_file(file_path):
+    """
+    Yields Question objects from a text file with multiple-choice questions as it reads it.
+
+    The file is read line by line, so the first questions are available before the rest of the
+    file has been parsed.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for q_number_str, block_content in _iter_question_blocks(f):
+            question = _build_question(q_number_str, block_content)
+            if question:
+                yield question
+
+
+def index_questions(questions):
+    """
+    Indexes a freshly loaded bank once, so starting a quiz never has to scan it.
+
+    Returns an array with the positions in questions of those that can make at least one valid quiz
+    item. Which item types a question can make is answered by its own can_make_cs / can_make_cm.
+    """
+    quiz_ready = array(POSITION_TYPECODE)
+    for position, q in enumerate(questions):
+        if q.can_make_cs() or q.can_make_cm():
+            quiz_ready.append(position)
+    return quiz_ready
+
+
+def build_quiz_item(q, rng=random):
+    """
+    Picks q.type and q.shuffled_options for one quiz item. q must be quiz-ready.
+
+    Only types and correct-option counts that q can actually fill are drawn, so this never fails.
+    """
+    can_cs, can_cm = q.can_make_cs(), q.can_make_cm()
+    q.type = rng.choice(['CS', 'CM']) if can_cs and can_cm else ('CS' if can_cs else 'CM')
+    if q.type == 'CS':
+        shuffled = rng.sample(q.correct_options, 1) + rng.sample(q.incorrect_options, 4)
+    else:
+        num_incorrect = len(q.options) - q.num_correct
+        n_correct = rng.randint(max(2, 5 - num_incorrect), min(4, q.num_correct))
+        shuffled = rng.sample(q.correct_options, n_correct) + rng.sample(q.incorrect_options, 5 - n_correct)
+    rng.shuffle(shuffled)
+    q.shuffled_options = array('H', shuffled)
+
+
+def sample_quiz(questions, quiz_ready, num, rng=random):
+    """Returns exactly min(num, len(quiz_ready)) questions with their quiz items built, in one pass."""
+    positions = rng.sample(quiz_ready, min(num, len(quiz_ready)))
+    quiz = []
+    for position in positions:
+        q = questions[position]
+        build_quiz_item(q, rng)
+        quiz.append(q)
+    return quiz
+
+
+def rebuild_quiz(questions, quiz_ready, num, seed):
+    """Builds the quiz that start_quiz gave for this seed, as long as the bank is unchanged."""
+    return sample_quiz(questions, quiz_ready, num, random.Random(seed))
+
+
+def score_answer(q, user_res):
+    """Points for one quiz item given the switch values in shuffled order."""
+    correct_res = [q.is_correct(i) for i in q.shuffled_options]
+    selected_count = sum(user_res)
+    if q.type == 'CS':
+        return 5 if selected_count == 1 and user_res == correct_res else 0
+    if q.type == 'CM' and 2 <= selected_count <= 4:
+        return max(0, 5 - sum(1 for u, c in zip(user_res, correct_res) if u != c))
+    return 0
+
 
 def parse_questions_from_file(file_path):
     """
@@ -65,45 +245,149 @@ def parse_questions_from_file(file_path):
     The function is designed to handle blocks of questions separated by blank lines.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        return list(iter_questions_from_file(file_path))
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' was not found.")
         return []
 
-    questions = []
-    blocks = re.findall(r'(?s)(?m)^(?:\\s*)?(\d+)\.\s*(.*?)(?=\n(?:\\s*)?\d+\.\s*|\Z)', content.strip())
 
-    for q_number_str, block_content in blocks:
-        q_number = int(q_number_str)
-        lines = block_content.strip().split('\n')
-        question_text = lines[0].strip()
-        options = []
+def write_file_atomic(file_path, data):
+    """Writes data (str or bytes) to a temp file next to file_path, then renames it into place."""
+    temp_path = file_path + ".tmp"
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    with open(temp_path, mode) as f:
+        f.write(data)
+    os.replace(temp_path, file_path)
 
-        for line in lines[1:]:
-            line = line.strip()
-            if not line:
-                continue
 
-            match = re.match(r'^[a-j]\.\s+(?:\\s*)?\[(y|x)\]\s+(.*)', line)
+class PersistenceWriter:
+    """
+    Background thread for the app's file writes, so the UI thread never waits on the disk.
+
+    write_file() calls for the same path that are still queued collapse into one write of the latest
+    data. submit() runs any other job (appends, database inserts) on the same thread, in order.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._pending_files = {}
+        self._lock = threading.Lock()
+        # Pythonista keeps the interpreter alive after the view closes, so a daemon thread still drains
+        self._thread = threading.Thread(target=self._run, name="PersistenceWriter", daemon=True)
+        self._thread.start()
+
+    def write_file(self, file_path, data):
+        with self._lock:
+            already_queued = file_path in self._pending_files
+            self._pending_files[file_path] = data
+        if not already_queued:
+            self._queue.put((self._write_pending_file, (file_path,)))
+
+    def submit(self, job, *args):
+        self._queue.put((job, args))
+
+    def flush(self):
+        """Blocks until everything queued so far has been written."""
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _write_pending_file(self, file_path):
+        with self._lock:
+            data = self._pending_files.pop(file_path)
+        write_file_atomic(file_path, data)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                job, args = item
+                job(*args)
+            except Exception as e:
+                print(f"Error: Background write failed: {e}")
+            finally:
+                self._queue.task_done()
+
+
+class ViewPool:
+    """
+    Recycles the labels, switches and buttons of cleared screens, so stepping through questions and
+    review pages reuses the same option rows and buttons instead of allocating new views each time.
+
+    get() hands out a recycled view (or a new one) with the attributes that differ between screens
+    reset to their defaults, then applies the given ones.
+    """
+
+    DEFAULTS = {
+        ui.Label: {'alignment': ui.ALIGN_LEFT, 'number_of_lines': 1, 'flex': ''},
+        ui.Switch: {'value': False, 'enabled': True, 'flex': '', 'action': None},
+        ui.Button: {'title': '', 'enabled': True, 'flex': '', 'action': None},
+    }
+
+    def __init__(self):
+        self._free = {view_class: [] for view_class in self.DEFAULTS}
+        self.created = 0
+        self.reused = 0
+
+    def get(self, view_class, **attrs):
+        free = self._free[view_class]
+        if free:
+            view = free.pop()
+            self.reused += 1
+        else:
+            view = view_class()
+            self.created += 1
+        for attr, value in self.DEFAULTS[view_class].items():
+            setattr(view, attr, value)
+        for attr, value in attrs.items():
+            setattr(view, attr, value)
+        return view
+
+    def recycle(self, view):
+        """Takes back a view removed from the screen. Views of other kinds are left to be freed."""
+        free = self._free.get(type(view))
+        if free is not None:
+            view.action = None  # Drop the old screen's callback
+            free.append(view)
+
+
+@functools.lru_cache(maxsize=TEXT_HEIGHT_CACHE_SIZE)
+def measure_text_height(text, width, font_name, font_size):
+    """
+    Height of text wrapped to width, measured with a throwaway label. Sizing labels is the slow part of
+    laying out a screen, so results are kept in an LRU cache; measure_text_height.cache_info() has the
+    hit and miss counts.
+    """
+    temp_label = ui.Label(text=text, font=(font_name, font_size), number_of_lines=0)
+    temp_label.width = width
+    temp_label.size_to_fit()
+    return temp_label.height
 
-            if match:
-                correctness, text = match.groups()
-                options.append((text.strip(), correctness == 'y'))
 
-        if question_text and options:
-            questions.append(Question(q_number, question_text, options))
+class QuizView(ui.View):
+    """The app's root view. Pythonista calls will_close when the user closes it, the app's only exit."""
 
-    return questions
+    def __init__(self, on_close):
+        self.on_close = on_close
+
+    def will_close(self):
+        self.on_close()
 
 
 class QuizApp:
     def __init__(self):
-        self.main_view = ui.View()
+        self.main_view = QuizView(self.on_closing)
+        self.view_pool = ViewPool()
         self.main_view.name = "Quiz App"
         self.main_view.frame = (0, 0, 600, 800)
         self.questions = []
+        self.quiz_ready = array(POSITION_TYPECODE)
         self.quiz_questions = []
+        self.quiz_seed = None
         self.current_question_index = 0
         self.user_answers = []
         self.score = 0
@@ -111,6 +395,7 @@ class QuizApp:
         self.num_questions = 5
         self.start_time = 0
         self.is_presented = False
+        self.measured_width = None  # main_view width the text height cache was filled for
 
         self.user_name_for_copyright = "Capatina Nicolae"
         self.current_year_for_copyright = time.strftime("%Y")
@@ -135,6 +420,8 @@ class QuizApp:
             }
         }
         self.dark_mode_enabled = False
+        self.themed_views = []  # (view, attribute, theme key) of the current screen
+        self.writer = PersistenceWriter()
         self.load_settings()
         self.current_theme = self.themes['dark'] if self.dark_mode_enabled else self.themes['light']
 
@@ -142,15 +429,16 @@ class QuizApp:
 
     def _get_wrapped_text_height(self, text, width, font_name, font_size):
         """Calculates the height of a text string when wrapped to a given width."""
-        temp_label = ui.Label(text=text, font=(font_name, font_size), number_of_lines=0)
-        temp_label.width = width
-        temp_label.size_to_fit()
-        return temp_label.height
+        if self.measured_width != self.main_view.width:
+            # Rotated or resized: every width used for layout changes, so the old heights won't be asked for again
+            measure_text_height.cache_clear()
+            self.measured_width = self.main_view.width
+        return measure_text_height(text, width, font_name, font_size)
 
     def _add_copyright_label(self):
-        copyright_label = ui.Label(text=self.copyright_text_string)
+        copyright_label = self.view_pool.get(ui.Label, text=self.copyright_text_string)
         copyright_label.font = ('Helvetica', 9)
-        copyright_label.text_color = self.get_theme_color('copyright_text_color', self.get_theme_color('progress_text'))
+        self.theme_view(copyright_label, text_color='copyright_text_color')
         copyright_label.alignment = ui.ALIGN_RIGHT
         text_width, text_height = ui.measure_string(
             copyright_label.text, font=copyright_label.font, alignment=copyright_label.alignment
@@ -166,6 +454,9 @@ class QuizApp:
         copyright_label.flex = 'RB'
         self.main_view.add_subview(copyright_label)
 
+    def on_closing(self):
+        self.writer.close()  # Waits for queued writes to reach the disk
+
     def load_settings(self):
         try:
             with open('quiz_settings.json', 'r') as f:
@@ -176,18 +467,27 @@ class QuizApp:
 
     def save_settings(self):
         settings = {'dark_mode_enabled': self.dark_mode_enabled}
-        try:
-            with open('quiz_settings.json', 'w') as f:
-                json.dump(settings, f)
-        except IOError:
-            print("Error: Could not save theme settings.")
+        self.writer.write_file('quiz_settings.json', json.dumps(settings))
 
     def get_theme_color(self, key, default='black'):
         return self.current_theme.get(key, default)
 
+    def theme_view(self, view, **color_keys):
+        """Sets view attributes to theme colors and remembers them, so apply_theme can recolor the view in place."""
+        for attr, key in color_keys.items():
+            setattr(view, attr, self.get_theme_color(key))
+            self.themed_views.append((view, attr, key))
+
+    def apply_theme(self):
+        self.main_view.background_color = self.get_theme_color('bg')
+        for view, attr, key in self.themed_views:
+            setattr(view, attr, self.get_theme_color(key))
+
     def clear_view(self):
         for subview in list(self.main_view.subviews):
             self.main_view.remove_subview(subview)
+            self.view_pool.recycle(subview)
+        self.themed_views = []
 
     def format_time(self, seconds):
         if seconds < 60: return f"{seconds} seconds"
@@ -204,48 +504,50 @@ class QuizApp:
         self.dark_mode_enabled = sender.value
         self.current_theme = self.themes['dark'] if self.dark_mode_enabled else self.themes['light']
         self.save_settings()
-        self.main_menu()
+        self.apply_theme()  # Recolors the menu in place instead of rebuilding it
 
     def main_menu(self):
         self.main_view.background_color = self.get_theme_color('bg')
         self.clear_view()
         self.main_view.flex = 'WH'
 
-        title_label = ui.Label(text='Quiz App', font=('Helvetica-Bold', 32), alignment=ui.ALIGN_CENTER)
-        title_label.text_color = self.get_theme_color('text')
+        title_label = self.view_pool.get(ui.Label, text='Quiz App', font=('Helvetica-Bold', 32),
+                                         alignment=ui.ALIGN_CENTER)
+        self.theme_view(title_label, text_color='text')
         title_label.frame = (0, 60, self.main_view.width, 50);
         title_label.flex = 'W'
         self.main_view.add_subview(title_label)
 
-        load_btn = ui.Button(title='Load Quiz File', font=('Helvetica', 18))
-        load_btn.background_color = self.get_theme_color('button_bg');
-        load_btn.tint_color = self.get_theme_color('button_text')
+        load_btn = self.view_pool.get(ui.Button, title='Load Quiz File', font=('Helvetica', 18))
+        self.theme_view(load_btn, background_color='button_bg');
+        self.theme_view(load_btn, tint_color='button_text')
         load_btn.corner_radius = 8;
         load_btn.frame = (80, 150, self.main_view.width - 160, 50);
         load_btn.flex = 'W'
         load_btn.action = self.load_file;
         self.main_view.add_subview(load_btn)
 
-        num_q_label = ui.Label(text='Number of questions:', alignment=ui.ALIGN_CENTER, font=('Helvetica', 16))
-        num_q_label.text_color = self.get_theme_color('text')
+        num_q_label = self.view_pool.get(ui.Label, text='Number of questions:', alignment=ui.ALIGN_CENTER,
+                                         font=('Helvetica', 16))
+        self.theme_view(num_q_label, text_color='text')
         num_q_label.frame = (0, 230, self.main_view.width, 40);
         num_q_label.flex = 'W'
         self.main_view.add_subview(num_q_label)
 
         self.num_field = ui.TextField(text='5', alignment=ui.ALIGN_CENTER, keyboard_type=ui.KEYBOARD_NUMBER_PAD,
                                       font=('Helvetica', 18))
-        self.num_field.background_color = self.get_theme_color('textfield_bg');
-        self.num_field.text_color = self.get_theme_color('textfield_text')
-        self.num_field.tint_color = self.get_theme_color('text');
+        self.theme_view(self.num_field, background_color='textfield_bg');
+        self.theme_view(self.num_field, text_color='textfield_text')
+        self.theme_view(self.num_field, tint_color='text');
         self.num_field.bordered = False;
         self.num_field.corner_radius = 5
         self.num_field.frame = (self.main_view.width / 2 - 60, 280, 120, 40);
         self.num_field.flex = 'LR'
         self.main_view.add_subview(self.num_field)
 
-        start_btn = ui.Button(title='Start Quiz', font=('Helvetica', 18))
-        start_btn.background_color = self.get_theme_color('button_bg');
-        start_btn.tint_color = self.get_theme_color('button_text')
+        start_btn = self.view_pool.get(ui.Button, title='Start Quiz', font=('Helvetica', 18))
+        self.theme_view(start_btn, background_color='button_bg');
+        self.theme_view(start_btn, tint_color='button_text')
         start_btn.corner_radius = 8;
         start_btn.frame = (80, 360, self.main_view.width - 160, 50);
         start_btn.flex = 'W'
@@ -253,16 +555,16 @@ class QuizApp:
         self.main_view.add_subview(start_btn)
 
         dark_mode_y_pos = 430
-        dark_mode_label = ui.Label(text='Dark Mode:', font=('Helvetica', 16))
-        dark_mode_label.text_color = self.get_theme_color('text')
+        dark_mode_label = self.view_pool.get(ui.Label, text='Dark Mode:', font=('Helvetica', 16))
+        self.theme_view(dark_mode_label, text_color='text')
         dark_mode_label.frame = (80, dark_mode_y_pos, 150, 40);
         dark_mode_label.flex = 'W'
         self.main_view.add_subview(dark_mode_label)
 
-        self.dark_mode_switch = ui.Switch(value=self.dark_mode_enabled)
+        self.dark_mode_switch = self.view_pool.get(ui.Switch, value=self.dark_mode_enabled)
         self.dark_mode_switch.frame = (self.main_view.width - 80 - 80, dark_mode_y_pos + 4, 80, 32);
         self.dark_mode_switch.flex = 'L'
-        self.dark_mode_switch.tint_color = self.get_theme_color('switch_tint');
+        self.theme_view(self.dark_mode_switch, tint_color='switch_tint');
         self.dark_mode_switch.action = self.toggle_dark_mode
         self.main_view.add_subview(self.dark_mode_switch)
 
@@ -277,11 +579,12 @@ class QuizApp:
             file_path = dialogs.pick_document(types=['public.text'])
             if file_path:
                 self.questions = parse_questions_from_file(file_path)
+                self.quiz_ready = index_questions(self.questions)
                 dialogs.alert('Loaded', f'{len(self.questions)} questions loaded.', button1='OK')
         except Exception as e:
             dialogs.alert('Error', f'Failed to load or parse the file.\n\n{e}', button1='OK')
 
-    def start_quiz(self, sender):
+    def start_quiz(self, sender, seed=None):
         try:
             num = int(self.num_field.text)
         except ValueError:
@@ -295,12 +598,9 @@ class QuizApp:
             dialogs.alert("Info", "Number of questions is 0. No quiz will start.", button1='OK');
             return
 
-        self.quiz_questions = []
-        available_questions = [q for q in self.questions if
-                               len(q.options) >= 5 and sum(1 for opt, is_c in q.options if is_c) > 0]
-
-        if len(available_questions) < self.num_questions:
-            actual_num = len(available_questions)
+        # Questions that can make a valid item were indexed when the file was loaded
+        if len(self.quiz_ready) < self.num_questions:
+            actual_num = len(self.quiz_ready)
             if actual_num == 0:
                 dialogs.alert("Quiz Error", "No valid questions found. Check file.", button1='OK');
                 return
@@ -308,35 +608,9 @@ class QuizApp:
                           button1='OK')
             self.num_questions = actual_num
 
-        temp_questions_to_process = random.sample(available_questions, self.num_questions)
-        for q_original in temp_questions_to_process:
-            q = q_original
-            correct_options = [opt for opt in q.options if opt[1]];
-            incorrect_options = [opt for opt in q.options if not opt[1]]
-            q.type = random.choice(['CS', 'CM']);
-            current_q_shuffled_options = []
-            if q.type == 'CS':
-                if correct_options and len(incorrect_options) >= 4:
-                    current_q_shuffled_options = random.sample(correct_options, 1) + random.sample(incorrect_options, 4)
-                else:
-                    continue
-            else:
-                min_correct_cm = 2;
-                max_correct_cm = min(4, len(correct_options))
-                if max_correct_cm < min_correct_cm: continue
-                n_correct = random.randint(min_correct_cm, max_correct_cm);
-                n_incorrect = 5 - n_correct
-                if len(incorrect_options) < n_incorrect: continue
-                current_q_shuffled_options = random.sample(correct_options, n_correct) + random.sample(
-                    incorrect_options, n_incorrect)
-            if not current_q_shuffled_options or len(current_q_shuffled_options) != 5: continue
-            random.shuffle(current_q_shuffled_options);
-            q.shuffled_options = current_q_shuffled_options
-            self.quiz_questions.append(q)
-
-        if not self.quiz_questions:
-            dialogs.alert("Quiz Error", "Failed to prepare questions.", button1='OK');
-            return
+        # Every random choice of the quiz comes from this seed, so results only need to keep the seed
+        self.quiz_seed = random.getrandbits(QUIZ_SEED_BITS) if seed is None else seed;
+        self.quiz_questions = rebuild_quiz(self.questions, self.quiz_ready, self.num_questions, self.quiz_seed)
 
         self.current_question_index = 0;
         self.user_answers = [];
@@ -357,8 +631,9 @@ class QuizApp:
 
         progress_text = (f"Question {self.current_question_index + 1} of {len(self.quiz_questions)} "
                          f"(Original #{q.q_number})")
-        progress_label = ui.Label(text=progress_text, font=('Helvetica', 14), alignment=ui.ALIGN_CENTER)
-        progress_label.text_color = self.get_theme_color('progress_text')
+        progress_label = self.view_pool.get(ui.Label, text=progress_text, font=('Helvetica', 14),
+                                            alignment=ui.ALIGN_CENTER)
+        self.theme_view(progress_label, text_color='progress_text')
         progress_label.frame = (0, 20, self.main_view.width, 30);
         progress_label.flex = 'W'
         self.main_view.add_subview(progress_label)
@@ -367,8 +642,8 @@ class QuizApp:
         q_text_with_type = f"{q.type}: {q.text}"
         q_label_height = self._get_wrapped_text_height(q_text_with_type, q_label_width, 'Helvetica', 16)
 
-        q_label = ui.Label(text=q_text_with_type, number_of_lines=0, font=('Helvetica', 16))
-        q_label.text_color = self.get_theme_color('text')
+        q_label = self.view_pool.get(ui.Label, text=q_text_with_type, number_of_lines=0, font=('Helvetica', 16))
+        self.theme_view(q_label, text_color='text')
         q_label.frame = (20, 60, q_label_width, q_label_height)
         q_label.flex = 'W'
         self.main_view.add_subview(q_label)
@@ -377,19 +652,21 @@ class QuizApp:
         y_pos = q_label.y + q_label.height + 20
         opt_v_margin = 15
 
-        for opt_text, _ in q.shuffled_options:
+        for opt_index in q.shuffled_options:
+            opt_text = q.options[opt_index]
             lbl_width = self.main_view.width - 130
             lbl_height = self._get_wrapped_text_height(opt_text, lbl_width, 'Helvetica', 14)
 
             row_height = max(40, lbl_height)
 
-            sw = ui.Switch()
+            sw = self.view_pool.get(ui.Switch)
             sw.frame = (30, y_pos + (row_height / 2) - (sw.height / 2), 60, 40)
-            sw.tint_color = self.get_theme_color('switch_tint')
+            self.theme_view(sw, tint_color='switch_tint')
+            sw.action = self.answer_changed
             self.main_view.add_subview(sw)
 
-            lbl = ui.Label(text=opt_text, number_of_lines=0, font=('Helvetica', 14))
-            lbl.text_color = self.get_theme_color('text')
+            lbl = self.view_pool.get(ui.Label, text=opt_text, number_of_lines=0, font=('Helvetica', 14))
+            self.theme_view(lbl, text_color='text')
             lbl.frame = (100, y_pos + (row_height / 2) - (lbl_height / 2), lbl_width, lbl_height)
             lbl.flex = 'W'
             self.main_view.add_subview(lbl)
@@ -397,9 +674,9 @@ class QuizApp:
             self.vars.append(sw)
             y_pos += row_height + opt_v_margin
 
-        next_btn = ui.Button(title='Next', font=('Helvetica', 18))
-        next_btn.background_color = self.get_theme_color('button_bg');
-        next_btn.tint_color = self.get_theme_color('button_text')
+        next_btn = self.view_pool.get(ui.Button, title='Next', font=('Helvetica', 18))
+        self.theme_view(next_btn, background_color='button_bg');
+        self.theme_view(next_btn, tint_color='button_text')
         next_btn.corner_radius = 8
         next_btn.frame = (80, y_pos, self.main_view.width - 160, 50);
         next_btn.flex = 'W'
@@ -408,24 +685,29 @@ class QuizApp:
 
         self._add_copyright_label()
 
+    def record_answer(self, index, user_res):
+        """
+        Stores the answer to quiz item index and moves the running score by the change in its points.
+
+        Answering an item again replaces its old answer instead of adding a second one.
+        """
+        q = self.quiz_questions[index]
+        q_score = score_answer(q, user_res)
+        if index < len(self.user_answers):
+            self.score += q_score - self.scores_breakdown[index]
+            self.user_answers[index] = (q, user_res)
+            self.scores_breakdown[index] = q_score
+        else:
+            self.score += q_score;
+            self.user_answers.append((q, user_res))
+            self.scores_breakdown.append(q_score)
+
+    def answer_changed(self, sender):
+        # Keeps the running score current while the user flips switches
+        self.record_answer(self.current_question_index, [var.value for var in self.vars])
+
     def next_question(self, sender):
-        q = self.quiz_questions[self.current_question_index];
-        user_res = [var.value for var in self.vars]
-        correct_res = [is_c for _, is_c in q.shuffled_options];
-        self.user_answers.append((q, user_res))
-        q_score = 0
-        if q.type == 'CS':
-            if sum(user_res) == 1 and user_res == correct_res: q_score = 5
-        elif q.type == 'CM':
-            selected_count = sum(user_res);
-            num_correct_opts = sum(1 for _, is_c in q.shuffled_options if is_c)
-            if 2 <= selected_count <= 4:
-                q_score = 5
-                for u, c in zip(user_res, correct_res):
-                    if u != c: q_score -= 1
-                q_score = max(0, q_score)
-        self.score += q_score;
-        self.scores_breakdown.append(q_score)
+        self.record_answer(self.current_question_index, [var.value for var in self.vars])
         self.current_question_index += 1
         if self.current_question_index >= len(self.quiz_questions):
             self.show_score()
@@ -440,24 +722,25 @@ class QuizApp:
         grade = self.calculate_grade(self.score, total_possible);
         time_str = self.format_time(duration)
         summary = f'Quiz Completed!\nScore: {self.score}/{total_possible}\nGrade: {grade}\nTime: {time_str}'
-        score_lbl = ui.Label(text=summary, number_of_lines=0, alignment=ui.ALIGN_CENTER, font=('Helvetica', 20))
-        score_lbl.text_color = self.get_theme_color('text')
+        score_lbl = self.view_pool.get(ui.Label, text=summary, number_of_lines=0, alignment=ui.ALIGN_CENTER,
+                                       font=('Helvetica', 20))
+        self.theme_view(score_lbl, text_color='text')
         score_lbl.frame = (20, 150, self.main_view.width - 40, 150);
         score_lbl.flex = 'W'
         self.main_view.add_subview(score_lbl)
 
-        review_btn = ui.Button(title='Review Answers', font=('Helvetica', 18))
-        review_btn.background_color = self.get_theme_color('button_bg');
-        review_btn.tint_color = self.get_theme_color('button_text')
+        review_btn = self.view_pool.get(ui.Button, title='Review Answers', font=('Helvetica', 18))
+        self.theme_view(review_btn, background_color='button_bg');
+        self.theme_view(review_btn, tint_color='button_text')
         review_btn.corner_radius = 8;
         review_btn.frame = (80, 330, self.main_view.width - 160, 50);
         review_btn.flex = 'W'
         review_btn.action = self.review_answers;
         self.main_view.add_subview(review_btn)
 
-        home_btn = ui.Button(title='Main Menu', font=('Helvetica', 18))
-        home_btn.background_color = self.get_theme_color('button_bg');
-        home_btn.tint_color = self.get_theme_color('button_text')
+        home_btn = self.view_pool.get(ui.Button, title='Main Menu', font=('Helvetica', 18))
+        self.theme_view(home_btn, background_color='button_bg');
+        self.theme_view(home_btn, tint_color='button_text')
         home_btn.corner_radius = 8;
         home_btn.frame = (80, 400, self.main_view.width - 160, 50);
         home_btn.flex = 'W'
@@ -484,8 +767,8 @@ class QuizApp:
 
         prog_text = (f"Review {self.review_index + 1}/{len(self.user_answers)} "
                      f"(Original #{q.q_number} | Score: {q_score}/5)")
-        prog_lbl = ui.Label(text=prog_text, alignment=ui.ALIGN_CENTER, font=('Helvetica', 14))
-        prog_lbl.text_color = self.get_theme_color('progress_text')
+        prog_lbl = self.view_pool.get(ui.Label, text=prog_text, alignment=ui.ALIGN_CENTER, font=('Helvetica', 14))
+        self.theme_view(prog_lbl, text_color='progress_text')
         prog_lbl.frame = (0, 20, self.main_view.width, 30);
         prog_lbl.flex = 'W'
         self.main_view.add_subview(prog_lbl)
@@ -494,8 +777,8 @@ class QuizApp:
         q_text_with_type = f"{q.type}: {q.text}"
         q_label_height = self._get_wrapped_text_height(q_text_with_type, q_label_width, 'Helvetica', 16)
 
-        q_lbl = ui.Label(text=q_text_with_type, number_of_lines=0, font=('Helvetica', 16))
-        q_lbl.text_color = self.get_theme_color('text')
+        q_lbl = self.view_pool.get(ui.Label, text=q_text_with_type, number_of_lines=0, font=('Helvetica', 16))
+        self.theme_view(q_lbl, text_color='text')
         q_lbl.frame = (20, 60, q_label_width, q_label_height)
         q_lbl.flex = 'W'
         self.main_view.add_subview(q_lbl)
@@ -503,7 +786,9 @@ class QuizApp:
         y_pos = q_lbl.y + q_lbl.height + 20
         opt_v_margin = 15
 
-        for (opt_txt, is_c), sel in zip(q.shuffled_options, user_res):
+        for opt_index, sel in zip(q.shuffled_options, user_res):
+            opt_txt = q.options[opt_index]
+            is_c = q.is_correct(opt_index)
             color_key = ''
             if is_c and sel:
                 color_key = 'correct_text'
@@ -517,8 +802,8 @@ class QuizApp:
             lbl_width = self.main_view.width - 60
             lbl_height = self._get_wrapped_text_height(opt_txt, lbl_width, 'Helvetica', 14)
 
-            lbl = ui.Label(text=opt_txt, number_of_lines=0, font=('Helvetica', 14))
-            lbl.text_color = self.get_theme_color(color_key)
+            lbl = self.view_pool.get(ui.Label, text=opt_txt, number_of_lines=0, font=('Helvetica', 14))
+            self.theme_view(lbl, text_color=color_key)
             lbl.frame = (30, y_pos, lbl_width, lbl_height)
             lbl.flex = 'W'
             self.main_view.add_subview(lbl)
@@ -529,9 +814,9 @@ class QuizApp:
         btn_w, btn_h = 100, 50
 
         # Previous Button
-        btn_prev = ui.Button(title='Prev', font=('Helvetica', 16))
-        btn_prev.background_color = self.get_theme_color('button_bg');
-        btn_prev.tint_color = self.get_theme_color('button_text');
+        btn_prev = self.view_pool.get(ui.Button, title='Prev', font=('Helvetica', 16))
+        self.theme_view(btn_prev, background_color='button_bg');
+        self.theme_view(btn_prev, tint_color='button_text');
         btn_prev.corner_radius = 8
         btn_prev.frame = (30, btn_y, btn_w, btn_h);
         btn_prev.action = lambda s: self.change_review(-1);
@@ -539,9 +824,9 @@ class QuizApp:
         self.main_view.add_subview(btn_prev)
 
         # Home Button
-        btn_home = ui.Button(title='Home', font=('Helvetica', 16))
-        btn_home.background_color = self.get_theme_color('button_bg');
-        btn_home.tint_color = self.get_theme_color('button_text');
+        btn_home = self.view_pool.get(ui.Button, title='Home', font=('Helvetica', 16))
+        self.theme_view(btn_home, background_color='button_bg');
+        self.theme_view(btn_home, tint_color='button_text');
         btn_home.corner_radius = 8
         btn_home.frame = (self.main_view.width / 2 - btn_w / 2, btn_y, btn_w, btn_h);
         btn_home.flex = 'LR'
@@ -549,9 +834,9 @@ class QuizApp:
         self.main_view.add_subview(btn_home)
 
         # Right-side button: "Next" or "Results"
-        right_button = ui.Button(font=('Helvetica', 16))
-        right_button.background_color = self.get_theme_color('button_bg');
-        right_button.tint_color = self.get_theme_color('button_text');
+        right_button = self.view_pool.get(ui.Button, font=('Helvetica', 16))
+        self.theme_view(right_button, background_color='button_bg');
+        self.theme_view(right_button, tint_color='button_text');
         right_button.corner_radius = 8
         right_button.frame = (self.main_view.width - btn_w - 30, btn_y, btn_w, btn_h);
         right_button.flex = 'L'
@@ -44,21 +44,233 @@
 
 import ui
 import dialogs
+import functools
 import random
 import re
 import time
 import json
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+from array import array
 import datetime
 
 
+POSITION_TYPECODE = 'L'  # array typecode for positions of questions in the loaded bank
+TEXT_HEIGHT_CACHE_SIZE = 2048  # Wrapped-text heights kept by measure_text_height
+QUIZ_SEED_BITS = 32  # A quiz is rebuilt exactly from (bank, seed, number of questions)
+RESULTS_LOG_FILE = 'results.jsonl'  # One JSON result per line, only ever appended to
+LEGACY_RESULTS_FILE = 'results.cfg'  # Old JSON array of results, migrated into the log once
+RESULTS_LOG_LOCK = threading.Lock()  # Keeps appends out of the file while it is being compacted
+RESULTS_DB_FILE = 'results.db'  # SQLite copy of the results, indexed for per-question history
+
+
 class Question:
-    def __init__(self, q_number, text, options):
+    __slots__ = ('q_number', 'text', 'options', 'correct_mask', 'option_partition', 'num_correct',
+                 'shuffled_options', 'type')
+
+    def __init__(self, q_number, text, options, correct_mask):
         self.q_number = q_number
         self.text = text
-        self.options = options
-        self.shuffled_options = []
+        self.options = options  # Tuple of option texts
+        self.correct_mask = correct_mask  # Bit i is set when options[i] is correct
+        # Indices of the correct options followed by the incorrect ones, split once at load time
+        correct = [i for i in range(len(options)) if (correct_mask >> i) & 1]
+        incorrect = [i for i in range(len(options)) if not (correct_mask >> i) & 1]
+        self.option_partition = array('H', correct + incorrect)
+        self.num_correct = len(correct)
+        self.shuffled_options = ()  # array('H') of indices into options, in the order shown
         self.type = None
 
+    def is_correct(self, option_index):
+        return (self.correct_mask >> option_index) & 1 == 1
+
+    @property
+    def correct_options(self):
+        return self.option_partition[:self.num_correct]
+
+    @property
+    def incorrect_options(self):
+        return self.option_partition[self.num_correct:]
+
+    def can_make_cs(self):
+        """True if the question has enough options for 1 correct + 4 incorrect."""
+        return self.num_correct >= 1 and len(self.options) - self.num_correct >= 4
+
+    def can_make_cm(self):
+        """True if the question has enough options for 2-4 correct with the rest incorrect."""
+        max_correct = min(4, self.num_correct)
+        return max_correct >= 2 and len(self.options) - self.num_correct >= 5 - max_correct
+
+
+QUESTION_HEADER_RE = re.compile(r'(?:\\s*)?(\d+)\.\s*')
+OPTION_LINE_RE = re.compile(r'^[a-j]\.\s+(?:\\s*)?\[(y|x)\]\s+(.*)')
+
+
+def _iter_question_blocks(lines):
+    """
+    Groups the lines of a question bank into (number, block_content) pairs, one block at a time.
+
+    A line starting with a question number opens a new block. A header with nothing after the
+    number takes the next non-blank line as its question text.
+    """
+    q_number_str = None
+    block_lines = []
+    at_file_start = True
+    waiting_for_text = False
+
+    for line in lines:
+        line = line.rstrip('\n')
+        if at_file_start:
+            if not line.strip():
+                continue
+            line = line.lstrip()
+            at_file_start = False
+
+        if waiting_for_text:
+            if line.strip():
+                block_lines.append(line.lstrip())
+                waiting_for_text = False
+            continue
+
+        match = QUESTION_HEADER_RE.match(line)
+        if match:
+            if q_number_str is not None:
+                yield q_number_str, '\n'.join(block_lines)
+            q_number_str = match.group(1)
+            block_lines = [line[match.end():]]
+            waiting_for_text = not block_lines[0]
+        elif q_number_str is not None:
+            block_lines.append(line)
+
+    if q_number_str is not None:
+        yield q_number_str, '\n'.join(block_lines)
+
+
+def _build_question(q_number_str, block_content):
+    lines = block_content.strip().split('\n')
+    question_text = lines[0].strip()
+    options = []
+    correct_mask = 0
+
+    for line in lines[1:]:
+        line = line.strip()
+        if not line:
+            continue
+
+        match = OPTION_LINE_RE.match(line)
+
+        if match:
+            correctness, text = match.groups()
+            if correctness == 'y':
+                correct_mask |= 1 << len(options)
+            options.append(text.strip())
+
+    if question_text and options:
+        return Question(int(q_number_str), question_text, tuple(options), correct_mask)
+    return None
+
+
+def iter_questions_from_file(file_path):
+    """
+    Yields Question objects from a text file with multiple-choice questions as it reads it.
+
+    The file is read line by line, so the first questions are available before the rest of the
+    file has been parsed.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for q_number_str, block_content in _iter_question_blocks(f):
+            question = _build_question(q_number_str, block_content)
+            if question:
+                yield question
+
+
+def index_questions(questions):
+    """
+    Indexes a freshly loaded bank once, so starting a quiz never has to scan it.
+
+    Returns an array with the positions in questions of those that can make at least one valid quiz
+    item. Which item types a question can make is answered by quiz_item_types.
+    """
+    quiz_ready = array(POSITION_TYPECODE)
+    for position, q in enumerate(questions):
+        if any(quiz_item_types(q)):
+            quiz_ready.append(position)
+    return quiz_ready
+
+
+def quiz_item_types(q):
+    """Returns (can_make_cs, can_make_cm) for q under this build's rules."""
+    if len(q.options) == 5:
+        return q.num_correct == 1, False
+    return q.can_make_cs(), q.can_make_cm()
+
+
+def build_quiz_item(q, rng=random):
+    """
+    Picks q.type and q.shuffled_options for one quiz item. q must be quiz-ready.
+
+    Only types and correct-option counts that q can actually fill are drawn, so this never fails.
+    """
+    if len(q.options) == 5:
+        # A question with exactly 5 options is a mandatory CS question using all of its options
+        q.type = 'CS'
+        shuffled = list(range(5))
+    else:
+        can_cs, can_cm = quiz_item_types(q)
+        q.type = rng.choice(['CS', 'CM']) if can_cs and can_cm else ('CS' if can_cs else 'CM')
+        if q.type == 'CS':
+            shuffled = rng.sample(q.correct_options, 1) + rng.sample(q.incorrect_options, 4)
+        else:
+            num_incorrect = len(q.options) - q.num_correct
+            n_correct = rng.randint(max(2, 5 - num_incorrect), min(4, q.num_correct))
+            shuffled = rng.sample(q.correct_options, n_correct) + rng.sample(q.incorrect_options, 5 - n_correct)
+    rng.shuffle(shuffled)
+    q.shuffled_options = array('H', shuffled)
+
+
+def sample_quiz(questions, quiz_ready, num, rng=random):
+    """Returns exactly min(num, len(quiz_ready)) questions with their quiz items built, in one pass."""
+    positions = rng.sample(quiz_ready, min(num, len(quiz_ready)))
+    quiz = []
+    for position in positions:
+        q = questions[position]
+        build_quiz_item(q, rng)
+        quiz.append(q)
+    return quiz
+
+
+def rebuild_quiz(questions, quiz_ready, num, seed):
+    """Builds the quiz that start_quiz gave for this seed, as long as the bank is unchanged."""
+    return sample_quiz(questions, quiz_ready, num, random.Random(seed))
+
+
+def file_digest(file_path):
+    """SHA-1 of the bank file, which identifies the bank a stored seed has to be replayed on."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def answer_mask(selection):
+    """Packs a list of switch values into an int, bit j set when the j-th shown option was selected."""
+    return sum(1 << j for j, selected in enumerate(selection) if selected)
+
+
+def score_answer(q, user_res):
+    """Points for one quiz item given the switch values in shuffled order."""
+    correct_res = [q.is_correct(i) for i in q.shuffled_options]
+    selected_count = sum(user_res)
+    if q.type == 'CS':
+        return 5 if selected_count == 1 and user_res == correct_res else 0
+    if q.type == 'CM' and 2 <= selected_count <= 4:
+        return max(0, 5 - sum(1 for u, c in zip(user_res, correct_res) if u != c))
+    return 0
+
 
 def parse_questions_from_file(file_path):
     """
@@ -67,54 +279,401 @@ def parse_questions_from_file(file_path):
     The function is designed to handle blocks of questions separated by blank lines.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        return list(iter_questions_from_file(file_path))
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' was not found.")
         return []
 
-    questions = []
-    blocks = re.findall(r'(?s)(?m)^(?:\\s*)?(\d+)\.\s*(.*?)(?=\n(?:\\s*)?\d+\.\s*|\Z)', content.strip())
 
-    for q_number_str, block_content in blocks:
-        q_number = int(q_number_str)
-        lines = block_content.strip().split('\n')
-        question_text = lines[0].strip()
-        options = []
+def append_result(entry, log_path=RESULTS_LOG_FILE):
+    """Appends one result as a single line, without reading or rewriting what is already there."""
+    line = (json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8')
+    with RESULTS_LOG_LOCK, open(log_path, 'a+b') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell():
+            # A write cut off by a crash must not swallow the new line
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                line = b'\n' + line
+        f.write(line)
 
-        for line in lines[1:]:
-            line = line.strip()
-            if not line:
-                continue
 
-            match = re.match(r'^[a-j]\.\s+(?:\\s*)?\[(y|x)\]\s+(.*)', line)
+def iter_results(log_path=RESULTS_LOG_FILE):
+    """Yields the stored results in order, skipping lines that aren't a complete JSON object."""
+    try:
+        with open(log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict):
+                    yield entry
+    except FileNotFoundError:
+        return
 
-            if match:
-                correctness, text = match.groups()
-                options.append((text.strip(), correctness == 'y'))
 
-        if question_text and options:
-            questions.append(Question(q_number, question_text, options))
+def migrate_legacy_results(legacy_path=LEGACY_RESULTS_FILE, log_path=RESULTS_LOG_FILE):
+    """
+    One-time move of the old results.cfg JSON array into the line log.
 
-    return questions
+    The old file is renamed to results.cfg.migrated instead of deleted, so it is only migrated once.
+    """
+    if not os.path.exists(legacy_path):
+        return
+    try:
+        with open(legacy_path, 'r') as f:
+            legacy_results = json.load(f)
+    except (IOError, json.JSONDecodeError):
+        legacy_results = []
+    if not isinstance(legacy_results, list):
+        legacy_results = []
+
+    temp_path = log_path + '.tmp'
+    try:
+        with RESULTS_LOG_LOCK:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for entry in legacy_results:
+                    f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+                # Anything already logged comes after the older results
+                if os.path.exists(log_path):
+                    with open(log_path, 'r', encoding='utf-8') as log:
+                        for line in log:
+                            f.write(line if line.endswith('\n') else line + '\n')
+            os.replace(temp_path, log_path)
+            os.replace(legacy_path, legacy_path + '.migrated')
+    except OSError:
+        print("Error: Could not migrate old quiz results.")
+
+
+def compact_results_log(log_path=RESULTS_LOG_FILE):
+    """Rewrites the log without lines cut off by a crash. Does nothing when every line is valid."""
+    with RESULTS_LOG_LOCK:
+        try:
+            with open(log_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        valid_lines = []
+        for line in lines:
+            try:
+                if isinstance(json.loads(line), dict):
+                    valid_lines.append(line if line.endswith('\n') else line + '\n')
+            except ValueError:
+                pass
+        if len(valid_lines) == len(lines) and all(line.endswith('\n') for line in lines):
+            return
+        temp_path = log_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.writelines(valid_lines)
+            os.replace(temp_path, log_path)
+        except OSError:
+            print("Error: Could not compact quiz results.")
+
+
+class ResultsStore:
+    """
+    SQLite store of every attempt and every answered question, next to the results log.
+
+    A question is identified by its bank file name and its original number, so "how often have I
+    missed #312 of the cardio bank" is one indexed lookup instead of a scan of the whole history.
+    question_stats holds a running total per question, updated as each attempt is added, so
+    per-question and per-bank summaries never have to re-read the responses.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS attempts (
+            id INTEGER PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            bank TEXT NOT NULL,
+            bank_sha1 TEXT,
+            seed INTEGER,
+            num_questions INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            total_possible INTEGER NOT NULL,
+            duration_seconds INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS responses (
+            attempt_id INTEGER NOT NULL REFERENCES attempts(id),
+            position INTEGER NOT NULL,
+            bank TEXT NOT NULL,
+            q_number INTEGER NOT NULL,
+            timestamp TEXT NOT NULL,
+            type TEXT NOT NULL,
+            answer_mask INTEGER NOT NULL,
+            correct_mask INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            shown_options TEXT,
+            PRIMARY KEY (attempt_id, position)
+        );
+        CREATE TABLE IF NOT EXISTS question_stats (
+            bank TEXT NOT NULL,
+            q_number INTEGER NOT NULL,
+            times_seen INTEGER NOT NULL,
+            times_correct INTEGER NOT NULL,
+            score_sum INTEGER NOT NULL,
+            last_seen TEXT NOT NULL,
+            last_score INTEGER NOT NULL,
+            option_shown TEXT NOT NULL,
+            option_selected TEXT NOT NULL,
+            PRIMARY KEY (bank, q_number)
+        );
+        CREATE INDEX IF NOT EXISTS attempts_by_bank ON attempts (bank, timestamp);
+        CREATE INDEX IF NOT EXISTS responses_by_question ON responses (bank, q_number, timestamp);
+        CREATE INDEX IF NOT EXISTS responses_by_bank ON responses (bank, timestamp);
+    """
+
+    def __init__(self, db_path=RESULTS_DB_FILE):
+        is_new = not os.path.exists(db_path)
+        # Writes come from the persistence writer thread, history lookups from the UI thread
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.connection.executescript(self.SCHEMA)
+        self._upgrade_schema()
+        if is_new:
+            self.import_results(iter_results())
+
+    def _upgrade_schema(self):
+        """Brings a results.db from before question_stats up to date, rebuilding the totals once."""
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(responses)")]
+        if 'shown_options' in columns:
+            return
+        with self.connection:
+            self.connection.execute("ALTER TABLE responses ADD COLUMN shown_options TEXT")
+            rows = self.connection.execute(
+                "SELECT bank, q_number, timestamp, answer_mask, score FROM responses ORDER BY timestamp, attempt_id")
+            for bank, q_number, timestamp, answer, q_score in rows.fetchall():
+                self._update_question_stats(bank, timestamp, q_number, answer, q_score, None)
+
+    def _update_question_stats(self, bank, timestamp, q_number, answer, q_score, shown_options):
+        """Adds one response to the question's running totals. Runs inside add_attempt's transaction."""
+        row = self.connection.execute(
+            "SELECT times_seen, times_correct, score_sum, option_shown, option_selected FROM question_stats "
+            "WHERE bank = ? AND q_number = ?", (bank, q_number)).fetchone()
+        times_seen, times_correct, score_sum, option_shown, option_selected = row or (0, 0, 0, '[]', '[]')
+        option_shown, option_selected = json.loads(option_shown), json.loads(option_selected)
+
+        # Selections are counted per original option, so they add up across differently shuffled quizzes
+        for j, opt_index in enumerate(shown_options or ()):
+            if opt_index >= len(option_shown):
+                option_shown.extend([0] * (opt_index + 1 - len(option_shown)))
+                option_selected.extend([0] * (opt_index + 1 - len(option_selected)))
+            option_shown[opt_index] += 1
+            option_selected[opt_index] += (answer >> j) & 1
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO question_stats (bank, q_number, times_seen, times_correct, score_sum, "
+            "last_seen, last_score, option_shown, option_selected) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (bank, q_number, times_seen + 1, times_correct + (q_score == 5), score_sum + q_score, timestamp,
+             q_score, json.dumps(option_shown), json.dumps(option_selected)))
+
+    def add_attempt(self, entry, responses):
+        """
+        Stores one attempt and adds it to question_stats. entry is the dict written to the results
+        log, responses a list of (q_number, type, answer_mask, correct_mask, score, shown_options) in
+        quiz order, where shown_options are the original option indices in the order shown (or None).
+        """
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO attempts (timestamp, bank, bank_sha1, seed, num_questions, score, total_possible, "
+                "duration_seconds) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (entry['timestamp'], entry['quiz_file'], entry.get('bank_sha1'), entry.get('seed'),
+                 entry['num_questions_attempted'], entry['score'], entry['total_possible'],
+                 entry.get('duration_seconds')))
+            self.connection.executemany(
+                "INSERT INTO responses (attempt_id, position, bank, q_number, timestamp, type, answer_mask, "
+                "correct_mask, score, shown_options) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(cursor.lastrowid, position, entry['quiz_file'], q_number, entry['timestamp'], q_type, answer,
+                  correct, q_score, None if shown is None else ','.join(map(str, shown)))
+                 for position, (q_number, q_type, answer, correct, q_score, shown) in enumerate(responses)])
+            for q_number, q_type, answer, correct, q_score, shown in responses:
+                self._update_question_stats(entry['quiz_file'], entry['timestamp'], q_number, answer, q_score, shown)
+
+    def import_results(self, entries):
+        """
+        Fills a new store from the results log. Entries in the old format carry their questions;
+        seed-only entries are stored as attempts, since their questions depend on the bank file.
+        """
+        for entry in entries:
+            responses = []
+            for info in entry.get('questions_breakdown', []):
+                responses.append((info['original_q_number'], info['type'],
+                                  answer_mask(info['user_selection']), answer_mask(info['correct_answers']),
+                                  info['score_for_this_question'], None))
+            try:
+                self.add_attempt(entry, responses)
+            except (KeyError, sqlite3.Error):
+                print("Warning: Skipped a stored result that could not be imported.")
+
+    def question_history(self, bank, q_number):
+        """(times answered, times not fully correct) for one question of a bank."""
+        with self.lock:
+            seen, missed = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(score < 5), 0) FROM responses WHERE bank = ? AND q_number = ?",
+                (bank, q_number)).fetchone()
+        return seen, missed
+
+    def bank_mastery(self):
+        """
+        (bank, questions seen, questions answered fully correct the last time) for every bank,
+        most recently used first. Reads only the rollup, so it is cheap enough for the menu.
+        """
+        with self.lock:
+            return self.connection.execute(
+                "SELECT bank, COUNT(*), SUM(last_score = 5) FROM question_stats GROUP BY bank "
+                "ORDER BY MAX(last_seen) DESC").fetchall()
+
+
+def write_file_atomic(file_path, data):
+    """Writes data (str or bytes) to a temp file next to file_path, then renames it into place."""
+    temp_path = file_path + ".tmp"
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    with open(temp_path, mode) as f:
+        f.write(data)
+    os.replace(temp_path, file_path)
+
+
+class PersistenceWriter:
+    """
+    Background thread for the app's file writes, so the UI thread never waits on the disk.
+
+    write_file() calls for the same path that are still queued collapse into one write of the latest
+    data. submit() runs any other job (appends, database inserts) on the same thread, in order.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._pending_files = {}
+        self._lock = threading.Lock()
+        # Pythonista keeps the interpreter alive after the view closes, so a daemon thread still drains
+        self._thread = threading.Thread(target=self._run, name="PersistenceWriter", daemon=True)
+        self._thread.start()
+
+    def write_file(self, file_path, data):
+        with self._lock:
+            already_queued = file_path in self._pending_files
+            self._pending_files[file_path] = data
+        if not already_queued:
+            self._queue.put((self._write_pending_file, (file_path,)))
+
+    def submit(self, job, *args):
+        self._queue.put((job, args))
+
+    def flush(self):
+        """Blocks until everything queued so far has been written."""
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _write_pending_file(self, file_path):
+        with self._lock:
+            data = self._pending_files.pop(file_path)
+        write_file_atomic(file_path, data)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                job, args = item
+                job(*args)
+            except Exception as e:
+                print(f"Error: Background write failed: {e}")
+            finally:
+                self._queue.task_done()
+
+
+class ViewPool:
+    """
+    Recycles the labels, switches and buttons of cleared screens, so stepping through questions and
+    review pages reuses the same option rows and buttons instead of allocating new views each time.
+
+    get() hands out a recycled view (or a new one) with the attributes that differ between screens
+    reset to their defaults, then applies the given ones.
+    """
+
+    DEFAULTS = {
+        ui.Label: {'alignment': ui.ALIGN_LEFT, 'number_of_lines': 1, 'flex': ''},
+        ui.Switch: {'value': False, 'enabled': True, 'flex': '', 'action': None},
+        ui.Button: {'title': '', 'enabled': True, 'flex': '', 'action': None},
+    }
+
+    def __init__(self):
+        self._free = {view_class: [] for view_class in self.DEFAULTS}
+        self.created = 0
+        self.reused = 0
+
+    def get(self, view_class, **attrs):
+        free = self._free[view_class]
+        if free:
+            view = free.pop()
+            self.reused += 1
+        else:
+            view = view_class()
+            self.created += 1
+        for attr, value in self.DEFAULTS[view_class].items():
+            setattr(view, attr, value)
+        for attr, value in attrs.items():
+            setattr(view, attr, value)
+        return view
+
+    def recycle(self, view):
+        """Takes back a view removed from the screen. Views of other kinds are left to be freed."""
+        free = self._free.get(type(view))
+        if free is not None:
+            view.action = None  # Drop the old screen's callback
+            free.append(view)
+
+
+@functools.lru_cache(maxsize=TEXT_HEIGHT_CACHE_SIZE)
+def measure_text_height(text, width, font_name, font_size):
+    """
+    Height of text wrapped to width, measured with a throwaway label. Sizing labels is the slow part of
+    laying out a screen, so results are kept in an LRU cache; measure_text_height.cache_info() has the
+    hit and miss counts.
+    """
+    temp_label = ui.Label(text=text, font=(font_name, font_size), number_of_lines=0)
+    temp_label.width = width
+    temp_label.size_to_fit()
+    return temp_label.height
+
+
+class QuizView(ui.View):
+    """The app's root view. Pythonista calls will_close when the user closes it, the app's only exit."""
+
+    def __init__(self, on_close):
+        self.on_close = on_close
+
+    def will_close(self):
+        self.on_close()
 
 
 class QuizApp:
     def __init__(self):
-        self.main_view = ui.View()
+        self.main_view = QuizView(self.on_closing)
+        self.view_pool = ViewPool()
         self.main_view.name = "Quiz App"
         self.main_view.frame = (0, 0, 600, 800)
         self.questions = []
+        self.quiz_ready = array(POSITION_TYPECODE)
         self.quiz_questions = []
+        self.quiz_seed = None
         self.current_question_index = 0
         self.user_answers = []
         self.score = 0
         self.scores_breakdown = []
         self.num_questions = 5
         self.start_time = 0
+        self.quiz_result = None  # (total_possible, grade, duration, timestamp) once the quiz is finished and saved
         self.is_presented = False
+        self.measured_width = None  # main_view width the text height cache was filled for
         # Added quiz file name
         self.quiz_file_name = "N/A"
+        self.bank_sha1 = None
 
         self.user_name_for_copyright = "Capatina Nicolae"
         self.current_year_for_copyright = time.strftime("%Y")
@@ -139,22 +698,34 @@ class QuizApp:
             }
         }
         self.dark_mode_enabled = False
+        self.themed_views = []  # (view, attribute, theme key) of the current screen
+        self.writer = PersistenceWriter()
         self.load_settings()
         self.current_theme = self.themes['dark'] if self.dark_mode_enabled else self.themes['light']
 
+        migrate_legacy_results()
+        try:
+            self.results_store = ResultsStore()
+        except sqlite3.Error as e:
+            print(f"Error: Could not open the results database: {e}")
+            self.results_store = None
+        # Compaction only has to read the log, so it stays off the UI thread
+        threading.Thread(target=compact_results_log, daemon=True).start()
+
         self.main_menu()
 
     def _get_wrapped_text_height(self, text, width, font_name, font_size):
         """Calculates the height of a text string when wrapped to a given width."""
-        temp_label = ui.Label(text=text, font=(font_name, font_size), number_of_lines=0)
-        temp_label.width = width
-        temp_label.size_to_fit()
-        return temp_label.height
+        if self.measured_width != self.main_view.width:
+            # Rotated or resized: every width used for layout changes, so the old heights won't be asked for again
+            measure_text_height.cache_clear()
+            self.measured_width = self.main_view.width
+        return measure_text_height(text, width, font_name, font_size)
 
     def _add_copyright_label(self):
-        copyright_label = ui.Label(text=self.copyright_text_string)
+        copyright_label = self.view_pool.get(ui.Label, text=self.copyright_text_string)
         copyright_label.font = ('Helvetica', 9)
-        copyright_label.text_color = self.get_theme_color('copyright_text_color', self.get_theme_color('progress_text'))
+        self.theme_view(copyright_label, text_color='copyright_text_color')
         copyright_label.alignment = ui.ALIGN_RIGHT
         text_width, text_height = ui.measure_string(
             copyright_label.text, font=copyright_label.font, alignment=copyright_label.alignment
@@ -170,6 +741,9 @@ class QuizApp:
         copyright_label.flex = 'RB'
         self.main_view.add_subview(copyright_label)
 
+    def on_closing(self):
+        self.writer.close()  # Waits for queued writes to reach the disk
+
     def load_settings(self):
         try:
             with open('quiz_settings.json', 'r') as f:
@@ -180,21 +754,9 @@ class QuizApp:
 
     def save_settings(self):
         settings = {'dark_mode_enabled': self.dark_mode_enabled}
-        try:
-            with open('quiz_settings.json', 'w') as f:
-                json.dump(settings, f)
-        except IOError:
-            print("Error: Could not save theme settings.")
+        self.writer.write_file('quiz_settings.json', json.dumps(settings))
 
     def save_results(self, score, total_possible, grade, duration, quiz_file_name, num_questions_attempted, timestamp):
-        results_data = []
-        try:
-            with open('results.cfg', 'r') as f:
-                results_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # File doesn't exist or is empty/corrupt, start with an empty list
-            results_data = []
-
         new_result = {
             'timestamp': timestamp,
             'quiz_file': quiz_file_name,
@@ -203,37 +765,51 @@ class QuizApp:
             'grade': grade,
             'duration_seconds': duration,
             'num_questions_attempted': num_questions_attempted,
-            'questions_breakdown': []
+            # The quiz itself is rebuilt with rebuild_quiz(bank, seed, num_questions_attempted)
+            'bank_sha1': self.bank_sha1,
+            'seed': self.quiz_seed,
+            'answer_masks': [answer_mask(user_res) for q, user_res in self.user_answers]
         }
 
-        # Add details for each question attempted
-        for i, (q, user_res) in enumerate(self.user_answers):
-            correct_res = [is_c for _, is_c in q.shuffled_options]
-            question_info = {
-                'original_q_number': q.q_number,
-                'question_text': q.text,
-                'type': q.type,
-                'shuffled_options': [(opt_text, is_c) for opt_text, is_c in q.shuffled_options],
-                'user_selection': user_res,
-                'correct_answers': correct_res,
-                'score_for_this_question': self.scores_breakdown[i]
-            }
-            new_result['questions_breakdown'].append(question_info)
-
-        results_data.append(new_result)
+        # Snapshot the responses now: the questions are reused by the next quiz
+        responses = [(q.q_number, q.type, answer_mask(user_res),
+                      answer_mask([q.is_correct(i) for i in q.shuffled_options]), self.scores_breakdown[i],
+                      list(q.shuffled_options))
+                     for i, (q, user_res) in enumerate(self.user_answers)]
+        self.writer.submit(self._write_result, new_result, responses)
 
+    def _write_result(self, new_result, responses):
+        """Runs on the persistence writer thread."""
         try:
-            with open('results.cfg', 'w') as f:
-                json.dump(results_data, f, indent=4)
+            append_result(new_result)
         except IOError:
             print("Error: Could not save quiz results.")
 
+        if self.results_store:
+            try:
+                self.results_store.add_attempt(new_result, responses)
+            except sqlite3.Error as e:
+                print(f"Error: Could not save quiz results to the database: {e}")
+
     def get_theme_color(self, key, default='black'):
         return self.current_theme.get(key, default)
 
+    def theme_view(self, view, **color_keys):
+        """Sets view attributes to theme colors and remembers them, so apply_theme can recolor the view in place."""
+        for attr, key in color_keys.items():
+            setattr(view, attr, self.get_theme_color(key))
+            self.themed_views.append((view, attr, key))
+
+    def apply_theme(self):
+        self.main_view.background_color = self.get_theme_color('bg')
+        for view, attr, key in self.themed_views:
+            setattr(view, attr, self.get_theme_color(key))
+
     def clear_view(self):
         for subview in list(self.main_view.subviews):
             self.main_view.remove_subview(subview)
+            self.view_pool.recycle(subview)
+        self.themed_views = []
 
     def format_time(self, seconds):
         if seconds < 60: return f"{seconds} seconds"
@@ -250,48 +826,50 @@ class QuizApp:
         self.dark_mode_enabled = sender.value
         self.current_theme = self.themes['dark'] if self.dark_mode_enabled else self.themes['light']
         self.save_settings()
-        self.main_menu()
+        self.apply_theme()  # Recolors the menu in place instead of rebuilding it
 
     def main_menu(self):
         self.main_view.background_color = self.get_theme_color('bg')
         self.clear_view()
         self.main_view.flex = 'WH'
 
-        title_label = ui.Label(text='Quiz App', font=('Helvetica-Bold', 32), alignment=ui.ALIGN_CENTER)
-        title_label.text_color = self.get_theme_color('text')
+        title_label = self.view_pool.get(ui.Label, text='Quiz App', font=('Helvetica-Bold', 32),
+                                         alignment=ui.ALIGN_CENTER)
+        self.theme_view(title_label, text_color='text')
         title_label.frame = (0, 60, self.main_view.width, 50)
         title_label.flex = 'W'
         self.main_view.add_subview(title_label)
 
-        load_btn = ui.Button(title='Load Quiz File', font=('Helvetica', 18))
-        load_btn.background_color = self.get_theme_color('button_bg')
-        load_btn.tint_color = self.get_theme_color('button_text')
+        load_btn = self.view_pool.get(ui.Button, title='Load Quiz File', font=('Helvetica', 18))
+        self.theme_view(load_btn, background_color='button_bg')
+        self.theme_view(load_btn, tint_color='button_text')
         load_btn.corner_radius = 8
         load_btn.frame = (80, 150, self.main_view.width - 160, 50)
         load_btn.flex = 'W'
         load_btn.action = self.load_file
         self.main_view.add_subview(load_btn)
 
-        num_q_label = ui.Label(text='Number of questions:', alignment=ui.ALIGN_CENTER, font=('Helvetica', 16))
-        num_q_label.text_color = self.get_theme_color('text')
+        num_q_label = self.view_pool.get(ui.Label, text='Number of questions:', alignment=ui.ALIGN_CENTER,
+                                         font=('Helvetica', 16))
+        self.theme_view(num_q_label, text_color='text')
         num_q_label.frame = (0, 230, self.main_view.width, 40)
         num_q_label.flex = 'W'
         self.main_view.add_subview(num_q_label)
 
         self.num_field = ui.TextField(text='5', alignment=ui.ALIGN_CENTER, keyboard_type=ui.KEYBOARD_NUMBER_PAD,
                                       font=('Helvetica', 18))
-        self.num_field.background_color = self.get_theme_color('textfield_bg')
-        self.num_field.text_color = self.get_theme_color('textfield_text')
-        self.num_field.tint_color = self.get_theme_color('text')
+        self.theme_view(self.num_field, background_color='textfield_bg')
+        self.theme_view(self.num_field, text_color='textfield_text')
+        self.theme_view(self.num_field, tint_color='text')
         self.num_field.bordered = False
         self.num_field.corner_radius = 5
         self.num_field.frame = (self.main_view.width / 2 - 60, 280, 120, 40)
         self.num_field.flex = 'LR'
         self.main_view.add_subview(self.num_field)
 
-        start_btn = ui.Button(title='Start Quiz', font=('Helvetica', 18))
-        start_btn.background_color = self.get_theme_color('button_bg')
-        start_btn.tint_color = self.get_theme_color('button_text')
+        start_btn = self.view_pool.get(ui.Button, title='Start Quiz', font=('Helvetica', 18))
+        self.theme_view(start_btn, background_color='button_bg')
+        self.theme_view(start_btn, tint_color='button_text')
         start_btn.corner_radius = 8
         start_btn.frame = (80, 360, self.main_view.width - 160, 50)
         start_btn.flex = 'W'
@@ -299,30 +877,52 @@ class QuizApp:
         self.main_view.add_subview(start_btn)
 
         dark_mode_y_pos = 430
-        dark_mode_label = ui.Label(text='Dark Mode:', font=('Helvetica', 16))
-        dark_mode_label.text_color = self.get_theme_color('text')
+        dark_mode_label = self.view_pool.get(ui.Label, text='Dark Mode:', font=('Helvetica', 16))
+        self.theme_view(dark_mode_label, text_color='text')
         dark_mode_label.frame = (80, dark_mode_y_pos, 150, 40)
         dark_mode_label.flex = 'W'
         self.main_view.add_subview(dark_mode_label)
 
-        self.dark_mode_switch = ui.Switch(value=self.dark_mode_enabled)
+        self.dark_mode_switch = self.view_pool.get(ui.Switch, value=self.dark_mode_enabled)
         self.dark_mode_switch.frame = (self.main_view.width - 80 - 80, dark_mode_y_pos + 4, 80, 32)
         self.dark_mode_switch.flex = 'L'
-        self.dark_mode_switch.tint_color = self.get_theme_color('switch_tint')
+        self.theme_view(self.dark_mode_switch, tint_color='switch_tint')
         self.dark_mode_switch.action = self.toggle_dark_mode
         self.main_view.add_subview(self.dark_mode_switch)
 
+        mastery_text = self.mastery_summary()
+        if mastery_text:
+            mastery_label = self.view_pool.get(ui.Label, text=mastery_text, number_of_lines=0,
+                                               alignment=ui.ALIGN_CENTER, font=('Helvetica', 14))
+            self.theme_view(mastery_label, text_color='progress_text')
+            mastery_label.frame = (20, dark_mode_y_pos + 60, self.main_view.width - 40, 80)
+            mastery_label.flex = 'W'
+            self.main_view.add_subview(mastery_label)
+
         self._add_copyright_label()
 
         if not self.is_presented:
             self.main_view.present('fullscreen')
             self.is_presented = True
 
+    def mastery_summary(self, max_banks=3):
+        """One line per recently used bank: how many of its seen questions were last answered right."""
+        if not self.results_store:
+            return ''
+        try:
+            mastery = self.results_store.bank_mastery()
+        except sqlite3.Error:
+            return ''
+        return '\n'.join(f"{bank}: {mastered} of {seen} questions mastered" for bank, seen, mastered in
+                         mastery[:max_banks])
+
     def load_file(self, sender):
         try:
             file_path = dialogs.pick_document(types=['public.text'])
             if file_path:
                 self.questions = parse_questions_from_file(file_path)
+                self.quiz_ready = index_questions(self.questions)
+                self.bank_sha1 = file_digest(file_path)
                 # Store the file name
                 self.quiz_file_name = file_path.split('/')[-1]
                 dialogs.alert('Loaded', f'{len(self.questions)} questions loaded from {self.quiz_file_name}.',
@@ -330,7 +930,7 @@ class QuizApp:
         except Exception as e:
             dialogs.alert('Error', f'Failed to load or parse the file.\n\n{e}', button1='OK')
 
-    def start_quiz(self, sender):
+    def start_quiz(self, sender, seed=None):
         try:
             num = int(self.num_field.text)
         except ValueError:
@@ -344,13 +944,9 @@ class QuizApp:
             dialogs.alert("Info", "Number of questions is 0. No quiz will start.", button1='OK')
             return
 
-        self.quiz_questions = []
-        # Initial filter for questions that are viable candidates (have at least 5 options and one correct answer)
-        available_questions = [q for q in self.questions if
-                               len(q.options) >= 5 and sum(1 for opt, is_c in q.options if is_c) > 0]
-
-        if len(available_questions) < self.num_questions:
-            actual_num = len(available_questions)
+        # Questions that can make a valid item were indexed when the file was loaded
+        if len(self.quiz_ready) < self.num_questions:
+            actual_num = len(self.quiz_ready)
             if actual_num == 0:
                 dialogs.alert("Quiz Error", "No valid questions found. Check file.", button1='OK')
                 return
@@ -358,58 +954,16 @@ class QuizApp:
                           button1='OK')
             self.num_questions = actual_num
 
-        temp_questions_to_process = random.sample(available_questions, self.num_questions)
-        for q_original in temp_questions_to_process:
-            q = q_original
-            correct_options = [opt for opt in q.options if opt[1]]
-            incorrect_options = [opt for opt in q.options if not opt[1]]
-            current_q_shuffled_options = []
-
-            # --- MODIFIED LOGIC ---
-            # If the source question has exactly 5 options, treat it as a mandatory CS (single-choice) question.
-            if len(q.options) == 5:
-                # It's only valid if it has exactly one correct answer.
-                if len(correct_options) == 1:
-                    q.type = 'CS'
-                    current_q_shuffled_options = list(q.options)  # Use the existing 5 options
-                else:
-                    # If a 5-option question doesn't have exactly 1 correct answer, it's invalid for this mode.
-                    continue
-            # If the source question has MORE than 5 options, use the original logic to create a 5-option quiz question.
-            else:
-                q.type = random.choice(['CS', 'CM'])
-                if q.type == 'CS':
-                    if correct_options and len(incorrect_options) >= 4:
-                        current_q_shuffled_options = random.sample(correct_options, 1) + random.sample(
-                            incorrect_options, 4)
-                    else:
-                        continue  # Not enough options to build a CS question
-                else:  # q.type == 'CM'
-                    min_correct_cm = 2
-                    max_correct_cm = min(4, len(correct_options))
-                    if max_correct_cm < min_correct_cm: continue
-                    n_correct = random.randint(min_correct_cm, max_correct_cm)
-                    n_incorrect = 5 - n_correct
-                    if len(incorrect_options) < n_incorrect: continue
-                    current_q_shuffled_options = random.sample(correct_options, n_correct) + random.sample(
-                        incorrect_options, n_incorrect)
-
-            if not current_q_shuffled_options or len(current_q_shuffled_options) != 5: continue
-
-            random.shuffle(current_q_shuffled_options)
-            q.shuffled_options = current_q_shuffled_options
-            self.quiz_questions.append(q)
-
-        if not self.quiz_questions:
-            dialogs.alert("Quiz Error", "Failed to prepare questions. Check that questions have enough options.",
-                          button1='OK')
-            return
+        # Every random choice of the quiz comes from this seed, so results only need to keep the seed
+        self.quiz_seed = random.getrandbits(QUIZ_SEED_BITS) if seed is None else seed
+        self.quiz_questions = rebuild_quiz(self.questions, self.quiz_ready, self.num_questions, self.quiz_seed)
 
         self.current_question_index = 0
         self.user_answers = []
         self.score = 0
         self.scores_breakdown = []
         self.start_time = time.time()
+        self.quiz_result = None
         self.show_question()
 
     def show_question(self):
@@ -417,15 +971,16 @@ class QuizApp:
         self.clear_view()
 
         if self.current_question_index >= len(self.quiz_questions):
-            self.show_score()
+            self.finish_quiz()
             return
 
         q = self.quiz_questions[self.current_question_index]
 
         progress_text = (f"Question {self.current_question_index + 1} of {len(self.quiz_questions)} "
                          f"(Original #{q.q_number})")
-        progress_label = ui.Label(text=progress_text, font=('Helvetica', 14), alignment=ui.ALIGN_CENTER)
-        progress_label.text_color = self.get_theme_color('progress_text')
+        progress_label = self.view_pool.get(ui.Label, text=progress_text, font=('Helvetica', 14),
+                                            alignment=ui.ALIGN_CENTER)
+        self.theme_view(progress_label, text_color='progress_text')
         progress_label.frame = (0, 20, self.main_view.width, 30)
         progress_label.flex = 'W'
         self.main_view.add_subview(progress_label)
@@ -434,8 +989,8 @@ class QuizApp:
         q_text_with_type = f"{q.type}: {q.text}"
         q_label_height = self._get_wrapped_text_height(q_text_with_type, q_label_width, 'Helvetica', 16)
 
-        q_label = ui.Label(text=q_text_with_type, number_of_lines=0, font=('Helvetica', 16))
-        q_label.text_color = self.get_theme_color('text')
+        q_label = self.view_pool.get(ui.Label, text=q_text_with_type, number_of_lines=0, font=('Helvetica', 16))
+        self.theme_view(q_label, text_color='text')
         q_label.frame = (20, 60, q_label_width, q_label_height)
         q_label.flex = 'W'
         self.main_view.add_subview(q_label)
@@ -444,19 +999,21 @@ class QuizApp:
         y_pos = q_label.y + q_label.height + 20
         opt_v_margin = 15
 
-        for opt_text, _ in q.shuffled_options:
+        for opt_index in q.shuffled_options:
+            opt_text = q.options[opt_index]
             lbl_width = self.main_view.width - 130
             lbl_height = self._get_wrapped_text_height(opt_text, lbl_width, 'Helvetica', 14)
 
             row_height = max(40, lbl_height)
 
-            sw = ui.Switch()
+            sw = self.view_pool.get(ui.Switch)
             sw.frame = (30, y_pos + (row_height / 2) - (sw.height / 2), 60, 40)
-            sw.tint_color = self.get_theme_color('switch_tint')
+            self.theme_view(sw, tint_color='switch_tint')
+            sw.action = self.answer_changed
             self.main_view.add_subview(sw)
 
-            lbl = ui.Label(text=opt_text, number_of_lines=0, font=('Helvetica', 14))
-            lbl.text_color = self.get_theme_color('text')
+            lbl = self.view_pool.get(ui.Label, text=opt_text, number_of_lines=0, font=('Helvetica', 14))
+            self.theme_view(lbl, text_color='text')
             lbl.frame = (100, y_pos + (row_height / 2) - (lbl_height / 2), lbl_width, lbl_height)
             lbl.flex = 'W'
             self.main_view.add_subview(lbl)
@@ -464,9 +1021,9 @@ class QuizApp:
             self.vars.append(sw)
             y_pos += row_height + opt_v_margin
 
-        next_btn = ui.Button(title='Next', font=('Helvetica', 18))
-        next_btn.background_color = self.get_theme_color('button_bg')
-        next_btn.tint_color = self.get_theme_color('button_text')
+        next_btn = self.view_pool.get(ui.Button, title='Next', font=('Helvetica', 18))
+        self.theme_view(next_btn, background_color='button_bg')
+        self.theme_view(next_btn, tint_color='button_text')
         next_btn.corner_radius = 8
         next_btn.frame = (80, y_pos, self.main_view.width - 160, 50)
         next_btn.flex = 'W'
@@ -475,66 +1032,75 @@ class QuizApp:
 
         self._add_copyright_label()
 
-    def next_question(self, sender):
+    def record_answer(self, index, user_res):
         """
-        RESTORED: This method handles scoring for both CS and CM questions.
+        Stores the answer to quiz item index and moves the running score by the change in its points.
+
+        Answering an item again replaces its old answer instead of adding a second one.
         """
-        q = self.quiz_questions[self.current_question_index]
-        user_res = [var.value for var in self.vars]
-        correct_res = [is_c for _, is_c in q.shuffled_options]
-        self.user_answers.append((q, user_res))
-        q_score = 0
-        if q.type == 'CS':
-            if sum(user_res) == 1 and user_res == correct_res: q_score = 5
-        elif q.type == 'CM':
-            selected_count = sum(user_res)
-            num_correct_opts = sum(1 for _, is_c in q.shuffled_options if is_c)
-            if 2 <= selected_count <= 4:
-                q_score = 5
-                for u, c in zip(user_res, correct_res):
-                    if u != c: q_score -= 1
-                q_score = max(0, q_score)
-        self.score += q_score
-        self.scores_breakdown.append(q_score)
+        q = self.quiz_questions[index]
+        q_score = score_answer(q, user_res)
+        if index < len(self.user_answers):
+            self.score += q_score - self.scores_breakdown[index]
+            self.user_answers[index] = (q, user_res)
+            self.scores_breakdown[index] = q_score
+        else:
+            self.score += q_score
+            self.user_answers.append((q, user_res))
+            self.scores_breakdown.append(q_score)
+
+    def answer_changed(self, sender):
+        # Keeps the running score current while the user flips switches
+        self.record_answer(self.current_question_index, [var.value for var in self.vars])
+
+    def next_question(self, sender):
+        self.record_answer(self.current_question_index, [var.value for var in self.vars])
         self.current_question_index += 1
         if self.current_question_index >= len(self.quiz_questions):
-            self.show_score()
+            self.finish_quiz()
         else:
             self.show_question()
 
+    def finish_quiz(self):
+        """Grades and saves the attempt the first time it is finished, then shows the score."""
+        if self.quiz_result is None:
+            duration = int(time.time() - self.start_time)
+            total_possible = len(self.quiz_questions) * 5 if self.quiz_questions else 0
+            grade = self.calculate_grade(self.score, total_possible)
+            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.quiz_result = (total_possible, grade, duration, timestamp)
+            self.save_results(self.score, total_possible, grade, duration,
+                              self.quiz_file_name, len(self.quiz_questions), timestamp)
+        self.show_score()
+
     def show_score(self):
+        """Draws the saved result; the review screen's Results button comes back here without saving again."""
         self.main_view.background_color = self.get_theme_color('bg')
         self.clear_view()
-        duration = int(time.time() - self.start_time)
-        total_possible = len(self.quiz_questions) * 5 if self.quiz_questions else 0
-        grade = self.calculate_grade(self.score, total_possible)
+        total_possible, grade, duration, timestamp = self.quiz_result
         time_str = self.format_time(duration)
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Save results before displaying the score
-        self.save_results(self.score, total_possible, grade, duration,
-                          self.quiz_file_name, len(self.quiz_questions), timestamp)
 
         summary = (f'Quiz Completed!\nScore: {self.score}/{total_possible}\nGrade: {grade}\n'
                    f'Time: {time_str}\nDate: {timestamp.split(" ")[0]}\nFile: {self.quiz_file_name}')
-        score_lbl = ui.Label(text=summary, number_of_lines=0, alignment=ui.ALIGN_CENTER, font=('Helvetica', 20))
-        score_lbl.text_color = self.get_theme_color('text')
+        score_lbl = self.view_pool.get(ui.Label, text=summary, number_of_lines=0, alignment=ui.ALIGN_CENTER,
+                                       font=('Helvetica', 20))
+        self.theme_view(score_lbl, text_color='text')
         score_lbl.frame = (20, 150, self.main_view.width - 40, 200) # Increased height to fit new info
         score_lbl.flex = 'W'
         self.main_view.add_subview(score_lbl)
 
-        review_btn = ui.Button(title='Review Answers', font=('Helvetica', 18))
-        review_btn.background_color = self.get_theme_color('button_bg')
-        review_btn.tint_color = self.get_theme_color('button_text')
+        review_btn = self.view_pool.get(ui.Button, title='Review Answers', font=('Helvetica', 18))
+        self.theme_view(review_btn, background_color='button_bg')
+        self.theme_view(review_btn, tint_color='button_text')
         review_btn.corner_radius = 8
         review_btn.frame = (80, 380, self.main_view.width - 160, 50) # Adjusted y-position
         review_btn.flex = 'W'
         review_btn.action = self.review_answers
         self.main_view.add_subview(review_btn)
 
-        home_btn = ui.Button(title='Main Menu', font=('Helvetica', 18))
-        home_btn.background_color = self.get_theme_color('button_bg')
-        home_btn.tint_color = self.get_theme_color('button_text')
+        home_btn = self.view_pool.get(ui.Button, title='Main Menu', font=('Helvetica', 18))
+        self.theme_view(home_btn, background_color='button_bg')
+        self.theme_view(home_btn, tint_color='button_text')
         home_btn.corner_radius = 8
         home_btn.frame = (80, 450, self.main_view.width - 160, 50) # Adjusted y-position
         home_btn.flex = 'W'
@@ -561,8 +1127,11 @@ class QuizApp:
 
         prog_text = (f"Review {self.review_index + 1}/{len(self.user_answers)} "
                      f"(Original #{q.q_number} | Score: {q_score}/5)")
-        prog_lbl = ui.Label(text=prog_text, alignment=ui.ALIGN_CENTER, font=('Helvetica', 14))
-        prog_lbl.text_color = self.get_theme_color('progress_text')
+        if self.results_store:
+            seen, missed = self.results_store.question_history(self.quiz_file_name, q.q_number)
+            prog_text += f" | Missed {missed} of {seen}"
+        prog_lbl = self.view_pool.get(ui.Label, text=prog_text, alignment=ui.ALIGN_CENTER, font=('Helvetica', 14))
+        self.theme_view(prog_lbl, text_color='progress_text')
         prog_lbl.frame = (0, 20, self.main_view.width, 30)
         prog_lbl.flex = 'W'
         self.main_view.add_subview(prog_lbl)
@@ -571,8 +1140,8 @@ class QuizApp:
         q_text_with_type = f"{q.type}: {q.text}"
         q_label_height = self._get_wrapped_text_height(q_text_with_type, q_label_width, 'Helvetica', 16)
 
-        q_lbl = ui.Label(text=q_text_with_type, number_of_lines=0, font=('Helvetica', 16))
-        q_lbl.text_color = self.get_theme_color('text')
+        q_lbl = self.view_pool.get(ui.Label, text=q_text_with_type, number_of_lines=0, font=('Helvetica', 16))
+        self.theme_view(q_lbl, text_color='text')
         q_lbl.frame = (20, 60, q_label_width, q_label_height)
         q_lbl.flex = 'W'
         self.main_view.add_subview(q_lbl)
@@ -580,7 +1149,9 @@ class QuizApp:
         y_pos = q_lbl.y + q_lbl.height + 20
         opt_v_margin = 15
 
-        for (opt_txt, is_c), sel in zip(q.shuffled_options, user_res):
+        for opt_index, sel in zip(q.shuffled_options, user_res):
+            opt_txt = q.options[opt_index]
+            is_c = q.is_correct(opt_index)
             color_key = ''
             if is_c and sel:
                 color_key = 'correct_text'
@@ -594,8 +1165,8 @@ class QuizApp:
             lbl_width = self.main_view.width - 60
             lbl_height = self._get_wrapped_text_height(opt_txt, lbl_width, 'Helvetica', 14)
 
-            lbl = ui.Label(text=opt_txt, number_of_lines=0, font=('Helvetica', 14))
-            lbl.text_color = self.get_theme_color(color_key)
+            lbl = self.view_pool.get(ui.Label, text=opt_txt, number_of_lines=0, font=('Helvetica', 14))
+            self.theme_view(lbl, text_color=color_key)
             lbl.frame = (30, y_pos, lbl_width, lbl_height)
             lbl.flex = 'W'
             self.main_view.add_subview(lbl)
@@ -606,9 +1177,9 @@ class QuizApp:
         btn_w, btn_h = 100, 50
 
         # Previous Button
-        btn_prev = ui.Button(title='Prev', font=('Helvetica', 16))
-        btn_prev.background_color = self.get_theme_color('button_bg')
-        btn_prev.tint_color = self.get_theme_color('button_text')
+        btn_prev = self.view_pool.get(ui.Button, title='Prev', font=('Helvetica', 16))
+        self.theme_view(btn_prev, background_color='button_bg')
+        self.theme_view(btn_prev, tint_color='button_text')
         btn_prev.corner_radius = 8
         btn_prev.frame = (30, btn_y, btn_w, btn_h)
         btn_prev.action = lambda s: self.change_review(-1)
@@ -616,9 +1187,9 @@ class QuizApp:
         self.main_view.add_subview(btn_prev)
 
         # Home Button
-        btn_home = ui.Button(title='Home', font=('Helvetica', 16))
-        btn_home.background_color = self.get_theme_color('button_bg')
-        btn_home.tint_color = self.get_theme_color('button_text')
+        btn_home = self.view_pool.get(ui.Button, title='Home', font=('Helvetica', 16))
+        self.theme_view(btn_home, background_color='button_bg')
+        self.theme_view(btn_home, tint_color='button_text')
         btn_home.corner_radius = 8
         btn_home.frame = (self.main_view.width / 2 - btn_w / 2, btn_y, btn_w, btn_h)
         btn_home.flex = 'LR'
@@ -626,9 +1197,9 @@ class QuizApp:
         self.main_view.add_subview(btn_home)
 
         # Right-side button: "Next" or "Results"
-        right_button = ui.Button(font=('Helvetica', 16))
-        right_button.background_color = self.get_theme_color('button_bg')
-        right_button.tint_color = self.get_theme_color('button_text')
+        right_button = self.view_pool.get(ui.Button, font=('Helvetica', 16))
+        self.theme_view(right_button, background_color='button_bg')
+        self.theme_view(right_button, tint_color='button_text')
         right_button.corner_radius = 8
         right_button.frame = (self.main_view.width - btn_w - 30, btn_y, btn_w, btn_h)
         right_button.flex = 'L'
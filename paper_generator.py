@@ -0,0 +1,236 @@
+"""
+Headless batch generator for printed quiz papers.
+
+Draws K independent variants of N questions from a question bank in one vectorized pass, using the
+same item rules as the iOS quiz: every item shows 5 options, a CS item has exactly 1 correct option
+and a CM item has 2 to 4. Questions that can't make either item type are never drawn. Nothing is
+written back to the Question objects, so the bank can be shared with a running quiz.
+
+    python paper_generator.py bank.txt --variants 200 --questions 60 --seed 7 --out papers
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from bank_cache import DEFAULT_CACHE_MAX_BYTES, BankCache
+from question_bank import parse_bank, question_from_record
+
+OPTIONS_PER_ITEM = 5
+MAX_OPTIONS = 10  # Option letters a-j
+CHUNK_ELEMENTS = 4 * 1024 * 1024  # Random draws per chunk, bounds memory for large K
+SPARSE_PICK_RATIO = 8  # Banks this many times bigger than a paper are sampled by redrawing repeats
+ITEM_LETTERS = "ABCDE"
+
+
+class QuizPapers:
+    """
+    K generated variants, stored as arrays:
+
+    questions[k, n]      index into the bank of the n-th question on paper k
+    is_cm[k, n]          True for CM items, False for CS
+    options[k, n, j]     index into question.options of the option printed as letter j
+    answer_masks[k, n]   bit j is set when the option printed as letter j is correct
+    """
+
+    def __init__(self, bank, questions, is_cm, options, answer_masks, seed=None):
+        self.bank = bank
+        self.questions = questions
+        self.is_cm = is_cm
+        self.options = options
+        self.answer_masks = answer_masks
+        self.seed = seed
+
+    def __len__(self):
+        return len(self.questions)
+
+    def paper_lines(self, k):
+        """Printable text of variant k."""
+        lines = [f"Variant {k + 1}", ""]
+        for n, (bank_index, is_cm) in enumerate(zip(self.questions[k], self.is_cm[k])):
+            q = self.bank[bank_index]
+            question_text = q.text.split('.', 1)[1].strip()  # Drop the bank's own number
+            lines.append(f"{n + 1}. [{'CM' if is_cm else 'CS'}] {question_text}")
+            for letter, opt_index in zip(ITEM_LETTERS, self.options[k, n]):
+                opt_text = q.options[opt_index].split('.', 1)[1].strip()  # Drop the bank's own letter
+                lines.append(f"   {letter}. {opt_text}")
+            lines.append("")
+        return lines
+
+    def answer_letters(self, k, n):
+        mask = int(self.answer_masks[k, n])
+        return ''.join(letter for j, letter in enumerate(ITEM_LETTERS) if (mask >> j) & 1)
+
+    def write(self, out_dir):
+        """Writes one text file per variant plus answer_key.csv into out_dir."""
+        os.makedirs(out_dir, exist_ok=True)
+        width = len(str(len(self)))
+        for k in range(len(self)):
+            with open(os.path.join(out_dir, f"paper_{k + 1:0{width}d}.txt"), 'w', encoding='utf-8') as f:
+                f.write('\n'.join(self.paper_lines(k)))
+
+        with open(os.path.join(out_dir, "answer_key.csv"), 'w', encoding='utf-8') as f:
+            f.write("variant,question,type,answer\n")
+            for k in range(len(self)):
+                for n in range(self.questions.shape[1]):
+                    item_type = 'CM' if self.is_cm[k, n] else 'CS'
+                    f.write(f"{k + 1},{n + 1},{item_type},{self.answer_letters(k, n)}\n")
+
+
+class PaperGenerator:
+    """Precomputes per-question option arrays for a bank once, then generates batches from them."""
+
+    def __init__(self, bank):
+        self.bank = bank
+        count = len(bank)
+        num_options = np.fromiter((len(q.options) for q in bank), dtype=np.int16, count=count)
+        masks = np.fromiter((q.correct_mask for q in bank), dtype=np.int32, count=count)
+        slots = np.arange(MAX_OPTIONS, dtype=np.int16)
+
+        self.valid = slots < num_options[:, None]
+        self.correct = ((masks[:, None] >> slots) & 1).astype(bool) & self.valid
+        self.num_correct = self.correct.sum(axis=1).astype(np.int16)
+        num_incorrect = num_options - self.num_correct
+
+        # CM range of correct options: enough incorrect ones to fill the item, at most 4 correct
+        self.cm_low = np.maximum(2, OPTIONS_PER_ITEM - num_incorrect)
+        self.cm_high = np.minimum(4, self.num_correct)
+        cs_ok = (self.num_correct >= 1) & (num_incorrect >= OPTIONS_PER_ITEM - 1)
+        cm_ok = self.cm_low <= self.cm_high
+
+        self.quiz_ready = np.flatnonzero(cs_ok | cm_ok).astype(np.int32)
+        self.cs_ok = cs_ok
+        self.cm_ok = cm_ok
+
+    def generate(self, num_variants, num_questions, seed=None):
+        """Returns a QuizPapers with num_variants independent draws of num_questions items each."""
+        if num_variants <= 0 or num_questions <= 0:
+            raise ValueError("Number of variants and questions must be positive integers.")
+        if num_questions > len(self.quiz_ready):
+            raise ValueError(f"Only {len(self.quiz_ready)} questions can make a valid quiz item, "
+                             f"{num_questions} requested.")
+
+        rng = np.random.default_rng(seed)
+        questions = np.empty((num_variants, num_questions), dtype=np.int32)
+        is_cm = np.empty((num_variants, num_questions), dtype=bool)
+        options = np.empty((num_variants, num_questions, OPTIONS_PER_ITEM), dtype=np.uint8)
+        answer_masks = np.empty((num_variants, num_questions), dtype=np.uint8)
+
+        row_cost = num_questions * MAX_OPTIONS
+        if len(self.quiz_ready) < SPARSE_PICK_RATIO * num_questions:
+            row_cost = max(row_cost, len(self.quiz_ready))
+        chunk_rows = max(1, CHUNK_ELEMENTS // row_cost)
+        for start in range(0, num_variants, chunk_rows):
+            rows = slice(start, min(start + chunk_rows, num_variants))
+            chunk = self._generate_chunk(rng, rows.stop - rows.start, num_questions)
+            questions[rows], is_cm[rows], options[rows], answer_masks[rows] = chunk
+
+        return QuizPapers(self.bank, questions, is_cm, options, answer_masks, seed)
+
+    def _pick_questions(self, rng, rows, num_questions):
+        """Positions in quiz_ready of num_questions distinct questions per row, in random order."""
+        num_ready = len(self.quiz_ready)
+        if num_ready < SPARSE_PICK_RATIO * num_questions:
+            # The num_questions smallest of one random key per ready question, in key order
+            keys = rng.random((rows, num_ready), dtype=np.float32)
+            picked = np.argpartition(keys, num_questions - 1, axis=1)[:, :num_questions]
+            return np.take_along_axis(picked, np.argsort(np.take_along_axis(keys, picked, 1), axis=1), 1)
+
+        # Big bank, short paper: draw with replacement, then redraw every repeat of an earlier pick until
+        # none are left. Only rows that still have repeats are checked again.
+        picked = rng.integers(0, num_ready, (rows, num_questions), dtype=np.int32)
+        pending = np.arange(rows)
+        while len(pending):
+            sub = picked[pending]
+            order = np.argsort(sub, axis=1, kind='stable')
+            ordered = np.take_along_axis(sub, order, 1)
+            repeat_sorted = np.zeros(sub.shape, dtype=bool)
+            repeat_sorted[:, 1:] = ordered[:, 1:] == ordered[:, :-1]
+            repeats = np.empty_like(repeat_sorted)
+            np.put_along_axis(repeats, order, repeat_sorted, 1)
+            has_repeats = repeats.any(axis=1)
+            pending, sub, repeats = pending[has_repeats], sub[has_repeats], repeats[has_repeats]
+            sub[repeats] = rng.integers(0, num_ready, int(repeats.sum()), dtype=np.int32)
+            picked[pending] = sub
+        return picked
+
+    def _generate_chunk(self, rng, rows, num_questions):
+        q = self.quiz_ready[self._pick_questions(rng, rows, num_questions)]
+
+        # Item type: a coin flip where both are possible, otherwise the one that is
+        cs_ok, cm_ok = self.cs_ok[q], self.cm_ok[q]
+        is_cm = cm_ok & (~cs_ok | (rng.random(q.shape) < 0.5))
+
+        low, high = self.cm_low[q], self.cm_high[q]
+        cm_correct = low + (rng.random(q.shape) * (high - low + 1)).astype(np.int16)
+        n_correct = np.where(is_cm, cm_correct, 1)
+
+        # Random order of each question's options: correct ones first, then incorrect, then unused slots
+        option_keys = rng.random((rows, num_questions, MAX_OPTIONS), dtype=np.float32)
+        option_keys += ~self.correct[q]
+        option_keys += 2 * ~self.valid[q]
+        order = np.argsort(option_keys, axis=2)
+
+        # First n_correct of the correct run, then the first 5 - n_correct of the incorrect run
+        slots = np.arange(OPTIONS_PER_ITEM)
+        n_correct = n_correct[..., None]
+        source = np.where(slots < n_correct, slots, self.num_correct[q][..., None] + slots - n_correct)
+        chosen = np.take_along_axis(order, source, 2)
+        chosen = np.take_along_axis(chosen, np.argsort(rng.random(chosen.shape, dtype=np.float32), axis=2), 2)
+
+        correct = np.take_along_axis(self.correct[q], chosen, 2)
+        answer_masks = (correct << slots).sum(axis=2)
+        return q, is_cm, chosen, answer_masks
+
+
+def load_bank(file_paths, cache_dir=None, cache_max_bytes=DEFAULT_CACHE_MAX_BYTES):
+    """Reads and concatenates bank files. With cache_dir, bank snapshots are reused from and saved there."""
+    cache = BankCache(cache_dir, cache_max_bytes) if cache_dir else None
+    bank = []
+    for file_path in file_paths:
+        snapshot = cache.load(file_path) if cache else None
+        if snapshot is None:
+            source_stat = os.stat(file_path)
+            snapshot = parse_bank(file_path)
+            if cache:
+                cache.store(file_path, snapshot, source_stat)
+        records = snapshot[0]
+        bank.extend(question_from_record(record, file_path) for record in records)
+    return bank
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate printable quiz paper variants from question banks.")
+    parser.add_argument("banks", nargs='+', help="Question bank .txt files")
+    parser.add_argument("-k", "--variants", type=int, default=100, help="Number of paper variants")
+    parser.add_argument("-n", "--questions", type=int, default=60, help="Questions per paper")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for a reproducible batch")
+    parser.add_argument("--out", help="Folder for the paper .txt files and answer_key.csv")
+    parser.add_argument("--cache-dir", help="Bank cache folder to reuse, e.g. the desktop app's bank_cache")
+    args = parser.parse_args(argv)
+
+    try:
+        bank = load_bank(args.banks, args.cache_dir)
+    except OSError as e:
+        parser.error(f"Could not read question bank: {e}")
+
+    start = time.perf_counter()
+    generator = PaperGenerator(bank)
+    try:
+        papers = generator.generate(args.variants, args.questions, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+    print(f"Generated {len(papers)} variants of {args.questions} questions from {len(generator.quiz_ready)} "
+          f"usable questions in {elapsed:.2f} s")
+
+    if args.out:
+        papers.write(args.out)
+        print(f"Wrote papers and answer key to {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import os
+import queue
+import threading
+
+
+def write_file_atomic(file_path, data):
+    """Writes data (str or bytes) to a temp file next to file_path, then renames it into place."""
+    temp_path = file_path + ".tmp"
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    with open(temp_path, mode) as f:
+        f.write(data)
+    os.replace(temp_path, file_path)
+
+
+class PersistenceWriter:
+    """
+    Background thread for the app's file writes, so the UI thread never waits on the disk.
+
+    write_file() calls for the same path that are still queued collapse into one write of the latest
+    data. submit() runs any other job (appends, database inserts) on the same thread, in order.
+    Call close() before exiting so nothing queued is lost.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._pending_files = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="PersistenceWriter", daemon=True)
+        self._thread.start()
+
+    def write_file(self, file_path, data):
+        with self._lock:
+            already_queued = file_path in self._pending_files
+            self._pending_files[file_path] = data
+        if not already_queued:
+            self._queue.put((self._write_pending_file, (file_path,)))
+
+    def submit(self, job, *args):
+        self._queue.put((job, args))
+
+    def flush(self):
+        """Blocks until everything queued so far has been written."""
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _write_pending_file(self, file_path):
+        with self._lock:
+            data = self._pending_files.pop(file_path)
+        write_file_atomic(file_path, data)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                job, args = item
+                job(*args)
+            except Exception as e:
+                print(f"Error: Background write failed: {e}")
+            finally:
+                self._queue.task_done()
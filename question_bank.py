@@ -0,0 +1,406 @@
+"""
+Question banks: the Question type, the bank file parser and the loaded-bank containers.
+
+Nothing here needs a UI, so headless tools can read banks the same way the desktop app does.
+"""
+import hashlib
+import mmap
+import os
+import re
+from array import array
+from collections.abc import Sequence
+
+
+OPTION_INDEX_TYPECODE = 'H'  # array typecode for option indices in Question.shuffled_options
+
+
+class Question:
+    __slots__ = ('text', 'options', 'correct_mask', 'option_partition', 'num_correct', 'shuffled_options', 'type',
+                 'source_file')
+
+    def __init__(self, text, options, correct_mask, source_file=None):
+        self.text = text
+        self.options = options  # Tuple of full option texts
+        self.correct_mask = correct_mask  # Bit i is set when options[i] is correct
+        # Indices of the correct options followed by the incorrect ones, split once at load time
+        correct = [i for i in range(len(options)) if (correct_mask >> i) & 1]
+        incorrect = [i for i in range(len(options)) if not (correct_mask >> i) & 1]
+        self.option_partition = array(OPTION_INDEX_TYPECODE, correct + incorrect)
+        self.num_correct = len(correct)
+        self.shuffled_options = ()  # array of indices into options - subset shown in quiz
+        self.type = None
+        self.source_file = source_file  # Path of the bank file the question was parsed from
+
+    def is_correct(self, option_index):
+        return (self.correct_mask >> option_index) & 1 == 1
+
+    @property
+    def correct_options(self):
+        return self.option_partition[:self.num_correct]
+
+    @property
+    def incorrect_options(self):
+        return self.option_partition[self.num_correct:]
+
+
+QUESTION_HEADER_RE = re.compile(r'(\d+)\.\s*')
+OPTION_LINE_RE = re.compile(r'^([a-j])\.\s+\[(y|x)]\s+(.*)')
+
+
+def _iter_question_blocks(lines):
+    r"""
+    Groups the lines of a question bank into (number, block_content) pairs.
+
+    Gives the same blocks as running r'(?s)(?m)^(\d+)\.\s*(.*?)(?=\n\d+\.\s*|\Z)' over the whole
+    stripped file, but only ever holds one block in memory. A header with nothing after the number
+    takes the next non-blank line as its text, even if that line looks like a header itself.
+    """
+    num_str = None
+    block_lines = []
+    at_file_start = True
+    waiting_for_text = False
+
+    for line in lines:
+        line = line.rstrip('\n')
+        if at_file_start:
+            if not line.strip():
+                continue
+            line = line.lstrip()
+            at_file_start = False
+
+        if waiting_for_text:
+            if line.strip():
+                block_lines.append(line.lstrip())
+                waiting_for_text = False
+            continue
+
+        match = QUESTION_HEADER_RE.match(line)
+        if match:
+            if num_str is not None:
+                yield num_str, '\n'.join(block_lines)
+            num_str = match.group(1)
+            block_lines = [line[match.end():]]
+            waiting_for_text = not block_lines[0]
+        elif num_str is not None:
+            block_lines.append(line)
+
+    if num_str is not None:
+        yield num_str, '\n'.join(block_lines)
+
+
+def _build_question(num_str, block_content):
+    lines = block_content.strip().split('\n')
+    if not lines:
+        print(f"Warning: Block starting with {num_str}. has no content.")
+        return None
+
+    question_text = lines[0].strip()
+    options = []
+    correct_mask = 0
+    for line in lines[1:]:
+        match = OPTION_LINE_RE.match(line.strip())
+        if match:
+            letter, correctness, text = match.groups()
+            if correctness == 'y':
+                correct_mask |= 1 << len(options)
+            options.append(f"{letter}. {text.strip()}")
+    if options:
+        full_question_text = f"{num_str}. {question_text}"
+        return Question(full_question_text, tuple(options), correct_mask)
+    elif question_text:
+        print(f"Warning: Question '{num_str}. {question_text}' has no valid options and will be skipped.")
+    return None
+
+
+def _block_has_options(num_str, block_content):
+    """Whether _build_question would make a question of the block, without building one."""
+    lines = block_content.strip().split('\n')
+    if any(OPTION_LINE_RE.match(line.strip()) for line in lines[1:]):
+        return True
+    question_text = lines[0].strip()
+    if question_text:
+        print(f"Warning: Question '{num_str}. {question_text}' has no valid options and will be skipped.")
+    return False
+
+
+def block_digest(num_str, block_content):
+    """64-bit hash of a question block. Unlike hash(), it is the same in every process, so it can be cached."""
+    data = f"{num_str}.{block_content}".encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little', signed=True)
+
+
+def _count_chars(lines, chars_read):
+    for line in lines:
+        chars_read[0] += len(line)
+        yield line
+
+
+def iter_questions_from_file(file_path, chars_read=None):
+    """
+    Yields Question objects one at a time while reading file_path line by line.
+
+    chars_read, if given, is a list whose first element is kept at the number of characters read so far.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = f if chars_read is None else _count_chars(f, chars_read)
+        for num_str, block_content in _iter_question_blocks(lines):
+            question = _build_question(num_str, block_content)
+            if question:
+                question.source_file = file_path
+                yield question
+
+
+def iter_bank_blocks(file_path, chars_read=None):
+    """
+    Yields (block digest, Question or None) for every block of file_path, reading it line by line.
+
+    None stands for a block that makes no question. chars_read works as for iter_questions_from_file.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = f if chars_read is None else _count_chars(f, chars_read)
+        for num_str, block_content in _iter_question_blocks(lines):
+            question = _build_question(num_str, block_content)
+            if question:
+                question.source_file = file_path
+            yield block_digest(num_str, block_content), question
+
+
+class BankChangedError(Exception):
+    """A memory-mapped bank's file was edited after its index was built, so it has to be loaded again."""
+
+
+class MappedQuestionBank(Sequence):
+    """
+    Read-only question bank backed by a memory-mapped file.
+
+    Only the byte range of each valid question block is kept in memory. A Question is built from
+    its block when it is indexed, so random.sample() in start_quiz only materializes the questions
+    it picks. Every lookup returns a new Question object.
+
+    The offsets only hold for the file as it was indexed. changed() tells when the file has been
+    edited or replaced since, and a lookup after an in-place edit raises BankChangedError.
+
+    progress, if given, is a [bytes indexed, questions found] list kept current while the index is built.
+    cancelled, if given, is called for every block and stops indexing early once it returns True.
+    index, the offsets() of an earlier bank of the same file, skips building the index when index_stat,
+    the os.stat() the index was checked against, still matches the file that was opened.
+    """
+
+    def __init__(self, file_path, progress=None, index=None, index_stat=None, cancelled=None):
+        self.file_path = file_path
+        self._starts = array('q')
+        self._ends = array('q')
+        self._file = open(file_path, 'rb')
+        self._map = None
+        stat = os.fstat(self._file.fileno())
+        self.stamp = (stat.st_size, stat.st_mtime_ns)  # Of the file the index is built from
+        if stat.st_size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            progress = progress if progress is not None else [0, 0]
+            if not (index and index_stat and self._reuse_index(index, index_stat)):
+                self._build_index(progress, cancelled)
+            progress[:] = [stat.st_size, len(self._starts)]
+
+    def _reuse_index(self, index, index_stat):
+        if (index_stat.st_size, index_stat.st_mtime_ns) != self.stamp:
+            return False  # The file changed after the index was checked
+        try:
+            self._starts.frombytes(index[0])
+            self._ends.frombytes(index[1])
+        except (TypeError, ValueError, IndexError):
+            pass
+        else:
+            if len(self._starts) == len(self._ends):
+                return True
+        self._starts = array('q')
+        self._ends = array('q')
+        return False
+
+    def _iter_lines(self, line_start):
+        """Yields the decoded lines of the map, storing each line's byte offset in line_start[0]."""
+        size = len(self._map)
+        pos = 0
+        while pos < size:
+            end = self._map.find(b'\n', pos)
+            end = size if end < 0 else end + 1
+            line_start[0] = pos
+            yield self._map[pos:end].decode('utf-8').replace('\r\n', '\n')
+            pos = end
+        line_start[0] = size
+
+    def _build_index(self, progress, cancelled=None):
+        # A block is yielded once the next header line has been read, so it ends where that line
+        # starts. Blocks are stored as [previous block end, own end) so that re-parsing the range
+        # alone gives back the same block, including any preamble before the first question.
+        line_start = progress  # Its first element is the byte offset _iter_lines is at
+        block_start = 0
+        for num_str, block_content in _iter_question_blocks(self._iter_lines(line_start)):
+            if cancelled and cancelled():
+                return
+            block_end = line_start[0]
+            if _block_has_options(num_str, block_content):
+                self._starts.append(block_start)
+                self._ends.append(block_end)
+                progress[1] = len(self._starts)
+            block_start = block_end
+
+    def offsets(self):
+        """The index as (block starts, block ends) bytes, to be handed back as index to a later bank of the file."""
+        return self._starts.tobytes(), self._ends.tobytes()
+
+    def changed(self):
+        """True once the file at file_path is no longer the one the index was built from."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return True
+        return (stat.st_size, stat.st_mtime_ns) != self.stamp
+
+    def _materialize(self, index):
+        # An edit in place moves the blocks, and reading the map past the end of a truncated file
+        # crashes the process, so the open file is checked before every read
+        stat = os.fstat(self._file.fileno())
+        if (stat.st_size, stat.st_mtime_ns) != self.stamp:
+            raise BankChangedError(f"{os.path.basename(self.file_path)} changed on disk since it was loaded")
+        block_text = self._map[self._starts[index]:self._ends[index]].decode('utf-8').replace('\r\n', '\n')
+        block = next(_iter_question_blocks(block_text.split('\n')), None)
+        question = _build_question(*block) if block else None
+        if question is None:
+            raise BankChangedError(f"{os.path.basename(self.file_path)} no longer has a question at block {index}")
+        question.source_file = self.file_path
+        return question
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("question index out of range")
+        return self._materialize(index)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class _WatchedBankFile:
+    __slots__ = ('file_path', 'stat', 'digests', 'invalid_digests', 'count')
+
+    def __init__(self, file_path, stat, digests, invalid_digests):
+        self.file_path = file_path
+        self.stat = stat  # os.stat() of the file as it was when the digests were computed
+        self.digests = array('q', digests)  # block_digest of each block that produced a question, in bank order
+        self.invalid_digests = set(invalid_digests)  # Digests of blocks that produced no question
+        self.count = len(self.digests)  # Number of questions this file contributes to the bank
+
+
+class BankWatcher:
+    """
+    Polls bank files for edits and patches a loaded question list block by block.
+
+    Every block of a watched file is hashed. When a file changes, only blocks with a new hash are
+    parsed again. Questions from unchanged blocks are reused as the same objects, and only the
+    file's own slice of the list is replaced.
+
+    bank_files holds one (file_path, stat, block digests, invalid block digests) entry per file, as
+    produced while the bank was read (see parse_bank). questions must hold the files' questions
+    contiguously and in bank_files order.
+    """
+
+    def __init__(self, questions, bank_files):
+        self.questions = questions
+        self.files = [_WatchedBankFile(*bank_file) for bank_file in bank_files]
+
+    def poll(self):
+        """Patches questions for every file edited since the last poll and returns those files' paths."""
+        reloaded = []
+        start = 0
+        for watched in self.files:
+            try:
+                stat = os.stat(watched.file_path)
+                if (stat.st_size, stat.st_mtime_ns) != (watched.stat.st_size, watched.stat.st_mtime_ns):
+                    end = start + watched.count
+                    self.questions[start:end] = self._reload(watched, start, stat)
+                    reloaded.append(watched.file_path)
+            except (OSError, UnicodeDecodeError) as e:
+                # The file may be mid-save or gone for a moment; keep its current questions
+                print(f"Warning: Could not reload '{watched.file_path}': {e}")
+            start += watched.count
+        return reloaded
+
+    def file_snapshot(self, file_path):
+        """(parse_bank result, stat it was read at) of a watched file, for storing in the bank cache."""
+        start = 0
+        for watched in self.files:
+            if watched.file_path == file_path:
+                records = [question_to_record(q) for q in self.questions[start:start + watched.count]]
+                return (records, list(watched.digests), list(watched.invalid_digests)), watched.stat
+            start += watched.count
+        return None, None
+
+    def _reload(self, watched, start, stat):
+        reusable = {}
+        for digest, question in zip(watched.digests, self.questions[start:start + watched.count]):
+            reusable.setdefault(digest, []).append(question)
+        for same_digest_questions in reusable.values():
+            same_digest_questions.reverse()  # pop() hands out repeated blocks in their original order
+
+        new_questions = []
+        new_digests = array('q')
+        new_invalid_digests = set()
+        with open(watched.file_path, 'r', encoding='utf-8') as f:
+            for num_str, block_content in _iter_question_blocks(f):
+                digest = block_digest(num_str, block_content)
+                if reusable.get(digest):
+                    question = reusable[digest].pop()
+                elif digest in watched.invalid_digests:
+                    new_invalid_digests.add(digest)
+                    continue
+                else:
+                    question = _build_question(num_str, block_content)
+                    if question is None:
+                        new_invalid_digests.add(digest)
+                        continue
+                    question.source_file = watched.file_path
+                new_questions.append(question)
+                new_digests.append(digest)
+
+        watched.stat = stat
+        watched.digests = new_digests
+        watched.invalid_digests = new_invalid_digests
+        watched.count = len(new_questions)
+        return new_questions
+
+
+def question_to_record(question):
+    return question.text, question.options, question.correct_mask
+
+
+def question_from_record(record, source_file=None):
+    text, options, correct_mask = record
+    return Question(text, options, correct_mask, source_file)
+
+
+def parse_bank(file_path):
+    """
+    Parses one bank file into (records, block digests, invalid block digests), the form kept in the bank cache.
+
+    The digests are those of the blocks that made each record, in order, and of the blocks that made
+    no question; BankWatcher starts from them. Also the process pool worker for multi-file loads.
+    """
+    records = []
+    digests = []
+    invalid_digests = []
+    for digest, question in iter_bank_blocks(file_path):
+        if question is None:
+            invalid_digests.append(digest)
+        else:
+            records.append(question_to_record(question))
+            digests.append(digest)
+    return records, digests, invalid_digests
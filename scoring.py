@@ -0,0 +1,190 @@
+"""
+Headless bulk scoring for whole cohorts of answer sheets.
+
+Answers and keys are kept as one bitmask per item (bit j = the option printed as letter j), so a
+cohort is scored with a handful of array operations instead of a loop per student and question.
+The rules are the ones calculate_score uses in the apps:
+
+    CS: 5 points when exactly one option is selected and it is correct, otherwise 0
+    CM: 0 unless 2 to 4 options are selected, otherwise 5 minus one per option selected or left
+        out wrongly, never below 0
+
+    python scoring.py papers/answer_key.csv answers.csv --out results
+
+The key is the answer_key.csv written by paper_generator.py (variant,question,type,answer). The
+answers file has one row per student and question: student,variant,question,answer, where answer is
+the selected letters such as "ACD" (empty when nothing was selected).
+"""
+import argparse
+import csv
+import os
+import sys
+
+import numpy as np
+
+from paper_generator import ITEM_LETTERS
+
+MAX_ITEM_SCORE = 5
+CM_MIN_SELECTED = 2
+CM_MAX_SELECTED = 4
+POPCOUNT = np.array([bin(mask).count('1') for mask in range(1 << len(ITEM_LETTERS))], dtype=np.int8)
+
+
+def letters_to_mask(letters):
+    mask = 0
+    for letter in letters.strip().upper():
+        position = ITEM_LETTERS.find(letter)
+        if position < 0:
+            raise ValueError(f"Unknown answer letter '{letter}' in '{letters}'.")
+        mask |= 1 << position
+    return mask
+
+
+def score_items(selected, keys, is_cm):
+    """
+    Scores arrays of answer masks against key masks of the same (or broadcastable) shape.
+
+    Returns an int8 array of per-item scores.
+    """
+    selected = np.asarray(selected, dtype=np.uint8)
+    keys = np.asarray(keys, dtype=np.uint8)
+    num_selected = POPCOUNT[selected]
+
+    cs_scores = np.where((num_selected == 1) & ((selected & keys) != 0), MAX_ITEM_SCORE, 0)
+    cm_allowed = (num_selected >= CM_MIN_SELECTED) & (num_selected <= CM_MAX_SELECTED)
+    cm_scores = np.where(cm_allowed, np.maximum(0, MAX_ITEM_SCORE - POPCOUNT[selected ^ keys]), 0)
+    return np.where(is_cm, cm_scores, cs_scores).astype(np.int8)
+
+
+def calculate_grade(score, total):
+    """Same 1-10 scale as the apps' score screen."""
+    return (score / total) * 9 + 1 if total > 0 else 1.0
+
+
+class AnswerKey:
+    """keys[k, n] and is_cm[k, n] for question n of variant k."""
+
+    def __init__(self, keys, is_cm):
+        self.keys = keys
+        self.is_cm = is_cm
+
+    @classmethod
+    def from_papers(cls, papers):
+        """Uses the answer masks of a paper_generator.QuizPapers batch directly."""
+        return cls(papers.answer_masks, papers.is_cm)
+
+    @classmethod
+    def from_csv(cls, file_path):
+        with open(file_path, newline='', encoding='utf-8') as f:
+            rows = [(int(row['variant']), int(row['question']), row['type'].strip().upper(),
+                     letters_to_mask(row['answer'])) for row in csv.DictReader(f)]
+        if not rows:
+            raise ValueError(f"Answer key '{file_path}' has no rows.")
+
+        variants, questions, types, masks = zip(*rows)
+        keys = np.zeros((max(variants), max(questions)), dtype=np.uint8)
+        is_cm = np.zeros(keys.shape, dtype=bool)
+        k, n = np.array(variants) - 1, np.array(questions) - 1
+        keys[k, n] = masks
+        is_cm[k, n] = np.array(types) == 'CM'
+        return cls(keys, is_cm)
+
+    @property
+    def num_questions(self):
+        return self.keys.shape[1]
+
+
+class AnswerSheets:
+    """selected[s, n] is student s's answer mask for question n of their variant variants[s]."""
+
+    def __init__(self, students, variants, selected):
+        self.students = students
+        self.variants = variants
+        self.selected = selected
+
+    @classmethod
+    def from_csv(cls, file_path, num_questions):
+        student_index = {}
+        student_variants = []
+        rows = []
+        with open(file_path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                student = row['student'].strip()
+                variant = int(row['variant']) - 1
+                if student not in student_index:
+                    student_index[student] = len(student_variants)
+                    student_variants.append(variant)
+                elif student_variants[student_index[student]] != variant:
+                    raise ValueError(f"Student '{student}' has answers for more than one variant.")
+                question = int(row['question']) - 1
+                if not 0 <= question < num_questions:
+                    raise ValueError(f"Question {question + 1} for student '{student}' is not in the answer key.")
+                rows.append((student_index[student], question, letters_to_mask(row['answer'] or '')))
+
+        # Questions without a row count as left blank
+        selected = np.zeros((len(student_variants), num_questions), dtype=np.uint8)
+        if rows:
+            s, n, masks = (np.array(column) for column in zip(*rows))
+            selected[s, n] = masks
+        return cls(list(student_index), np.array(student_variants, dtype=np.int32), selected)
+
+
+def score_cohort(key, sheets):
+    """Returns the (students, questions) score matrix for a whole cohort in one call."""
+    if len(sheets.variants) and (sheets.variants.min() < 0 or sheets.variants.max() >= len(key.keys)):
+        raise ValueError("Some answer sheets use a variant that is not in the answer key.")
+    return score_items(sheets.selected, key.keys[sheets.variants], key.is_cm[sheets.variants])
+
+
+def write_reports(out_dir, key, sheets, scores):
+    """Writes students.csv (one row per student) and questions.csv (one row per variant question)."""
+    os.makedirs(out_dir, exist_ok=True)
+    total_possible = key.num_questions * MAX_ITEM_SCORE
+    totals = scores.sum(axis=1, dtype=np.int32)
+    with open(os.path.join(out_dir, "students.csv"), 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["student", "variant", "score", "total_possible", "grade"])
+        for student, variant, total in zip(sheets.students, sheets.variants, totals):
+            writer.writerow([student, variant + 1, total, total_possible,
+                             f"{calculate_grade(total, total_possible):.2f}"])
+
+    num_variants, num_questions = key.keys.shape
+    flat = sheets.variants[:, None] * num_questions + np.arange(num_questions)
+    size = num_variants * num_questions
+    attempts = np.bincount(flat.ravel(), minlength=size)
+    answered = np.bincount(flat.ravel(), weights=(sheets.selected != 0).ravel(), minlength=size)
+    score_sums = np.bincount(flat.ravel(), weights=scores.ravel(), minlength=size)
+    full_marks = np.bincount(flat.ravel(), weights=(scores == MAX_ITEM_SCORE).ravel(), minlength=size)
+    with open(os.path.join(out_dir, "questions.csv"), 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["variant", "question", "type", "attempts", "answered", "mean_score", "full_marks"])
+        for i in np.flatnonzero(attempts):
+            k, n = divmod(int(i), num_questions)
+            writer.writerow([k + 1, n + 1, 'CM' if key.is_cm[k, n] else 'CS', attempts[i], int(answered[i]),
+                             f"{score_sums[i] / attempts[i]:.2f}", int(full_marks[i])])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a cohort's answer sheets against a paper answer key.")
+    parser.add_argument("key", help="answer_key.csv written by paper_generator.py")
+    parser.add_argument("answers", help="CSV with student,variant,question,answer rows")
+    parser.add_argument("--out", default="results", help="Folder for students.csv and questions.csv")
+    args = parser.parse_args(argv)
+
+    try:
+        key = AnswerKey.from_csv(args.key)
+        sheets = AnswerSheets.from_csv(args.answers, key.num_questions)
+        scores = score_cohort(key, sheets)
+    except (OSError, KeyError, ValueError) as e:
+        parser.error(f"Could not score answers: {e}")
+
+    write_reports(args.out, key, sheets, scores)
+    total_possible = key.num_questions * MAX_ITEM_SCORE
+    mean_score = scores.sum(axis=1).mean() if len(scores) else 0
+    print(f"Scored {len(sheets.students)} students, mean {mean_score:.1f}/{total_possible}. "
+          f"Reports written to {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())